@@ -4,5 +4,6 @@ from dbt.adapters.base.relation import BaseRelation  # noqa
 from dbt.adapters.base.relation import Column  # noqa
 from dbt.adapters.base.connections import BaseConnectionManager  # noqa
 from dbt.adapters.base.connections import Credentials  # noqa
+from dbt.adapters.base.connections import QueryResult  # noqa
 from dbt.adapters.base.impl import BaseAdapter  # noqa
 from dbt.adapters.base.plugin import AdapterPlugin  # noqa
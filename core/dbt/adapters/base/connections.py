@@ -1,9 +1,13 @@
 import abc
+import itertools
 import multiprocessing
 import os
+import threading
+import time
 
 import six
 
+import dbt.clients.agate_helper
 import dbt.exceptions
 import dbt.flags
 from dbt.api import APIObject
@@ -13,6 +17,218 @@ from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.utils import translate_aliases
 
 
+class QueryResult(object):
+    """The rows of a query result, fetched from the database in batches as
+    they're iterated over, so they never all have to be held in memory.
+
+    :attr List[str] column_names: The names of the columns.
+    :attr List[Optional[agate.data_types.DataType]] column_types: The agate
+        type of each column where the database reported a type that maps to
+        one, or None where the type has to be inferred from the values.
+    :attr Optional[int] limit: The maximum number of rows to return.
+    :attr bool truncated: Set once iteration stops at the limit with rows
+        left over.
+    """
+    BATCH_SIZE = 1000
+
+    def __init__(self, column_names, column_types, fetch, limit=None):
+        """fetch is a function that takes a number of rows and returns a
+        sequence of at most that many more rows, which is empty once all the
+        rows have been fetched.
+        """
+        self.column_names = column_names
+        self.column_types = column_types
+        self.limit = limit
+        self.truncated = False
+        self._fetch = fetch
+
+    @classmethod
+    def empty(cls):
+        return cls([], [], lambda size: [])
+
+    @classmethod
+    def from_iterator(cls, column_names, column_types, rows, limit=None):
+        rows = iter(rows)
+        return cls(column_names, column_types,
+                   lambda size: list(itertools.islice(rows, size)), limit)
+
+    def __iter__(self):
+        count = 0
+        while True:
+            size = self.BATCH_SIZE
+            if self.limit is not None:
+                # ask for one extra row to tell if there are more
+                size = min(size, self.limit - count + 1)
+
+            fetched = 0
+            for row in self._fetch(size):
+                if self.limit is not None and count >= self.limit:
+                    self.truncated = True
+                    return
+                fetched += 1
+                count += 1
+                yield tuple(row)
+
+            if fetched == 0:
+                return
+
+    @property
+    def types_known(self):
+        return all(t is not None for t in self.column_types)
+
+    def iter_cast(self):
+        """Yield each row as a list of values cast to its column's agate type,
+        as they would be in `to_table`. The types of all the columns must be
+        known.
+        """
+        casts = [t.cast for t in self.column_types]
+        for row in self:
+            yield [cast(value) for cast, value in zip(casts, row)]
+
+    def to_table(self):
+        """Fetch the remaining rows into an agate.Table. Only the columns
+        whose types aren't known have their types inferred.
+        """
+        return dbt.clients.agate_helper.table_from_rows(
+            list(self), self.column_names, self.column_types
+        )
+
+
+class ConnectionPoolStats(object):
+    """Counts of what a connection pool has done over a run, for the debug
+    log and run_results.json.
+    """
+    FIELDS = ('acquired', 'reused', 'opened', 'closed', 'evicted',
+              'unhealthy', 'waits', 'wait_time', 'max_wait_time', 'max_open')
+
+    def __init__(self):
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+    def serialize(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __str__(self):
+        return ', '.join(
+            '{}={}'.format(field, value)
+            for field, value in sorted(self.serialize().items())
+        )
+
+
+class ConnectionPool(object):
+    """The connections of a connection manager that no thread is using, kept
+    open to be handed to the next thread that needs one.
+
+    Every connection a thread holds or the pool keeps counts towards
+    max_size. Once it's reached, threads wait for a connection to be
+    released instead of opening a new one.
+
+    :attr int min_size: The number of idle connections to keep open, however
+        long they've been idle.
+    :attr Optional[int] max_size: The most connections that can be open at
+        once, or None for no limit.
+    :attr Optional[float] idle_timeout: The number of seconds a connection
+        can be idle before it's closed, or None to keep connections open
+        until the end of the run.
+    :attr ConnectionPoolStats stats: What the pool has done so far.
+    """
+    def __init__(self, min_size=0, max_size=None, idle_timeout=None):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.stats = ConnectionPoolStats()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._condition = threading.Condition()
+        # pairs of (time released, connection), most recently released last
+        self._idle = []
+        self._size = 0
+
+    def _check_pid(self):
+        # a forked process must not use its parent's connections, or even
+        # close them
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _is_full(self):
+        return self.max_size is not None and self._size >= self.max_size
+
+    def take(self):
+        """Take the most recently released idle connection, waiting for one
+        to be released if the pool is full. Returns None if there's no idle
+        connection but there's room for a new one. The caller must then open
+        a connection, and `discard` it once it's closed.
+        """
+        self._check_pid()
+        with self._condition:
+            self.stats.acquired += 1
+            if not self._idle and self._is_full():
+                started = time.time()
+                while not self._idle and self._is_full():
+                    self._condition.wait()
+                waited = time.time() - started
+                self.stats.waits += 1
+                self.stats.wait_time += waited
+                self.stats.max_wait_time = max(self.stats.max_wait_time,
+                                               waited)
+                logger.debug('Waited {:0.2f} seconds for a connection'
+                             .format(waited))
+
+            if self._idle:
+                self.stats.reused += 1
+                return self._idle.pop()[1]
+
+            self._size += 1
+            self.stats.max_open = max(self.stats.max_open, self._size)
+            return None
+
+    def put(self, connection):
+        """Return an open connection to the pool."""
+        self._check_pid()
+        with self._condition:
+            self._idle.append((time.time(), connection))
+            self._condition.notify()
+
+    def discard(self):
+        """Make room for a new connection in place of one that's been closed,
+        or was never opened.
+        """
+        self._check_pid()
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def evict_idle(self):
+        """Remove the connections that have been idle for longer than
+        idle_timeout from the pool, except for the min_size most recently
+        released, and return them to be closed.
+        """
+        if self.idle_timeout is None:
+            return []
+        self._check_pid()
+        cutoff = time.time() - self.idle_timeout
+        with self._condition:
+            num_evictable = len(self._idle) - self.min_size
+            evicted = []
+            while len(evicted) < num_evictable and \
+                    self._idle[0][0] < cutoff:
+                evicted.append(self._idle.pop(0)[1])
+            self.stats.evicted += len(evicted)
+        return evicted
+
+    def drain(self):
+        """Remove every idle connection from the pool, and return them to be
+        closed.
+        """
+        self._check_pid()
+        with self._condition:
+            drained = [connection for _, connection in self._idle]
+            self._idle = []
+        return drained
+
+
 class Credentials(APIObject):
     """Common base class for credentials. This is not valid to instantiate"""
     SCHEMA = NotImplemented
@@ -84,6 +300,18 @@ class BaseConnectionManager(object):
         self.profile = profile
         self.thread_connections = {}
         self.lock = multiprocessing.RLock()
+        self.pool = self._make_pool(profile)
+
+    @staticmethod
+    def _make_pool(profile):
+        max_size = dbt.flags.CONNECTION_POOL_MAX
+        if max_size is not None:
+            # every thread may hold a connection while the main thread holds
+            # one too, so any fewer than this could leave them all waiting
+            max_size = max(max_size, profile.threads + 1)
+        return ConnectionPool(min_size=dbt.flags.CONNECTION_POOL_MIN,
+                              max_size=max_size,
+                              idle_timeout=dbt.flags.CONNECTION_IDLE_TIMEOUT)
 
     @staticmethod
     def get_thread_identifier():
@@ -144,15 +372,9 @@ class BaseConnectionManager(object):
         thread_id_key = self.get_thread_identifier()
 
         if conn is None:
-            conn = Connection(
-                type=self.TYPE,
-                name=None,
-                state='init',
-                transaction_open=False,
-                handle=None,
-                credentials=self.profile.credentials
-            )
-            self.thread_connections[thread_id_key] = conn
+            conn = self._take_from_pool()
+            with self.lock:
+                self.thread_connections[thread_id_key] = conn
 
         if conn.name == name and conn.state == 'open':
             return conn
@@ -167,11 +389,63 @@ class BaseConnectionManager(object):
         else:
             logger.debug('Opening a new connection, currently in state {}'
                          .format(conn.state))
+            self.pool.stats.opened += 1
             self.open(conn)
 
         conn.name = name
         return conn
 
+    def _take_from_pool(self):
+        for connection in self.pool.evict_idle():
+            logger.debug('Closing connection "{}" after it was idle for more '
+                         'than {} seconds.'
+                         .format(connection.name, self.pool.idle_timeout))
+            self._close_pooled(connection)
+
+        while True:
+            connection = self.pool.take()
+            if connection is None:
+                return Connection(
+                    type=self.TYPE,
+                    name=None,
+                    state='init',
+                    transaction_open=False,
+                    handle=None,
+                    credentials=self.profile.credentials
+                )
+            if self.is_healthy(connection):
+                return connection
+            logger.debug('Connection "{}" is no longer usable, closing it.'
+                         .format(connection.name))
+            self.pool.stats.unhealthy += 1
+            self._close_pooled(connection)
+
+    def _close_pooled(self, connection):
+        """Close a connection that was taken from the pool or held by a
+        thread, and make room in the pool for another.
+        """
+        try:
+            if connection.state not in {'closed', 'init'}:
+                self.pool.stats.closed += 1
+            self.close(connection)
+        except Exception as exc:
+            logger.debug('Error closing connection "{}": {!s}'
+                         .format(connection.name, exc))
+        finally:
+            self.pool.discard()
+
+    @classmethod
+    def is_healthy(cls, connection):
+        """Check that an idle connection can still be used before it's handed
+        to another thread. This should be cheap: it's called every time a
+        thread takes a connection from the pool.
+
+        :param Connection connection: An idle connection.
+        :return: False if the connection should be closed instead.
+        :rtype: bool
+        """
+        return connection.state == 'open'
+
     @abc.abstractmethod
     def cancel_open(self):
         """Cancel all open connections on the adapter. (passable)"""
@@ -198,6 +472,9 @@ class BaseConnectionManager(object):
         )
 
     def release(self):
+        """Roll back any open transaction on this thread's connection, and
+        return it to the pool for the next thread that needs one.
+        """
         with self.lock:
             conn = self.get_if_exists()
             if conn is None:
@@ -212,8 +489,15 @@ class BaseConnectionManager(object):
         except Exception:
             # if rollback or close failed, remove our busted connection
             self.clear_thread_connection()
+            self.pool.discard()
             raise
 
+        self.clear_thread_connection()
+        if conn.state == 'open':
+            self.pool.put(conn)
+        else:
+            self.pool.discard()
+
     def cleanup_all(self):
         with self.lock:
             for connection in self.thread_connections.values():
@@ -223,11 +507,15 @@ class BaseConnectionManager(object):
                 else:
                     logger.debug("Connection '{}' was properly closed."
                                  .format(connection.name))
-                self.close(connection)
+                self._close_pooled(connection)
 
             # garbage collect these connections
             self.thread_connections.clear()
 
+        for connection in self.pool.drain():
+            self._close_pooled(connection)
+        logger.debug('Connection pool: {}'.format(self.pool.stats))
+
     @abc.abstractmethod
     def begin(self):
         """Begin a transaction. (passable)
@@ -307,6 +595,21 @@ class BaseConnectionManager(object):
         if connection:
             self.commit()
 
+    def execute_iter(self, sql, auto_begin=False, limit=None):
+        """Execute the given SQL, and return its status and a QueryResult
+        that fetches its rows as it's iterated over.
+
+        :param str sql: The sql to execute.
+        :param bool auto_begin: If set, and dbt is not currently inside a
+            transaction, automatically begin one.
+        :param Optional[int] limit: The maximum number of rows to return.
+        :return: A tuple of the status and the result.
+        :rtype: Tuple[str, QueryResult]
+        """
+        raise dbt.exceptions.NotImplementedException(
+            '`execute_iter` is not implemented for this adapter!'
+        )
+
     @abc.abstractmethod
     def execute(self, sql, auto_begin=False, fetch=False):
         """Execute the given SQL.
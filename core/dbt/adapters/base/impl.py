@@ -1,5 +1,8 @@
 import abc
+import json
+import time
 from contextlib import contextmanager
+from multiprocessing.dummy import Pool as ThreadPool
 
 import agate
 import pytz
@@ -8,6 +11,8 @@ import six
 import dbt.exceptions
 import dbt.flags
 import dbt.clients.agate_helper
+import dbt.clients.columnar
+import dbt.utils
 
 from dbt.compat import abstractclassmethod, classmethod
 from dbt.node_types import NodeType
@@ -19,7 +24,9 @@ from dbt.utils import filter_null_values
 from dbt.adapters.base.meta import AdapterMeta, available
 from dbt.adapters.base import BaseRelation
 from dbt.adapters.base import Column
+from dbt.adapters.base import QueryResult
 from dbt.adapters.cache import RelationsCache
+from dbt.version import __version__ as dbt_version
 
 
 GET_CATALOG_MACRO_NAME = 'get_catalog'
@@ -184,6 +191,10 @@ class BaseAdapter(object):
     # for use in materializations
     AdapterSpecificConfigs = frozenset()
 
+    # Set this if the adapter's get_catalog macro accepts a `schemas`
+    # argument, so the catalog can be fetched one schema at a time
+    CATALOG_BY_SCHEMA = False
+
     def __init__(self, config):
         self.config = config
         self.cache = RelationsCache()
@@ -221,6 +232,39 @@ class BaseAdapter(object):
         finally:
             self.release_connection()
 
+    def _map_on_connections(self, func, items, connection_name):
+        """Call func(*item) for each item in items, and return the results in
+        the same order.
+
+        If the project has more than one thread, the calls are spread across
+        up to that many threads, each using its own connection with the given
+        name. Otherwise they run one after another on the current thread's
+        connection.
+        """
+        return list(self._imap_on_connections(func, items, connection_name))
+
+    def _imap_on_connections(self, func, items, connection_name):
+        """Like `_map_on_connections`, but yield each result as soon as it
+        and all the results before it are ready.
+        """
+        num_threads = min(self.config.threads, len(items))
+        if num_threads <= 1:
+            for item in items:
+                yield func(*item)
+            return
+
+        def call(item):
+            with self.connection_named(connection_name):
+                return func(*item)
+
+        pool = ThreadPool(num_threads)
+        try:
+            for result in pool.imap(call, items):
+                yield result
+        finally:
+            pool.close()
+            pool.join()
+
     @available.parse(lambda *a, **k: ('', dbt.clients.agate_helper()))
     def execute(self, sql, auto_begin=False, fetch=False):
         """Execute the given SQL. This is a thin wrapper around
@@ -239,6 +283,24 @@ class BaseAdapter(object):
             fetch=fetch
         )
 
+    @available.parse(lambda *a, **k: ('', QueryResult.empty()))
+    def execute_iter(self, sql, auto_begin=False, limit=None):
+        """Execute the given SQL, and fetch its results lazily. This is a thin
+        wrapper around ConnectionManager.execute_iter.
+
+        :param str sql: The sql to execute.
+        :param bool auto_begin: If set, and dbt is not currently inside a
+            transaction, automatically begin one.
+        :param Optional[int] limit: The maximum number of rows to return.
+        :return: A tuple of the status and the result.
+        :rtype: Tuple[str, QueryResult]
+        """
+        return self.connections.execute_iter(
+            sql=sql,
+            auto_begin=auto_begin,
+            limit=limit
+        )
+
     ###
     # Methods that should never be overridden
     ###
@@ -311,17 +373,26 @@ class BaseAdapter(object):
         # schemas
         return info_schema_name_map
 
-    def _relations_cache_for_schemas(self, manifest):
-        """Populate the relations cache for the given schemas. Returns an
-        iteratble of the schemas populated, as strings.
+    def _relations_cache_for_schemas(self, manifest, cache_schemas=None):
+        """Populate the relations cache for the given schemas, a
+        SchemaSearchMap. By default, that is every schema that has executable
+        nodes in the manifest.
         """
         if not dbt.flags.USE_CACHE:
             return
 
-        info_schema_name_map = self._get_cache_schemas(manifest,
-                                                       exec_only=True)
-        for db, schema in info_schema_name_map.search():
-            for relation in self.list_relations_without_caching(db, schema):
+        if cache_schemas is None:
+            cache_schemas = self._get_cache_schemas(manifest, exec_only=True)
+        info_schema_name_map = cache_schemas
+        results = self._map_on_connections(
+            self._list_relations_timed,
+            list(info_schema_name_map.search()),
+            'list_relations'
+        )
+        # the connections list in parallel, but only this thread updates the
+        # cache (holding its lock, via set_relations_cache)
+        for relations in results:
+            for relation in relations:
                 self.cache.add(relation)
 
         # it's possible that there were no relations in some schemas. We want
@@ -329,6 +400,16 @@ class BaseAdapter(object):
         # so we can check it later
         self.cache.update_schemas(info_schema_name_map.schemas_searched())
 
+    def _list_relations_timed(self, information_schema, schema):
+        start = time.time()
+        relations = self.list_relations_without_caching(information_schema,
+                                                        schema)
+        logger.debug('Listed {} relations in schema "{}" of "{}" in {:.2f}s'
+                     .format(len(relations), schema,
+                             information_schema.database,
+                             time.time() - start))
+        return relations
+
     def set_relations_cache(self, manifest, clear=False):
         """Run a query that gets a populated cache of the relations in the
         database and set the cache on this adapter.
@@ -341,6 +422,63 @@ class BaseAdapter(object):
                 self.cache.clear()
             self._relations_cache_for_schemas(manifest)
 
+    def relations_cache_fingerprint(self):
+        """Return a digest of everything that determines which relations the
+        cache would hold: the dbt version, the adapter, the target and its
+        (non-secret) connection details.
+        """
+        return dbt.utils.md5(json.dumps({
+            'dbt_version': dbt_version,
+            'type': self.type(),
+            'target_name': self.config.target_name,
+            'credentials': dict(self.config.credentials.connection_info()),
+            'quoting': self.config.quoting,
+        }, sort_keys=True, default=str))
+
+    def set_relations_cache_from_snapshot(self, manifest, path, max_age,
+                                          schemas):
+        """Fill the cache from the snapshot at path written by
+        `save_relations_cache`, then list only the given schemas again. If
+        the snapshot can't be used, fill the whole cache from the database.
+
+        :param Manifest manifest: The manifest of the nodes to cache.
+        :param str path: The path of the snapshot.
+        :param float max_age: The maximum age of the snapshot, in seconds.
+        :param Iterable[Tuple[str, str]] schemas: The (database, schema)
+            pairs that must be listed again.
+        """
+        if not dbt.flags.USE_CACHE:
+            return
+
+        fingerprint = self.relations_cache_fingerprint()
+        with self.cache.lock:
+            if not self.cache.load(path, fingerprint, max_age):
+                self.cache.clear()
+                self._relations_cache_for_schemas(manifest)
+                return
+
+            # the search map's schema names are already lowercase
+            wanted = {(d and d.lower(), s and s.lower()) for d, s in schemas}
+            stale = SchemaSearchMap()
+            cache_schemas = self._get_cache_schemas(manifest, exec_only=True)
+            for information_schema, schema in cache_schemas.search():
+                database = information_schema.database
+                if (database and database.lower(), schema) in wanted:
+                    stale.setdefault(information_schema, set()).add(schema)
+
+            logger.debug('Loaded the relations cache snapshot, listing {} '
+                         'schemas again'.format(len(stale.schemas_searched())))
+            self.cache.remove_schemas(stale.schemas_searched())
+            self._relations_cache_for_schemas(manifest, stale)
+
+    def save_relations_cache(self, path):
+        """Write a snapshot of the relations cache to path, for
+        `set_relations_cache_from_snapshot` to load in a later run.
+        """
+        if not dbt.flags.USE_CACHE:
+            return
+        self.cache.save(path, self.relations_cache_fingerprint())
+
     def cache_new_relation(self, relation):
         """Cache a new relation in dbt. It will show up in `list relations`."""
         if relation is None:
@@ -387,6 +525,20 @@ class BaseAdapter(object):
             '`list_schemas` is not implemented for this adapter!'
         )
 
+    def list_schemas_in_databases(self, databases):
+        """Get the existing schemas in each of the given databases, querying
+        the databases in parallel if the project has more than one thread.
+
+        :param Iterable[str] databases: The names of the databases.
+        :return: A mapping of each database name to its schema names
+        :rtype: Dict[str, List[str]]
+        """
+        databases = list(databases)
+        results = self._map_on_connections(
+            self.list_schemas, [(db,) for db in databases], 'list_schemas'
+        )
+        return dict(zip(databases, results))
+
     @available.parse(lambda *a, **k: False)
     def check_schema_exists(self, database, schema):
         """Check if a schema exists.
@@ -733,6 +885,20 @@ class BaseAdapter(object):
         else:
             return identifier
 
+    @available
+    def bulk_load_csv_rows(self, relation, agate_table):
+        """Load the rows of a seed's agate table into the table at relation,
+        using the database's bulk loading path. Adapters with one override
+        this.
+
+        :param self.Relation relation: The table to load the rows into.
+        :param agate.Table agate_table: The rows of the seed.
+        :return: The SQL that loaded the rows, or None if they weren't loaded
+            and should be inserted in batches instead.
+        :rtype: Optional[str]
+        """
+        return None
+
     ###
     # Conversions: These must be implemented by concrete implementations, for
     # converting agate types into their sql equivalents.
@@ -904,6 +1070,61 @@ class BaseAdapter(object):
         """
         return table.where(_catalog_filter_schemas(manifest))
 
+    def _get_catalog_schemas(self, manifest):
+        """Get a SchemaSearchMap of the schemas used by the manifest, under
+        their information_schemas.
+        """
+        used = {
+            (d and d.lower(), s and s.lower())
+            for d, s in manifest.get_used_schemas()
+        }
+        catalog_schemas = SchemaSearchMap()
+        for information_schema, schema in \
+                self._get_cache_schemas(manifest).search():
+            database = information_schema.database
+            if (database and database.lower(), schema) in used:
+                catalog_schemas.setdefault(information_schema, set()).add(
+                    schema
+                )
+        return catalog_schemas
+
+    def _get_one_catalog(self, information_schema, schemas, manifest):
+        start = time.time()
+        kwargs = {
+            'information_schemas': [information_schema],
+            'schemas': schemas,
+        }
+        table = self.execute_macro(GET_CATALOG_MACRO_NAME, kwargs=kwargs)
+        table = dbt.clients.columnar.ColumnarTable.from_agate(table)
+        results = self._catalog_filter_table(table, manifest)
+        logger.debug('Got the catalog of {} in "{}" in {:.2f}s'
+                     .format(', '.join(schemas), information_schema.database,
+                             time.time() - start))
+        return results
+
+    def iter_catalog(self, manifest):
+        """Get the catalog for this manifest one schema at a time, by running
+        the get catalog macro once for each schema the manifest uses. If the
+        project has more than one thread, schemas are queried concurrently on
+        separate connections. Yields a ColumnarTable of catalog information
+        for each schema, with the same columns as `get_catalog`.
+
+        Unless the adapter sets CATALOG_BY_SCHEMA, the whole catalog is
+        fetched at once with `get_catalog` and yielded as a single table.
+        """
+        if not self.CATALOG_BY_SCHEMA:
+            table = self.get_catalog(manifest)
+            return iter([dbt.clients.columnar.ColumnarTable.from_agate(table)])
+
+        items = [
+            (information_schema, [schema], manifest)
+            for information_schema, schema in
+            sorted(self._get_catalog_schemas(manifest).search(),
+                   key=lambda item: (str(item[0]), item[1]))
+        ]
+        return self._imap_on_connections(self._get_one_catalog, items,
+                                         'generate_catalog')
+
     def get_catalog(self, manifest):
         """Get the catalog for this manifest by running the get catalog macro.
         Returns an agate.Table of catalog information.
@@ -6,6 +6,7 @@ import dbt.exceptions
 
 
 class BaseRelation(APIObject):
+    __slots__ = ()
 
     Table = "table"
     View = "view"
@@ -319,6 +320,9 @@ class BaseRelation(APIObject):
 
 
 class Column(object):
+    __slots__ = ('column', 'dtype', 'char_size', 'numeric_precision',
+                 'numeric_scale')
+
     TYPE_LABELS = {
         'STRING': 'TEXT',
         'TIMESTAMP': 'TIMESTAMP',
@@ -1,8 +1,12 @@
 from collections import namedtuple
+import os
+import pickle
 import threading
+import time
 from copy import deepcopy
 import pprint
 from dbt.logger import CACHE_LOGGER as logger
+import dbt.clients.system
 import dbt.exceptions
 
 
@@ -172,6 +176,8 @@ class RelationsCache(object):
         The adapters also hold this lock while filling the cache.
     :attr Set[str] schemas: The set of known/cached schemas, all lowercased.
     """
+    SNAPSHOT_VERSION = 1
+
     def __init__(self):
         self.relations = {}
         self.lock = threading.RLock()
@@ -468,6 +474,81 @@ class RelationsCache(object):
             )
         return results
 
+    def remove_schemas(self, schemas):
+        """Forget everything cached about the given schemas, so they can be
+        listed again. Unlike a drop, this does not cascade to relations in
+        other schemas.
+
+        :param Iterable[Tuple[str, str]] schemas: The (database, schema) pairs
+            to remove.
+        """
+        schemas = {(_lower(d), _lower(s)) for d, s in schemas}
+        with self.lock:
+            keys = [
+                k for k in self.relations if (k.database, k.schema) in schemas
+            ]
+            self._remove_refs(keys)
+            self.schemas.difference_update(schemas)
+
+    def save(self, path, fingerprint):
+        """Write a snapshot of the cache to path, stamped with the current time
+        and a fingerprint of the database it describes.
+
+        :param str path: The path to write the snapshot to.
+        :param str fingerprint: The fingerprint to check in `load`.
+        """
+        with self.lock:
+            data = pickle.dumps({
+                'version': self.SNAPSHOT_VERSION,
+                'fingerprint': fingerprint,
+                'created_at': time.time(),
+                'relations': self.relations,
+                'schemas': self.schemas,
+            }, pickle.HIGHEST_PROTOCOL)
+        dbt.clients.system.make_directory(os.path.dirname(path))
+        with open(path, 'wb') as fp:
+            fp.write(data)
+
+    def load(self, path, fingerprint, max_age):
+        """Replace the contents of the cache with the snapshot at path, unless
+        it is missing, unreadable, older than max_age seconds or was written
+        with a different fingerprint. The snapshot file is removed, so a run
+        that fails before saving a new one leaves nothing stale behind.
+
+        :param str path: The path of the snapshot.
+        :param str fingerprint: The fingerprint the snapshot must have.
+        :param float max_age: The maximum age of the snapshot, in seconds.
+        :return bool: If the snapshot was loaded.
+        """
+        if not os.path.exists(path):
+            return False
+
+        try:
+            with open(path, 'rb') as fp:
+                data = pickle.load(fp)
+        except Exception as exc:
+            logger.debug('Could not read relations cache snapshot {}: {}'
+                         .format(path, exc))
+            data = {}
+        finally:
+            dbt.clients.system.remove_file(path)
+
+        if data.get('version') != self.SNAPSHOT_VERSION:
+            reason = 'it has a different version'
+        elif data.get('fingerprint') != fingerprint:
+            reason = 'it is for a different target'
+        elif time.time() - data['created_at'] > max_age:
+            reason = 'it is more than {} seconds old'.format(max_age)
+        else:
+            with self.lock:
+                self.relations = data['relations']
+                self.schemas = data['schemas']
+            return True
+
+        logger.debug('Not using the relations cache snapshot, because {}'
+                     .format(reason))
+        return False
+
     def clear(self):
         """Clear the cache"""
         with self.lock:
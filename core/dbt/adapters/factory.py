@@ -82,3 +82,12 @@ def reset_adapters():
         for adapter in _ADAPTERS.values():
             adapter.cleanup_connections()
         _ADAPTERS.clear()
+
+
+def cleanup_connections():
+    """Close the connections held by every adapter, but keep the adapters
+    themselves. They will open new connections the next time they are used.
+    """
+    with _ADAPTER_LOCK:
+        for adapter in _ADAPTERS.values():
+            adapter.cleanup_connections()
@@ -4,7 +4,7 @@ import time
 import dbt.clients.agate_helper
 import dbt.exceptions
 from dbt.contracts.connection import Connection
-from dbt.adapters.base import BaseConnectionManager
+from dbt.adapters.base import BaseConnectionManager, QueryResult
 from dbt.compat import abstractclassmethod
 from dbt.logger import GLOBAL_LOGGER as logger
 
@@ -77,17 +77,28 @@ class SQLConnectionManager(BaseConnectionManager):
         )
 
     @classmethod
-    def get_result_from_cursor(cls, cursor):
-        data = []
-        column_names = []
+    def get_agate_type(cls, type_code):
+        """Get the agate type of the values in a result column, given the type
+        code in its cursor description, or None if they should be inferred
+        from the values. Adapters override this to skip inference for the
+        types their driver reports.
+        """
+        return None
 
-        if cursor.description is not None:
-            column_names = [col[0] for col in cursor.description]
-            raw_results = cursor.fetchall()
-            data = [dict(zip(column_names, row))
-                    for row in raw_results]
+    @classmethod
+    def iter_result_from_cursor(cls, cursor, limit=None):
+        if cursor.description is None:
+            return QueryResult.empty()
 
-        return dbt.clients.agate_helper.table_from_data(data, column_names)
+        column_names = [col[0] for col in cursor.description]
+        column_types = [cls.get_agate_type(col[1])
+                        for col in cursor.description]
+        return QueryResult(column_names, column_types, cursor.fetchmany,
+                           limit=limit)
+
+    @classmethod
+    def get_result_from_cursor(cls, cursor):
+        return cls.iter_result_from_cursor(cursor).to_table()
 
     def execute(self, sql, auto_begin=False, fetch=False):
         _, cursor = self.add_query(sql, auto_begin)
@@ -98,6 +109,11 @@ class SQLConnectionManager(BaseConnectionManager):
             table = dbt.clients.agate_helper.empty_table()
         return status, table
 
+    def execute_iter(self, sql, auto_begin=False, limit=None):
+        _, cursor = self.add_query(sql, auto_begin)
+        status = self.get_status(cursor)
+        return status, self.iter_result_from_cursor(cursor, limit=limit)
+
     def add_begin_query(self):
         return self.add_query('BEGIN', auto_begin=False)
 
@@ -3,10 +3,56 @@ from collections import Mapping
 from jsonschema import Draft7Validator
 
 from dbt.exceptions import JSONValidationException
-from dbt.utils import deep_merge
+from dbt.utils import deep_merge, copy_json
 from dbt.clients.system import write_json
 
 
+# the top-level schema keywords that incremental validation understands. A
+# schema using any other keyword at the top level is always fully validated,
+# as is an incorporate() that adds a key that isn't in 'properties'.
+_INCREMENTAL_KEYWORDS = frozenset(
+    ['type', 'properties', 'required', 'additionalProperties', 'description',
+     'title']
+)
+
+
+class _SchemaInfo(object):
+    """What APIObject needs to know about a class's SCHEMA, computed once per
+    class: the compiled validator, a validator for each property (for
+    validating the changes made by `incorporate`), whether the class
+    serializes to a plain copy of its contents, and whether its instances are
+    compact (every class in the MRO declares __slots__, so there is no
+    instance __dict__).
+    """
+    def __init__(self, cls):
+        self.schema = cls.SCHEMA
+        self.validator = Draft7Validator(cls.SCHEMA)
+        self.incremental = (
+            set(cls.SCHEMA) <= _INCREMENTAL_KEYWORDS and
+            cls.SCHEMA.get('type') == 'object'
+        )
+        self._property_validators = {}
+        self.plain_serialize = _defining_class(cls, 'serialize') is APIObject
+        self.compact = all(
+            '__slots__' in vars(klass)
+            for klass in cls.__mro__ if klass is not object
+        )
+
+    def property_validator(self, key):
+        validator = self._property_validators.get(key)
+        if validator is None:
+            validator = Draft7Validator(self.schema['properties'][key])
+            self._property_validators[key] = validator
+        return validator
+
+
+def _defining_class(cls, name):
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass
+    return None
+
+
 class APIObject(Mapping):
     """
     A serializable / deserializable object intended for
@@ -19,6 +65,8 @@ class APIObject(Mapping):
     calls this constructor.
     """
 
+    __slots__ = ('_contents',)
+
     SCHEMA = {
         'type': 'object',
         'properties': {}
@@ -26,6 +74,8 @@ class APIObject(Mapping):
 
     DEFAULTS = {}
 
+    _schema_info = {}
+
     def __init__(self, **kwargs):
         """
         Create and validate an instance. Note that if you override this, you
@@ -33,10 +83,21 @@ class APIObject(Mapping):
         super(NewClass, self).__init__(**kwargs).
         """
         super(APIObject, self).__init__()
-        # note: deep_merge does a deep copy on its arguments.
-        self._contents = deep_merge(self.DEFAULTS, kwargs)
+        # note: deep_merge and copy_json copy their arguments.
+        if self.DEFAULTS:
+            self._contents = deep_merge(self.DEFAULTS, kwargs)
+        else:
+            self._contents = copy_json(kwargs)
         self.validate()
 
+    @classmethod
+    def _get_schema_info(cls):
+        info = APIObject._schema_info.get(cls)
+        if info is None or info.schema is not cls.SCHEMA:
+            info = _SchemaInfo(cls)
+            APIObject._schema_info[cls] = info
+        return info
+
     def __str__(self):
         return '{}(**{})'.format(self.__class__.__name__, self._contents)
 
@@ -46,6 +107,9 @@ class APIObject(Mapping):
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
             return False
+        if self._get_schema_info().plain_serialize and \
+                other._get_schema_info().plain_serialize:
+            return self._contents == other._contents
         return self.serialize() == other.serialize()
 
     def incorporate(self, **kwargs):
@@ -53,8 +117,19 @@ class APIObject(Mapping):
         Given a list of kwargs, incorporate these arguments
         into a new copy of this instance, and return the new
         instance after validating.
+
+        Compact subclasses (those that declare __slots__ all the way down, so
+        instances have no __dict__) are copied rather than constructed again,
+        and only the incorporated values are validated.
         """
-        return type(self)(**deep_merge(self._contents, kwargs))
+        contents = deep_merge(self._contents, kwargs)
+        if not self._get_schema_info().compact:
+            return type(self)(**contents)
+
+        new = copy.copy(self)
+        new._contents = contents
+        new._validate_keys(kwargs)
+        return new
 
     def serialize(self):
         """
@@ -79,11 +154,38 @@ class APIObject(Mapping):
         of this instance. If any attributes are missing or
         invalid, raise a ValidationException.
         """
-        validator = Draft7Validator(self.SCHEMA)
-
+        info = self._get_schema_info()
+        if info.plain_serialize:
+            # validation doesn't modify its input, so skip serialize()'s copy
+            instance = self._contents
+        else:
+            instance = self.serialize()
+        self._raise_errors(info.validator.iter_errors(instance))
+
+    def _validate_keys(self, keys):
+        """Validate only the given top-level keys of this instance, which is
+        otherwise known to be valid. Keys can't be removed from a valid
+        instance by merging, so its required keys are still present.
+        """
+        info = self._get_schema_info()
+        properties = self.SCHEMA.get('properties', {})
+        if not info.plain_serialize or not info.incremental or \
+                any(k not in properties for k in keys):
+            self.validate()
+            return
+
+        errors = []
+        for key in keys:
+            validator = info.property_validator(key)
+            for error in validator.iter_errors(self._contents[key]):
+                error.path.appendleft(key)
+                errors.append(error)
+        self._raise_errors(errors)
+
+    def _raise_errors(self, validation_errors):
         errors = set()  # make errors a set to avoid duplicates
 
-        for error in validator.iter_errors(self.serialize()):
+        for error in validation_errors:
             errors.add('.'.join(
                 list(map(str, error.path)) + [error.message]
             ))
@@ -118,7 +220,8 @@ class APIObject(Mapping):
     def __getattr__(self, name):
         if name != '_contents' and name in self._contents:
             return self._contents[name]
-        elif hasattr(self.__class__, name):
+        elif name not in ('_contents', '__dict__') and \
+                hasattr(self.__class__, name):
             return getattr(self.__class__, name)
         raise AttributeError((
             "'{}' object has no attribute '{}'"
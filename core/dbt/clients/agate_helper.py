@@ -1,36 +1,62 @@
 from codecs import BOM_UTF8
+import datetime
+from decimal import Decimal
 
-import dbt.compat
+import six
+
+import dbt.clients.columnar
 
 import agate
+from agate.rows import Row
 
 BOM = BOM_UTF8.decode('utf-8')  # '\ufeff'
 
-DEFAULT_TYPE_TESTER = agate.TypeTester(types=[
-    agate.data_types.Number(null_values=('null', '')),
-    agate.data_types.TimeDelta(null_values=('null', '')),
-    agate.data_types.Date(null_values=('null', '')),
-    agate.data_types.DateTime(null_values=('null', '')),
-    agate.data_types.Boolean(true_values=('true',),
-                             false_values=('false',),
-                             null_values=('null', '')),
-    agate.data_types.Text(null_values=('null', ''))
-])
+NUMBER = agate.data_types.Number(null_values=('null', ''))
+TIMEDELTA = agate.data_types.TimeDelta(null_values=('null', ''))
+DATE = agate.data_types.Date(null_values=('null', ''))
+DATETIME = agate.data_types.DateTime(null_values=('null', ''))
+BOOLEAN = agate.data_types.Boolean(true_values=('true',),
+                                   false_values=('false',),
+                                   null_values=('null', ''))
+TEXT = agate.data_types.Text(null_values=('null', ''))
 
+DEFAULT_TYPES = [NUMBER, TIMEDELTA, DATE, DATETIME, BOOLEAN, TEXT]
 
-def table_from_data(data, column_names):
-    "Convert list of dictionaries into an Agate table"
+DEFAULT_TYPE_TESTER = agate.TypeTester(types=DEFAULT_TYPES)
 
-    # The agate table is generated from a list of dicts, so the column order
-    # from `data` is not preserved. We can use `select` to reorder the columns
-    #
-    # If there is no data, create an empty table with the specified columns
 
-    if len(data) == 0:
-        return agate.Table([], column_names=column_names)
-    else:
-        table = agate.Table.from_object(data, column_types=DEFAULT_TYPE_TESTER)
-        return table.select(column_names)
+def table_from_data(data, column_names):
+    "Convert list of dictionaries into an Agate table"
+    return dbt.clients.columnar.ColumnarTable.from_dicts(
+        data, column_names
+    ).to_agate()
+
+
+def table_from_rows(rows, column_names, column_types=None):
+    """Convert a list of row tuples into an Agate table. column_types, if
+    given, has the agate type of each column, or None for columns whose type
+    should be inferred from their values like `table_from_data` does.
+    """
+    return dbt.clients.columnar.ColumnarTable.from_rows(
+        rows, column_names, column_types
+    ).to_agate()
+
+
+def table_from_cast_rows(rows, column_names, column_types):
+    """Build an agate table from a list of row tuples whose values are
+    already cast to column_types.
+
+    agate.Table casts every value it's given again. To skip that, the rows
+    are handed to it with its private _is_fork argument, which agate uses for
+    the tables it derives from other tables. Versions of agate that don't
+    accept it get the rows through the public constructor instead, which
+    gives the same table, only more slowly.
+    """
+    try:
+        return agate.Table([Row(values, column_names) for values in rows],
+                           column_names, column_types, _is_fork=True)
+    except TypeError:
+        return agate.Table(rows, column_names, column_types)
 
 
 def empty_table():
@@ -39,14 +65,81 @@ def empty_table():
     return agate.Table(rows=[])
 
 
+class MaxByteLength(agate.MaxLength):
+    """Like agate's MaxLength, but the length of each value is the number of
+    bytes it has encoded as utf-8.
+    """
+    def run(self, table):
+        column = table.columns[self._column_name]
+        lens = [len(d.encode('utf-8')) for d in column.values_without_nulls()]
+        if not lens:
+            return Decimal('0')
+        return Decimal(max(lens))
+
+
 def as_matrix(table):
     "Return an agate table as a matrix of data sans columns"
 
     return [r.values() for r in table.rows.values()]
 
 
+def _csv_text(value):
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _csv_datetime(value):
+    return value.isoformat(' ')
+
+
+def _csv_boolean(value):
+    return 'true' if value else 'false'
+
+
+# How values of each agate type are written by `csv_chunks`. Text is always
+# quoted, so an unquoted empty value is always null.
+_CSV_FORMATTERS = [
+    (agate.data_types.Text, _csv_text),
+    (agate.data_types.Number, six.text_type),
+    (agate.data_types.Boolean, _csv_boolean),
+    (agate.data_types.DateTime, _csv_datetime),
+    (agate.data_types.Date, datetime.date.isoformat),
+]
+
+
+def _csv_formatter(column_type):
+    for data_type, formatter in _CSV_FORMATTERS:
+        if isinstance(column_type, data_type):
+            return formatter
+    return None
+
+
+def can_write_csv(table):
+    """Return True if every column of the table has a type that
+    `csv_chunks` can write out.
+    """
+    return all(_csv_formatter(t) is not None for t in table.column_types)
+
+
+def csv_chunks(table, rows_per_chunk=1000):
+    """Yield the rows of an agate table as CSV for a database's bulk loader,
+    a few rows at a time. There's no header row, nulls are empty and
+    unquoted, and dates and timestamps are written in ISO format.
+    """
+    formatters = [_csv_formatter(t) for t in table.column_types]
+    lines = []
+    for row in table.rows:
+        lines.append(','.join(
+            '' if value is None else formatter(value)
+            for formatter, value in zip(formatters, row)
+        ))
+        if len(lines) >= rows_per_chunk:
+            lines.append('')
+            yield '\n'.join(lines)
+            lines = []
+    if lines:
+        lines.append('')
+        yield '\n'.join(lines)
+
+
 def from_csv(abspath):
-    with dbt.compat.open_file(abspath) as fp:
-        if fp.read(1) != BOM:
-            fp.seek(0)
-        return agate.Table.from_csv(fp, column_types=DEFAULT_TYPE_TESTER)
+    return dbt.clients.columnar.ColumnarTable.from_csv(abspath).to_agate()
@@ -0,0 +1,184 @@
+import agate
+import agate.utils
+import six
+from agate.exceptions import CastError
+
+import dbt.clients.agate_helper
+import dbt.compat
+
+
+def cast_column(values, column_type):
+    """Cast every value in the column to column_type, raising a CastError if
+    any of them can't be. Strings are parsed once per distinct value, which
+    is where nearly all the time goes when reading seeds.
+    """
+    cast = column_type.cast
+    parsed = {}
+    result = []
+    for value in values:
+        if isinstance(value, six.string_types):
+            try:
+                result.append(parsed[value])
+            except KeyError:
+                parsed[value] = cast(value)
+                result.append(parsed[value])
+        else:
+            result.append(cast(value))
+    return tuple(result)
+
+
+def infer_column(values, types):
+    """Find the first of types that every value in the column can be cast
+    to, and return it with the cast values. This picks the same type as
+    agate.TypeTester, but each candidate stops at the first value it fails
+    on instead of every value being tested against every type.
+    """
+    for column_type in types:
+        try:
+            return column_type, cast_column(values, column_type)
+        except CastError:
+            continue
+    # Text accepts anything, so this only happens with a custom list of types
+    raise CastError(
+        'No type could be inferred for a column'
+    )
+
+
+class ColumnarTable(object):
+    """A table of query results, seed rows or catalog entries, stored as a
+    tuple of values per column. Values are cast to agate data types just as
+    they are in agate tables, so `to_agate` is cheap, but the types of
+    untyped columns are inferred a whole column at a time.
+
+    :attr Tuple[str] column_names: The names of the columns.
+    :attr Tuple[agate.data_types.DataType] column_types: The type of each
+        column.
+    :attr Tuple[Tuple[Any]] columns: The values in each column.
+    """
+    def __init__(self, column_names, column_types, columns):
+        self.column_names = tuple(column_names)
+        self.column_types = tuple(column_types)
+        self.columns = tuple(columns)
+
+    @classmethod
+    def from_columns(cls, column_names, columns, column_types=None):
+        """Build a table from the uncast values of each column. column_types,
+        if given, has the agate type of each column, or None for columns
+        whose type should be inferred from their values.
+        """
+        column_names = agate.utils.deduplicate(column_names,
+                                               column_names=True)
+        if column_types is None:
+            column_types = [None] * len(column_names)
+
+        types = []
+        cast_columns = []
+        for column_type, values in zip(column_types, columns):
+            if column_type is None:
+                column_type, values = infer_column(
+                    values, dbt.clients.agate_helper.DEFAULT_TYPES
+                )
+            else:
+                values = cast_column(values, column_type)
+            types.append(column_type)
+            cast_columns.append(values)
+        return cls(column_names, types, cast_columns)
+
+    @classmethod
+    def from_rows(cls, rows, column_names, column_types=None):
+        """Build a table from a sequence of rows. Short rows are padded with
+        None, like they are in agate tables.
+        """
+        num_columns = len(column_names)
+        columns = list(six.moves.zip_longest(*rows))
+        if len(columns) > num_columns:
+            raise ValueError(
+                'Rows have {} values, but the table only has {} columns.'
+                .format(len(columns), num_columns)
+            )
+        columns.extend(() for _ in range(num_columns - len(columns)))
+        return cls.from_columns(column_names, columns, column_types)
+
+    @classmethod
+    def from_dicts(cls, data, column_names, column_types=None):
+        """Build a table from a list of dictionaries, taking the given keys
+        from each. Missing keys are None.
+        """
+        columns = [[d.get(name) for d in data] for name in column_names]
+        return cls.from_columns(column_names, columns, column_types)
+
+    @classmethod
+    def from_csv(cls, path):
+        """Read a utf-8 encoded CSV file with a header row. The file is read
+        the same way as `agate.Table.from_csv`.
+        """
+        with dbt.compat.open_file(path) as fp:
+            if fp.read(1) != dbt.clients.agate_helper.BOM:
+                fp.seek(0)
+            contents = six.StringIO(fp.read())
+
+        kwargs = {}
+        if six.PY2:
+            kwargs['encoding'] = 'utf-8'
+        reader = agate.csv.reader(contents, header=True, **kwargs)
+        column_names = next(reader, [])
+        return cls.from_rows(tuple(reader), column_names)
+
+    @classmethod
+    def from_agate(cls, table):
+        columns = list(zip(*table.rows))
+        columns.extend(
+            () for _ in range(len(table.column_names) - len(columns))
+        )
+        return cls(table.column_names, table.column_types, columns)
+
+    def __len__(self):
+        if not self.columns:
+            return 0
+        return len(self.columns[0])
+
+    def __iter__(self):
+        """Iterate over the rows as tuples."""
+        return iter(zip(*self.columns))
+
+    def column(self, name):
+        return self.columns[self.column_names.index(name)]
+
+    def to_dicts(self):
+        """Iterate over the rows as dictionaries keyed by column name."""
+        for row in self:
+            yield dict(zip(self.column_names, row))
+
+    def _take(self, indices):
+        return type(self)(
+            self.column_names,
+            self.column_types,
+            [tuple(values[idx] for idx in indices) for values in self.columns]
+        )
+
+    def where(self, test):
+        """Return a table of the rows for which test, given each row as a
+        dictionary, returns True.
+        """
+        return self._take([
+            idx for idx, row in enumerate(self.to_dicts()) if test(row)
+        ])
+
+    def select(self, column_names):
+        indices = [self.column_names.index(name) for name in column_names]
+        return type(self)(
+            column_names,
+            [self.column_types[idx] for idx in indices],
+            [self.columns[idx] for idx in indices]
+        )
+
+    def rename(self, column_names):
+        return type(self)(column_names, self.column_types, self.columns)
+
+    def to_agate(self):
+        """Build an agate.Table with the same contents, for macros and
+        adapter methods that work with agate tables.
+        """
+        return dbt.clients.agate_helper.table_from_cast_rows(
+            list(self), self.column_names, self.column_types
+        )
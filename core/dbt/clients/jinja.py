@@ -1,6 +1,8 @@
-import codecs
 import linecache
 import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 
 import jinja2
 import jinja2._compat
@@ -46,10 +48,9 @@ class MacroFuzzEnvironment(jinja2.sandbox.SandboxedEnvironment):
         the python linecache for debugging.
         """
         if filename == '<template>':
-            # make a better filename
-            filename = 'dbt-{}'.format(
-                codecs.encode(os.urandom(12), 'hex').decode('ascii')
-            )
+            # make a better filename. It's derived from the source so
+            # compiling the same template twice reuses the linecache entry.
+            filename = 'dbt-{}'.format(dbt.utils.md5(source)[:24])
             # encode, though I don't think this matters
             filename = jinja2._compat.encode_filename(filename)
             # put ourselves in the cache
@@ -63,6 +64,56 @@ class MacroFuzzEnvironment(jinja2.sandbox.SandboxedEnvironment):
         return super(MacroFuzzEnvironment, self)._compile(source, filename)
 
 
+class CodeCache(object):
+    """A bounded cache of compiled template code, keyed by a hash of the
+    template source. When the cache is full, the least recently used entry is
+    evicted, along with the linecache entry stashed for it by
+    `MacroFuzzEnvironment._compile`.
+    """
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            code = self._entries.pop(key, None)
+            if code is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            # re-insert it to mark it as the most recently used
+            self._entries[key] = code
+            return code
+
+    def set(self, key, code):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = code
+            while len(self._entries) > self.maxsize:
+                _, evicted = self._entries.popitem(last=False)
+                self.evictions += 1
+                linecache.cache.pop(evicted.co_filename, None)
+
+    def clear(self):
+        with self._lock:
+            for code in self._entries.values():
+                linecache.cache.pop(code.co_filename, None)
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+code_cache = CodeCache()
+
+
 class TemplateCache(object):
 
     def __init__(self):
@@ -169,68 +220,80 @@ def _is_dunder_name(name):
     return name.startswith('__') and name.endswith('__')
 
 
-def create_macro_capture_env(node):
+_RENDER_STATE = threading.local()
 
-    class ParserMacroCapture(jinja2.Undefined):
-        """
-        This class sets up the parser to capture macros.
-        """
-        def __init__(self, hint=None, obj=None, name=None, exc=None):
-            super(ParserMacroCapture, self).__init__(hint=hint, name=name)
-            self.node = node
-            self.name = name
-            self.package_name = node.get('package_name')
-            # jinja uses these for safety, so we have to override them.
-            # see https://github.com/pallets/jinja/blob/master/jinja2/sandbox.py#L332-L339 # noqa
-            self.unsafe_callable = False
-            self.alters_data = False
-
-        def __deepcopy__(self, memo):
-            path = os.path.join(self.node.get('root_path'),
-                                self.node.get('original_file_path'))
-
-            logger.debug(
-                'dbt encountered an undefined variable, "{}" in node {}.{} '
-                '(source path: {})'
-                .format(self.name, self.node.get('package_name'),
-                        self.node.get('name'), path))
-
-            # match jinja's message
-            dbt.exceptions.raise_compiler_error(
-                "{!r} is undefined".format(self.name),
-                node=self.node
-            )
 
-        def __getitem__(self, name):
-            # Propagate the undefined value if a caller accesses this as if it
-            # were a dictionary
-            return self
+@contextmanager
+def _rendering_node(node):
+    """Record the node being rendered on this thread, for
+    ParserMacroCapture's error messages.
+    """
+    previous = getattr(_RENDER_STATE, 'node', None)
+    _RENDER_STATE.node = node
+    try:
+        yield
+    finally:
+        _RENDER_STATE.node = previous
 
-        def __getattr__(self, name):
-            if name == 'name' or _is_dunder_name(name):
-                raise AttributeError(
-                    "'{}' object has no attribute '{}'"
-                    .format(type(self).__name__, name)
-                )
 
-            self.package_name = self.name
-            self.name = name
+class ParserMacroCapture(jinja2.Undefined):
+    """
+    This class sets up the parser to capture macros.
+    """
+    def __init__(self, hint=None, obj=None, name=None, exc=None):
+        super(ParserMacroCapture, self).__init__(hint=hint, name=name)
+        self.node = getattr(_RENDER_STATE, 'node', None) or {}
+        self.name = name
+        self.package_name = self.node.get('package_name')
+        # jinja uses these for safety, so we have to override them.
+        # see https://github.com/pallets/jinja/blob/master/jinja2/sandbox.py#L332-L339 # noqa
+        self.unsafe_callable = False
+        self.alters_data = False
+
+    def __deepcopy__(self, memo):
+        path = os.path.join(self.node.get('root_path'),
+                            self.node.get('original_file_path'))
+
+        logger.debug(
+            'dbt encountered an undefined variable, "{}" in node {}.{} '
+            '(source path: {})'
+            .format(self.name, self.node.get('package_name'),
+                    self.node.get('name'), path))
+
+        # match jinja's message
+        dbt.exceptions.raise_compiler_error(
+            "{!r} is undefined".format(self.name),
+            node=self.node
+        )
 
-            return self
+    def __getitem__(self, name):
+        # Propagate the undefined value if a caller accesses this as if it
+        # were a dictionary
+        return self
 
-        def __call__(self, *args, **kwargs):
-            return self
+    def __getattr__(self, name):
+        if name == 'name' or _is_dunder_name(name):
+            raise AttributeError(
+                "'{}' object has no attribute '{}'"
+                .format(type(self).__name__, name)
+            )
 
-    return ParserMacroCapture
+        self.package_name = self.name
+        self.name = name
 
+        return self
 
-def get_environment(node=None, capture_macros=False):
+    def __call__(self, *args, **kwargs):
+        return self
+
+
+def _make_environment(capture_macros):
     args = {
         'extensions': ['jinja2.ext.do']
     }
 
     if capture_macros:
-        args['undefined'] = create_macro_capture_env(node)
+        args['undefined'] = ParserMacroCapture
 
     args['extensions'].append(MaterializationExtension)
     args['extensions'].append(DocumentationExtension)
@@ -238,6 +301,27 @@ def get_environment(node=None, capture_macros=False):
     return MacroFuzzEnvironment(**args)
 
 
+_ENVIRONMENTS = {}
+_ENVIRONMENT_LOCK = threading.Lock()
+
+
+def get_environment(node=None, capture_macros=False):
+    """Get the shared environment for the given capture mode. Environments
+    are never modified after they are created, so they are safe to share.
+    Templates in the macro capturing environment find the node they are
+    rendering through `render_template`, so `node` is unused here.
+    """
+    capture_macros = bool(capture_macros)
+    env = _ENVIRONMENTS.get(capture_macros)
+    if env is None:
+        with _ENVIRONMENT_LOCK:
+            env = _ENVIRONMENTS.get(capture_macros)
+            if env is None:
+                env = _make_environment(capture_macros)
+                _ENVIRONMENTS[capture_macros] = env
+    return env
+
+
 def parse(string):
     try:
         return get_environment().parse(dbt.compat.to_string(string))
@@ -253,7 +337,12 @@ def get_template(string, ctx, node=None, capture_macros=False):
         env = get_environment(node, capture_macros)
 
         template_source = dbt.compat.to_string(string)
-        return env.from_string(template_source, globals=ctx)
+        key = dbt.utils.md5(template_source)
+        code = code_cache.get(key)
+        if code is None:
+            code = env.compile(template_source)
+            code_cache.set(key, code)
+        return env.template_class.from_code(env, code, env.make_globals(ctx))
 
     except (jinja2.exceptions.TemplateSyntaxError,
             jinja2.exceptions.UndefinedError) as e:
@@ -263,7 +352,8 @@ def get_template(string, ctx, node=None, capture_macros=False):
 
 def render_template(template, ctx, node=None):
     try:
-        return template.render(ctx)
+        with _rendering_node(node):
+            return template.render(ctx)
 
     except (jinja2.exceptions.TemplateSyntaxError,
             jinja2.exceptions.UndefinedError) as e:
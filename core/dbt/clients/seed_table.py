@@ -0,0 +1,325 @@
+import hashlib
+import json
+from contextlib import contextmanager
+from decimal import Decimal, getcontext
+
+import agate
+import six
+from agate.exceptions import CastError
+
+import dbt.clients.agate_helper
+import dbt.clients.columnar
+import dbt.compat
+import dbt.exceptions
+
+
+# the number of rows that column types are inferred from
+SAMPLE_ROWS = 100000
+# the number of distinct strings per column whose cast values are kept while
+# streaming rows, so repeated values are only parsed once
+CAST_CACHE_SIZE = 10000
+# the size of the blocks the file is read in to compute its checksum
+CHECKSUM_BLOCK_SIZE = 1024 * 1024
+
+
+class ColumnStats(object):
+    """Statistics over the values of a column of a SeedTable, gathered as its
+    rows are read so the aggregations that adapters run over each column
+    don't each read the file again.
+    """
+    def __init__(self):
+        self.has_nulls = False
+        self.max_length = 0
+        self.max_byte_length = 0
+        self._max_whole_places = 1
+        self._max_decimal_places = 0
+
+    def update(self, value):
+        if value is None:
+            self.has_nulls = True
+        elif isinstance(value, six.string_types):
+            length = len(value)
+            if length > self.max_length:
+                self.max_length = length
+            # utf-8 encodes a character in at most 4 bytes, so only encode
+            # values that could be longer than the longest seen so far
+            if 4 * length > self.max_byte_length:
+                byte_length = len(value.encode('utf-8'))
+                if byte_length > self.max_byte_length:
+                    self.max_byte_length = byte_length
+        elif isinstance(value, Decimal):
+            if value.is_nan() or value.is_infinite():
+                return
+            _, digits, exponent = value.normalize().as_tuple()
+            decimal_places = -exponent
+            whole_places = len(digits) - decimal_places
+            if whole_places > self._max_whole_places:
+                self._max_whole_places = whole_places
+            if decimal_places > self._max_decimal_places:
+                self._max_decimal_places = decimal_places
+
+    @property
+    def max_precision(self):
+        """The most decimal places of any value, as agate's MaxPrecision
+        computes it.
+        """
+        precision = getcontext().prec
+        if self._max_whole_places + self._max_decimal_places > precision:
+            return precision - self._max_whole_places
+        return self._max_decimal_places
+
+
+# the aggregations SeedTable.aggregate answers from the column stats, and
+# how to get their result from the stats of their column
+STATS_AGGREGATIONS = (
+    (dbt.clients.agate_helper.MaxByteLength,
+     lambda stats: Decimal(stats.max_byte_length)),
+    (agate.MaxLength, lambda stats: Decimal(stats.max_length)),
+    (agate.MaxPrecision, lambda stats: stats.max_precision),
+    (agate.HasNulls, lambda stats: stats.has_nulls),
+)
+
+
+class SeedColumn(object):
+    """A column of a SeedTable. Its values are read from the file each time
+    they're iterated over, and only its own values are cast.
+    """
+    def __init__(self, table, index):
+        self._table = table
+        self.index = index
+        self.name = table.column_names[index]
+        self.data_type = table.column_types[index]
+
+    def values(self):
+        for row in self._table.iter_rows([self.index]):
+            yield row[0]
+
+    def values_without_nulls(self):
+        for value in self.values():
+            if value is not None:
+                yield value
+
+
+class SeedColumns(object):
+    """The columns of a SeedTable, by index or by name."""
+    def __init__(self, table):
+        self._table = table
+
+    def __getitem__(self, key):
+        if isinstance(key, six.string_types):
+            key = self._table.column_names.index(key)
+        return SeedColumn(self._table, key)
+
+    def __len__(self):
+        return len(self._table.column_names)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield SeedColumn(self._table, index)
+
+
+class SeedRows(object):
+    """The rows of a SeedTable. They're read from the file and cast to their
+    column's types each time they're iterated over, so the whole seed is
+    never held in memory.
+    """
+    def __init__(self, table):
+        self._table = table
+
+    def __iter__(self):
+        return self._table.iter_rows()
+
+    def __len__(self):
+        return self._table.num_rows
+
+
+class SeedTable(object):
+    """A seed file, read a row at a time as it's loaded. Stands in for the
+    agate table of the seed in materializations and adapter methods, which
+    only need its column names and types, its rows and aggregations over
+    its columns.
+
+    Column types are inferred from the first `sample_rows` rows of the file,
+    the same way they are for agate tables. Columns with a type set in
+    column_overrides aren't inferred: their values are passed to the
+    database as text, to be converted to the type it was given.
+
+    :attr str original_abspath: The absolute path to the seed file.
+    :attr Dict[str, str] column_overrides: The database types configured for
+        columns of the seed, by column name.
+    """
+    def __init__(self, original_abspath, column_overrides=None,
+                 sample_rows=SAMPLE_ROWS):
+        self.original_abspath = original_abspath
+        self.column_overrides = column_overrides or {}
+        self.sample_rows = sample_rows
+        self._column_names = None
+        self._column_types = None
+        self._num_rows = None
+        self._column_stats = None
+
+    @contextmanager
+    def _reader(self):
+        with dbt.compat.open_file(self.original_abspath) as fp:
+            if fp.read(1) != dbt.clients.agate_helper.BOM:
+                fp.seek(0)
+            kwargs = {}
+            if six.PY2:
+                kwargs['encoding'] = 'utf-8'
+            reader = agate.csv.reader(fp, header=True, **kwargs)
+            column_names = next(reader, [])
+            yield column_names, reader
+
+    def read_sample(self):
+        """Read the header and the sample rows of the file, and infer the
+        column types from them. Raises a ValueError if a row has more values
+        than there are columns.
+        """
+        rows = []
+        with self._reader() as (column_names, reader):
+            for row in reader:
+                if len(rows) == self.sample_rows:
+                    break
+                rows.append(row)
+            else:
+                # the whole file was read
+                self._num_rows = len(rows)
+
+        column_types = [
+            dbt.clients.agate_helper.TEXT
+            if name in self.column_overrides else None
+            for name in column_names
+        ]
+        sample = dbt.clients.columnar.ColumnarTable.from_rows(
+            rows, column_names, column_types
+        )
+        self._column_names = sample.column_names
+        self._column_types = sample.column_types
+
+    @property
+    def column_names(self):
+        if self._column_names is None:
+            self.read_sample()
+        return self._column_names
+
+    @property
+    def column_types(self):
+        if self._column_types is None:
+            self.read_sample()
+        return self._column_types
+
+    @property
+    def num_rows(self):
+        if self._num_rows is None:
+            with self._reader() as (_, reader):
+                self._num_rows = sum(1 for _ in reader)
+        return self._num_rows
+
+    @property
+    def rows(self):
+        return SeedRows(self)
+
+    @property
+    def columns(self):
+        return SeedColumns(self)
+
+    def iter_rows(self, indexes=None, stats=None):
+        """Read each row of the file, cast to the column types, as a tuple.
+        If indexes is given, only the values of the columns at those indexes
+        are cast and returned. If stats is given, it has a ColumnStats for
+        each column returned, which is updated with each distinct value.
+        """
+        num_columns = len(self.column_names)
+        if indexes is None:
+            indexes = range(num_columns)
+        column_names = [self.column_names[i] for i in indexes]
+        column_types = [self.column_types[i] for i in indexes]
+        if stats is None:
+            stats = [None for _ in column_names]
+        padding = (None,) * num_columns
+        caches = [{} for _ in column_names]
+        with self._reader() as (_, reader):
+            for row_number, row in enumerate(reader, start=1):
+                if len(row) > num_columns:
+                    raise dbt.exceptions.RuntimeException(
+                        'Row {} of {} has {} values, but the seed only has '
+                        '{} columns.'.format(row_number,
+                                             self.original_abspath,
+                                             len(row), num_columns)
+                    )
+                row = tuple(row) + padding[len(row):]
+                row = [row[i] for i in indexes]
+                values = []
+                for name, column_type, cache, column_stats, value in zip(
+                        column_names, column_types, caches, stats, row):
+                    try:
+                        values.append(cache[value])
+                        continue
+                    except KeyError:
+                        pass
+                    try:
+                        cast = column_type.cast(value)
+                    except CastError as exc:
+                        raise dbt.exceptions.RuntimeException(
+                            'Could not read row {} of {}: {} The type of '
+                            'column "{}" was inferred from the first {} rows '
+                            'of the file. Set a type for it with the '
+                            'column_types config to load it as text.'
+                            .format(row_number, self.original_abspath, exc,
+                                    name, self.sample_rows)
+                        )
+                    if len(cache) >= CAST_CACHE_SIZE:
+                        cache.clear()
+                    cache[value] = cast
+                    if column_stats is not None:
+                        column_stats.update(cast)
+                    values.append(cast)
+                yield tuple(values)
+
+    def checksum(self):
+        """Return an md5 hex digest of the file's contents and the configured
+        column types. A seed whose checksum hasn't changed since it was last
+        loaded would load the same rows into the same table.
+        """
+        digest = hashlib.md5()
+        with open(self.original_abspath, 'rb') as fp:
+            for block in iter(lambda: fp.read(CHECKSUM_BLOCK_SIZE), b''):
+                digest.update(block)
+        overrides = json.dumps(self.column_overrides, sort_keys=True)
+        digest.update(overrides.encode('utf-8'))
+        return digest.hexdigest()
+
+    def column_stats(self):
+        """Return the ColumnStats of each column, reading the whole file once
+        the first time it's called.
+        """
+        if self._column_stats is None:
+            stats = [ColumnStats() for _ in self.column_names]
+            # the stats only change with values that haven't been seen, so
+            # they're updated as values are cast rather than for every row
+            self._num_rows = sum(1 for _ in self.iter_rows(stats=stats))
+            self._column_stats = stats
+        return self._column_stats
+
+    def aggregate(self, aggregation):
+        """Run an agate aggregation over the columns of the seed. The
+        aggregations in STATS_AGGREGATIONS are answered from the column
+        stats, others read the values of their column from the file.
+        """
+        aggregation.validate(self)
+        column_name = getattr(aggregation, '_column_name', None)
+        if column_name is not None:
+            for aggregation_type, result in STATS_AGGREGATIONS:
+                if type(aggregation) is aggregation_type:
+                    index = self.columns[column_name].index
+                    return result(self.column_stats()[index])
+        return aggregation.run(self)
+
+    def sample_table(self):
+        """Read the sample rows of the seed into an agate table."""
+        rows = []
+        for row in self.rows:
+            if len(rows) == self.sample_rows:
+                break
+            rows.append(row)
+        return agate.Table(rows, self.column_names, self.column_types)
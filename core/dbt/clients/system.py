@@ -7,6 +7,7 @@ import shutil
 import subprocess
 import sys
 import tarfile
+import tempfile
 import requests
 import stat
 
@@ -120,6 +121,46 @@ def write_file(path, contents=''):
     return True
 
 
+def _replace_file(src, dst):
+    """Rename src to dst, replacing dst if it exists. The replacement is
+    atomic, except on windows under python 2 where a file can't be renamed
+    over another one, so dst is removed first.
+    """
+    if hasattr(os, 'replace'):
+        os.replace(src, dst)
+        return
+    if os.name == 'nt' and os.path.exists(dst):
+        os.remove(dst)
+    os.rename(src, dst)
+
+
+def write_file_chunks(path, chunks):
+    """Write each string in chunks to the path. They are written to a
+    temporary file next to it that atomically replaces the path at the end,
+    so if producing the chunks fails, the file that was there before is left
+    alone, and readers never see a missing or partly written file.
+    """
+    dirname = os.path.dirname(path)
+    make_directory(dirname)
+    fd, tmp_path = tempfile.mkstemp(dir=dirname,
+                                    prefix=os.path.basename(path) + '.',
+                                    suffix='.tmp')
+    os.close(fd)
+    try:
+        dbt.compat.write_file_chunks(tmp_path, chunks)
+        # mkstemp only lets the owner read the file
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o644)
+        _replace_file(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
+
+
 def write_json(path, data):
     return write_file(path, json.dumps(data, cls=dbt.utils.JSONEncoder))
 
@@ -89,6 +89,19 @@ def write_file(path, s):
         return f.write(to_string(s))
 
 
+def write_file_chunks(path, chunks):
+    """Write each string in chunks to the path in turn, utf-8 encoded, so the
+    full contents never have to be held in memory.
+    """
+    if WHICH_PYTHON == 2:
+        open = codecs.open
+    else:
+        open = builtins.open
+    with open(path, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(to_string(chunk))
+
+
 def open_file(path):
     """Open the path for reading. It must be utf-8 encoded."""
     if WHICH_PYTHON == 2:
@@ -85,7 +85,7 @@ def recursively_prepend_ctes(model, manifest):
 
     model.prepend_ctes(prepended_ctes)
 
-    manifest.nodes[model.unique_id] = model
+    manifest.update_node(model)
 
     return (model, prepended_ctes, manifest)
 
@@ -158,7 +158,7 @@ class Compiler(object):
     def write_graph_file(self, linker, manifest):
         filename = graph_file_name
         graph_path = os.path.join(self.config.target_path, filename)
-        linker.write_graph(graph_path, manifest)
+        linker.write_graph(graph_path, manifest, full=dbt.flags.FULL_GRAPH)
 
     def link_node(self, linker, node, manifest):
         linker.add_node(node.unique_id)
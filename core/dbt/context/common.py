@@ -1,5 +1,6 @@
 import json
 import os
+from collections import Mapping
 
 from dbt.adapters.factory import get_adapter
 from dbt.compat import basestring
@@ -84,44 +85,122 @@ class BaseResolver(object):
         return self.db_wrapper.Relation
 
 
-def _add_macro_map(context, package_name, macro_map):
-    """Update an existing context in-place, adding the given macro map to the
-    appropriate package namespace. Adapter packages get inserted into the
-    global namespace.
+class MacroBinder(object):
+    """Bind macros to a context on first use. Each macro is bound at most once
+    per context, however many names it is reachable under.
     """
-    key = package_name
-    if package_name in PACKAGES:
-        key = GLOBAL_PROJECT_NAME
-    if key not in context:
-        context[key] = {}
+    def __init__(self, context, macros):
+        self.context = context
+        self.macros = macros
+        self._bound = {}
 
-    context[key].update(macro_map)
+    def get(self, unique_id):
+        bound = self._bound.get(unique_id)
+        if bound is None:
+            bound = self.macros[unique_id].generator(self.context)
+            self._bound[unique_id] = bound
+        return bound
 
 
-def _add_macros(context, model, manifest):
-    macros_to_add = {'global': [], 'local': []}
+class MacroNamespace(Mapping):
+    """A package's macros, as they appear in the context (`dbt_utils.foo()`).
+    Macros are only bound to the context when they are looked up.
+    """
+    def __init__(self, binder, unique_ids):
+        self._binder = binder
+        self._unique_ids = unique_ids
+
+    def __getitem__(self, name):
+        return self._binder.get(self._unique_ids[name])
+
+    def __iter__(self):
+        return iter(self._unique_ids)
+
+    def __len__(self):
+        return len(self._unique_ids)
+
 
-    for unique_id, macro in manifest.macros.items():
-        if macro.resource_type != NodeType.Macro:
-            continue
-        package_name = macro.package_name
+class LazyMacro(object):
+    """A macro in the top level of the context, bound on its first call."""
+    __slots__ = ('_binder', '_unique_id')
 
-        macro_map = {
-            macro.name: macro.generator(context)
-        }
+    def __init__(self, binder, unique_id):
+        self._binder = binder
+        self._unique_id = unique_id
 
-        # adapter packages are part of the global project space
-        _add_macro_map(context, package_name, macro_map)
+    def __call__(self, *args, **kwargs):
+        return self._binder.get(self._unique_id)(*args, **kwargs)
+
+
+class MacroIndex(object):
+    """The macros in a manifest, grouped the way contexts need them. This
+    only depends on the manifest's macros, so it is built once and shared by
+    every context.
+    """
+    def __init__(self, macros):
+        self.macros = macros
+        self.size = len(macros)
+        # namespace name -> {macro name: unique ID}. Adapter packages are part
+        # of the global project's namespace.
+        self.namespaces = {}
+        # (package name, macro name, unique ID) for every macro, in manifest
+        # order
+        self.entries = []
+        self._unprefixed = {}
+
+        for unique_id, macro in macros.items():
+            if macro.resource_type != NodeType.Macro:
+                continue
+            package_name = macro.package_name
+            key = package_name
+            if package_name in PACKAGES:
+                key = GLOBAL_PROJECT_NAME
+            self.namespaces.setdefault(key, {})[macro.name] = unique_id
+            self.entries.append((package_name, macro.name, unique_id))
+
+    def unprefixed(self, package_name):
+        """Get the macros available without a package prefix to nodes in the
+        given package: global macros first, then the package's own macros,
+        which take precedence.
+        """
+        found = self._unprefixed.get(package_name)
+        if found is None:
+            global_macros = {}
+            local_macros = {}
+            for macro_package, name, unique_id in self.entries:
+                if macro_package == package_name:
+                    local_macros[name] = unique_id
+                elif macro_package in PACKAGES:
+                    global_macros[name] = unique_id
+            found = global_macros
+            found.update(local_macros)
+            self._unprefixed[package_name] = found
+        return found
+
+
+_MACRO_INDEX = None
+
+
+def _get_macro_index(macros):
+    global _MACRO_INDEX
+    index = _MACRO_INDEX
+    if index is None or index.macros is not macros or \
+            index.size != len(macros):
+        index = MacroIndex(macros)
+        _MACRO_INDEX = index
+    return index
+
+
+def _add_macros(context, model, manifest):
+    index = _get_macro_index(manifest.macros)
+    binder = MacroBinder(context, manifest.macros)
 
-        if package_name == model.package_name:
-            macros_to_add['local'].append(macro_map)
-        elif package_name in PACKAGES:
-            macros_to_add['global'].append(macro_map)
+    for key, unique_ids in index.namespaces.items():
+        if key not in context:
+            context[key] = MacroNamespace(binder, unique_ids)
 
-    # Load global macros before local macros -- local takes precedence
-    unprefixed_macros = macros_to_add['global'] + macros_to_add['local']
-    for macro_map in unprefixed_macros:
-        context.update(macro_map)
+    for name, unique_id in index.unprefixed(model.package_name).items():
+        context[name] = LazyMacro(binder, unique_id)
 
     return context
 
@@ -399,7 +478,7 @@ def generate_base(model, model_dict, config, manifest, source_config,
         "execute": provider.execute,
         "flags": dbt.flags,
         # TODO: Do we have to leave this in?
-        "graph": manifest.to_flat_graph(),
+        "graph": manifest.get_flat_graph(),
         "log": log,
         "model": model_dict,
         "modules": get_context_modules(),
@@ -171,6 +171,8 @@ def _inject_ctes_into_sql(sql, ctes):
 
 
 class CompiledNode(ParsedNode):
+    __slots__ = ()
+
     SCHEMA = COMPILED_NODE_CONTRACT
 
     def prepend_ctes(self, prepended_ctes):
@@ -6,9 +6,16 @@ from dbt.contracts.graph.compiled import COMPILED_NODE_CONTRACT, CompiledNode
 from dbt.exceptions import raise_duplicate_resource_name
 from dbt.node_types import NodeType
 from dbt.logger import GLOBAL_LOGGER as logger
+from dbt.version import __version__ as dbt_version
 from dbt import tracking
+import dbt.clients.system
+import dbt.exceptions
 import dbt.utils
 
+import os
+import pickle
+import threading
+
 # We allow either parsed or compiled nodes, or parsed sources, as some
 # 'compile()' calls in the runner actually just return the original parsed
 # node they were given.
@@ -138,6 +145,8 @@ PARSED_MANIFEST_CONTRACT = {
 
 
 class CompileResultNode(CompiledNode):
+    __slots__ = ()
+
     SCHEMA = COMPILE_RESULT_NODE_CONTRACT
 
 
@@ -163,6 +172,99 @@ def build_edges(nodes):
     return _sort_values(forward_edges), _sort_values(backward_edges)
 
 
+def _node_index_key(unique_id, node):
+    return dbt.utils.split_unique_id(unique_id, node)
+
+
+def _doc_index_key(unique_id, doc):
+    parts = unique_id.split('.')
+    if len(parts) != 2:
+        msg = "documentation names cannot contain '.' characters"
+        dbt.exceptions.raise_compiler_error(msg, doc)
+    package_name, name = parts
+    return NodeType.Documentation, package_name, name
+
+
+def _disabled_index_key(position, node):
+    return dbt.utils.split_unique_id(node.get('unique_id'), node)
+
+
+class NameIndex(object):
+    """An index over one of the manifest's collections that maps
+    (resource_type, package_name, name) to the location of the matching entry,
+    so name lookups don't have to scan the entire collection.
+
+    Entries are indexed under both their own package name and under `None`
+    (any package). Where several entries share a key, the first one in
+    iteration order wins, which matches the old linear scan. The index stores
+    keys into the collection (unique IDs, or list positions for the disabled
+    list) rather than the entries themselves, so replacing an entry in place
+    does not invalidate it. Adding entries does: callers that add entries
+    should call `clear()`, and as a safety net the index is rebuilt if the
+    collection changes size or a stored key goes missing.
+    """
+    def __init__(self, key_func):
+        self.key_func = key_func
+        self._index = None
+        self._size = None
+
+    def clear(self):
+        self._index = None
+        self._size = None
+
+    @staticmethod
+    def _iter_entries(collection):
+        if isinstance(collection, dict):
+            return collection.items()
+        return enumerate(collection)
+
+    def _build(self, collection):
+        index = {}
+        for position, (key, value) in \
+                enumerate(self._iter_entries(collection)):
+            resource_type, package_name, name = self.key_func(key, value)
+            entry = (position, key)
+            index.setdefault((resource_type, package_name, name), entry)
+            index.setdefault((resource_type, None, name), entry)
+        self._index = index
+        self._size = len(collection)
+
+    def _lookup(self, name, package, nodetypes):
+        found = None
+        for resource_type in nodetypes:
+            entry = self._index.get((resource_type, package, name))
+            if entry is not None and (found is None or entry < found):
+                found = entry
+        return found
+
+    def find(self, collection, name, package, nodetypes):
+        """Find the first entry in collection with the given name and one of
+        the given resource types, in the given package (or any package if
+        package is None).
+        """
+        if self._index is None or self._size != len(collection):
+            self._build(collection)
+
+        found = self._lookup(name, package, nodetypes)
+        if found is not None and isinstance(collection, dict) and \
+                found[1] not in collection:
+            self._build(collection)
+            found = self._lookup(name, package, nodetypes)
+
+        if found is None:
+            return None
+        return collection[found[1]]
+
+
+def _serialized_items(collection):
+    for key, value in collection.items():
+        yield key, dbt.utils.json_chunks(value.serialize())
+
+
+# guards building and updating every manifest's memoized flat graph
+_FLAT_GRAPH_LOCK = threading.Lock()
+
+
 class Manifest(APIObject):
     SCHEMA = PARSED_MANIFEST_CONTRACT
     """The manifest for the full graph, after parsing and during compilation.
@@ -170,6 +272,9 @@ class Manifest(APIObject):
     the current state of the compiler. Macros will always be ParsedMacros and
     docs will always be ParsedDocumentations.
     """
+    # bump this whenever the pickled contents of a binary manifest change
+    BINARY_FORMAT_VERSION = 1
+
     def __init__(self, nodes, macros, docs, generated_at, disabled,
                  config=None):
         """The constructor. nodes and macros are dictionaries mapping unique
@@ -185,6 +290,12 @@ class Manifest(APIObject):
         self.generated_at = generated_at
         self.metadata = metadata
         self.disabled = disabled
+        self._node_index = NameIndex(_node_index_key)
+        self._macro_index = NameIndex(_node_index_key)
+        self._doc_index = NameIndex(_doc_index_key)
+        self._disabled_index = NameIndex(_disabled_index_key)
+        self._flat_graph = None
+        self._relation_index = None
         super(Manifest, self).__init__()
 
     @staticmethod
@@ -223,9 +334,84 @@ class Manifest(APIObject):
             'disabled': [v.serialize() for v in self.disabled],
         }
 
+    def _json_chunks(self):
+        forward_edges, backward_edges = build_edges(self.nodes.values())
+        json_chunks = dbt.utils.json_chunks
+        json_object_chunks = dbt.utils.json_object_chunks
+
+        return json_object_chunks([
+            ('nodes', json_object_chunks(_serialized_items(self.nodes))),
+            ('macros', json_object_chunks(_serialized_items(self.macros))),
+            ('docs', json_object_chunks(_serialized_items(self.docs))),
+            ('parent_map', json_chunks(backward_edges)),
+            ('child_map', json_chunks(forward_edges)),
+            ('generated_at', json_chunks(self.generated_at)),
+            ('metadata', json_chunks(self.metadata)),
+            ('disabled', dbt.utils.json_list_chunks(
+                v.serialize() for v in self.disabled
+            )),
+        ])
+
+    def write(self, path):
+        """Write the manifest to path as JSON. The output is the same as
+        writing out `serialize()`, but each node is serialized only as it's
+        written, so the whole manifest is never held in memory as a dict.
+        """
+        dbt.clients.system.write_file_chunks(path, self._json_chunks())
+
+    def write_binary(self, path, fingerprint=None):
+        """Write the manifest to path as a versioned pickle, which
+        `read_binary` loads much faster than the project can be parsed.
+        fingerprint identifies the state of the project the manifest was
+        parsed from.
+        """
+        data = {
+            'format_version': self.BINARY_FORMAT_VERSION,
+            'dbt_version': dbt_version,
+            'fingerprint': fingerprint,
+            'nodes': self.nodes,
+            'macros': self.macros,
+            'docs': self.docs,
+            'generated_at': self.generated_at,
+            'metadata': self.metadata,
+            'disabled': self.disabled,
+        }
+        dbt.clients.system.make_directory(os.path.dirname(path))
+        with open(path, 'wb') as fp:
+            pickle.dump(data, fp, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def read_binary(cls, path, fingerprint=None):
+        """Load a manifest written by `write_binary`. Raise a
+        RuntimeException if it was written by a different version of dbt, or
+        if fingerprint is given and it was written with a different one.
+        """
+        with open(path, 'rb') as fp:
+            data = pickle.load(fp)
+
+        if data.get('format_version') != cls.BINARY_FORMAT_VERSION or \
+                data.get('dbt_version') != dbt_version:
+            raise dbt.exceptions.RuntimeException(
+                'The manifest at {} was written by a different version of '
+                'dbt ({}), and must be generated again'
+                .format(path, data.get('dbt_version'))
+            )
+
+        if fingerprint is not None and data.get('fingerprint') != fingerprint:
+            raise dbt.exceptions.RuntimeException(
+                'The manifest at {} was written before the project last '
+                'changed, and must be generated again'.format(path)
+            )
+
+        manifest = cls(nodes=data['nodes'], macros=data['macros'],
+                       docs=data['docs'], generated_at=data['generated_at'],
+                       disabled=data['disabled'])
+        manifest.metadata = data['metadata']
+        return manifest
+
     def find_disabled_by_name(self, name, package=None):
-        return dbt.utils.find_in_list_by_name(self.disabled, name, package,
-                                              NodeType.refable())
+        return self._disabled_index.find(self.disabled, name, package,
+                                         NodeType.refable())
 
     def _find_by_name(self, name, package, subgraph, nodetype):
         """
@@ -235,31 +421,18 @@ class Manifest(APIObject):
         nodetype should be a list of NodeTypes to accept.
         """
         if subgraph == 'nodes':
-            search = self.nodes
+            return self._node_index.find(self.nodes, name, package, nodetype)
         elif subgraph == 'macros':
-            search = self.macros
+            return self._macro_index.find(self.macros, name, package,
+                                          nodetype)
         else:
             raise NotImplementedError(
                 'subgraph search for {} not implemented'.format(subgraph)
             )
-        return dbt.utils.find_in_subgraph_by_name(
-            search,
-            name,
-            package,
-            nodetype)
 
     def find_docs_by_name(self, name, package=None):
-        for unique_id, doc in self.docs.items():
-            parts = unique_id.split('.')
-            if len(parts) != 2:
-                msg = "documentation names cannot contain '.' characters"
-                dbt.exceptions.raise_compiler_error(msg, doc)
-
-            found_package, found_node = parts
-
-            if (name == found_node and package in {None, found_package}):
-                return doc
-        return None
+        return self._doc_index.find(self.docs, name, package,
+                                    [NodeType.Documentation])
 
     def find_macro_by_name(self, name, package):
         """Find a macro in the graph by its name and package name, or None for
@@ -340,11 +513,36 @@ class Manifest(APIObject):
         their unique_ids. A schema and table may have more than one
         match if the relation matches both a source and a seed, for instance.
         """
-        def predicate(model):
-            return self._model_matches_schema_and_table(schema, table, model)
+        index = self._relation_index
+        if index is None or index[0] != len(self.nodes):
+            index = self._build_relation_index()
+
+        unique_ids = index[1].get((schema.lower(), table.lower()), [])
+        if any(self.nodes.get(u) is None or not
+               self._model_matches_schema_and_table(schema, table,
+                                                    self.nodes[u])
+               for u in unique_ids):
+            # a node was replaced with one under a different name
+            unique_ids = self._build_relation_index()[1].get(
+                (schema.lower(), table.lower()), []
+            )
+        return list(unique_ids)
 
-        matching = list(self._filter_subgraph(self.nodes, predicate))
-        return [match.get('unique_id') for match in matching]
+    def _build_relation_index(self):
+        """Index the unique IDs of the nodes by their lowercased schema and
+        relation name, in the order `_model_matches_schema_and_table` would
+        find them in a scan of the nodes.
+        """
+        index = {}
+        for unique_id, node in self.nodes.items():
+            if node.resource_type == NodeType.Source:
+                name = node.identifier
+            else:
+                name = node.alias
+            key = (node.schema.lower(), name.lower())
+            index.setdefault(key, []).append(unique_id)
+        self._relation_index = (len(self.nodes), index)
+        return self._relation_index
 
     def add_nodes(self, new_nodes):
         """Add the given dict of new nodes to the manifest."""
@@ -352,6 +550,19 @@ class Manifest(APIObject):
             if unique_id in self.nodes:
                 raise_duplicate_resource_name(node, self.nodes[unique_id])
             self.nodes[unique_id] = node
+        self._node_index.clear()
+        self._relation_index = None
+        self.invalidate_flat_graph()
+
+    def update_node(self, node):
+        """Replace the node with the same unique ID as the given node, keeping
+        the memoized flat graph up to date.
+        """
+        with _FLAT_GRAPH_LOCK:
+            self.nodes[node.unique_id] = node
+            if self._flat_graph is not None:
+                self._flat_graph['nodes'][node.unique_id] = \
+                    node.to_shallow_dict()
 
     def patch_nodes(self, patches):
         """Patch nodes with the given dict of patches. Note that this consumes
@@ -368,6 +579,8 @@ class Manifest(APIObject):
             if not patch:
                 continue
             node.patch(patch)
+        self._node_index.clear()
+        self.invalidate_flat_graph()
 
         # log debug-level warning about nodes we couldn't find
         if patches:
@@ -395,6 +608,28 @@ class Manifest(APIObject):
             'macros': self.macros,
         }
 
+    def get_flat_graph(self):
+        """Get the flat graph, building it on first use and reusing it until
+        the manifest changes. The result is shared by every caller, so it
+        must not be modified.
+
+        Nodes replaced with `update_node` are updated in place. Code that
+        changes nodes in any other way must call `invalidate_flat_graph`,
+        though as a safety net the flat graph is rebuilt if the number of
+        nodes changes.
+        """
+        with _FLAT_GRAPH_LOCK:
+            flat_graph = self._flat_graph
+            if flat_graph is None or \
+                    len(flat_graph['nodes']) != len(self.nodes) or \
+                    flat_graph['macros'] is not self.macros:
+                flat_graph = self.to_flat_graph()
+                self._flat_graph = flat_graph
+            return flat_graph
+
+    def invalidate_flat_graph(self):
+        self._flat_graph = None
+
     def __getattr__(self, name):
         raise AttributeError("'{}' object has no attribute '{}'".format(
             type(self).__name__, name)
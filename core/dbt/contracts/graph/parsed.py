@@ -347,6 +347,8 @@ PARSED_NODE_CONTRACT = deep_merge(
 
 
 class ParsedNode(APIObject):
+    __slots__ = ('agate_table',)
+
     SCHEMA = PARSED_NODE_CONTRACT
 
     def __init__(self, agate_table=None, **kwargs):
@@ -519,6 +521,8 @@ PARSED_SNAPSHOT_NODE_CONTRACT = deep_merge(
 
 
 class ParsedSnapshotNode(ParsedNode):
+    __slots__ = ()
+
     SCHEMA = PARSED_SNAPSHOT_NODE_CONTRACT
 
 
@@ -563,6 +567,8 @@ PARSED_NODE_PATCH_CONTRACT = {
 
 
 class ParsedNodePatch(APIObject):
+    __slots__ = ()
+
     SCHEMA = PARSED_NODE_PATCH_CONTRACT
 
 
@@ -626,6 +632,8 @@ PARSED_MACRO_CONTRACT = deep_merge(
 
 
 class ParsedMacro(APIObject):
+    __slots__ = ()
+
     SCHEMA = PARSED_MACRO_CONTRACT
 
     @property
@@ -684,10 +692,14 @@ NODE_EDGE_MAP = {
 
 
 class ParsedDocumentation(APIObject):
+    __slots__ = ()
+
     SCHEMA = PARSED_DOCUMENTATION_CONTRACT
 
 
 class Hook(APIObject):
+    __slots__ = ()
+
     SCHEMA = HOOK_CONTRACT
 
 
@@ -786,6 +798,8 @@ PARSED_SOURCE_DEFINITION_CONTRACT = deep_merge(
 
 
 class ParsedSourceDefinition(APIObject):
+    __slots__ = ()
+
     SCHEMA = PARSED_SOURCE_DEFINITION_CONTRACT
     is_ephemeral_model = False
 
@@ -213,7 +213,20 @@ EXECUTION_RESULT_CONTRACT = {
                 'The time elapsed from before_run to after_run (hooks are not '
                 'included)'
             ),
-        }
+        },
+        'connection_pool': {
+            'type': 'object',
+            'description': (
+                'What the connection pool did over the run: how many times a '
+                'connection was acquired and reused, opened, closed and '
+                'evicted after being idle, how many idle connections failed '
+                'their health check, how often and how long threads waited '
+                'for a connection, and the most connections open at once.'
+            ),
+            'additionalProperties': {
+                'type': 'number',
+            },
+        },
     },
     'required': ['results', 'generated_at', 'elapsed_time'],
 }
@@ -223,11 +236,14 @@ class ExecutionResult(APIObject):
     SCHEMA = EXECUTION_RESULT_CONTRACT
 
     def serialize(self):
-        return {
+        serialized = {
             'results': [r.serialize() for r in self.results],
             'generated_at': self.generated_at,
             'elapsed_time': self.elapsed_time,
         }
+        if 'connection_pool' in self:
+            serialized['connection_pool'] = self.connection_pool
+        return serialized
 
 
 SOURCE_FRESHNESS_RESULT_CONTRACT = deep_merge(PARTIAL_RESULT_CONTRACT, {
@@ -509,6 +525,13 @@ REMOTE_RUN_RESULT_CONTRACT = deep_merge(REMOTE_COMPILE_RESULT_CONTRACT, {
                     'type': 'array',
                     # any item type is ok
                 },
+                'truncated': {
+                    'type': 'boolean',
+                    'description': (
+                        'True if the query returned more rows than the '
+                        'request\'s max_rows, and only that many are in rows.'
+                    ),
+                },
             },
             'required': ['rows', 'column_names'],
         },
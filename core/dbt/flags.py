@@ -3,20 +3,48 @@ FULL_REFRESH = False
 USE_CACHE = True
 WARN_ERROR = False
 TEST_NEW_PARSER = False
+PARTIAL_PARSE = False
+PARSE_PROCESSES = None
+MANIFEST_FORMAT = 'json'
+RELATION_CACHE_TTL = None
+REFRESH_RELATION_CACHE = False
+SKIP_UNCHANGED_SEEDS = False
+CONNECTION_POOL_MIN = 0
+CONNECTION_POOL_MAX = None
+CONNECTION_IDLE_TIMEOUT = None
+FULL_GRAPH = False
 
 
 def reset():
-    global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, TEST_NEW_PARSER
+    global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, \
+        TEST_NEW_PARSER, PARTIAL_PARSE, PARSE_PROCESSES, MANIFEST_FORMAT, \
+        RELATION_CACHE_TTL, REFRESH_RELATION_CACHE, SKIP_UNCHANGED_SEEDS, \
+        CONNECTION_POOL_MIN, CONNECTION_POOL_MAX, CONNECTION_IDLE_TIMEOUT, \
+        FULL_GRAPH
 
     STRICT_MODE = False
     FULL_REFRESH = False
     USE_CACHE = True
     WARN_ERROR = False
     TEST_NEW_PARSER = False
+    PARTIAL_PARSE = False
+    PARSE_PROCESSES = None
+    MANIFEST_FORMAT = 'json'
+    RELATION_CACHE_TTL = None
+    REFRESH_RELATION_CACHE = False
+    SKIP_UNCHANGED_SEEDS = False
+    CONNECTION_POOL_MIN = 0
+    CONNECTION_POOL_MAX = None
+    CONNECTION_IDLE_TIMEOUT = None
+    FULL_GRAPH = False
 
 
 def set_from_args(args):
-    global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, TEST_NEW_PARSER
+    global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, \
+        TEST_NEW_PARSER, PARTIAL_PARSE, PARSE_PROCESSES, MANIFEST_FORMAT, \
+        RELATION_CACHE_TTL, REFRESH_RELATION_CACHE, SKIP_UNCHANGED_SEEDS, \
+        CONNECTION_POOL_MIN, CONNECTION_POOL_MAX, CONNECTION_IDLE_TIMEOUT, \
+        FULL_GRAPH
     USE_CACHE = getattr(args, 'use_cache', True)
 
     FULL_REFRESH = getattr(args, 'full_refresh', False)
@@ -27,3 +55,13 @@ def set_from_args(args):
     )
 
     TEST_NEW_PARSER = getattr(args, 'test_new_parser', False)
+    PARTIAL_PARSE = getattr(args, 'partial_parse', False)
+    PARSE_PROCESSES = getattr(args, 'parse_processes', None)
+    MANIFEST_FORMAT = getattr(args, 'manifest_format', 'json')
+    RELATION_CACHE_TTL = getattr(args, 'relation_cache_ttl', None)
+    REFRESH_RELATION_CACHE = getattr(args, 'refresh_relation_cache', False)
+    SKIP_UNCHANGED_SEEDS = getattr(args, 'skip_unchanged', False)
+    CONNECTION_POOL_MIN = getattr(args, 'connection_pool_min', 0)
+    CONNECTION_POOL_MAX = getattr(args, 'connection_pool_max', None)
+    CONNECTION_IDLE_TIMEOUT = getattr(args, 'connection_idle_timeout', None)
+    FULL_GRAPH = getattr(args, 'full_graph', False)
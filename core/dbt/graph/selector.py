@@ -1,4 +1,6 @@
-import networkx as nx
+import re
+import weakref
+
 from dbt.logger import GLOBAL_LOGGER as logger
 
 from dbt.utils import is_enabled, get_materialization, coalesce
@@ -11,6 +13,16 @@ SELECTOR_GLOB = '*'
 SELECTOR_CHILDREN_AND_ANCESTORS = '@'
 SELECTOR_DELIMITER = ':'
 
+# an optional depth, like 2+model or model+3
+SELECTOR_PARENTS_RE = re.compile(r'^(\d*)\+')
+SELECTOR_CHILDREN_RE = re.compile(r'\+(\d*)$')
+
+
+def _max_depth(digits):
+    if digits:
+        return int(digits)
+    return None
+
 
 class SelectionCriteria(object):
     def __init__(self, node_spec):
@@ -18,19 +30,25 @@ class SelectionCriteria(object):
         self.select_children = False
         self.select_parents = False
         self.select_childrens_parents = False
+        self.select_parents_max_depth = None
+        self.select_children_max_depth = None
         self.selector_type = SELECTOR_FILTERS.FQN
 
         if node_spec.startswith(SELECTOR_CHILDREN_AND_ANCESTORS):
             self.select_childrens_parents = True
             node_spec = node_spec[1:]
 
-        if node_spec.startswith(SELECTOR_PARENTS):
+        match = SELECTOR_PARENTS_RE.match(node_spec)
+        if match is not None:
             self.select_parents = True
-            node_spec = node_spec[1:]
+            self.select_parents_max_depth = _max_depth(match.group(1))
+            node_spec = node_spec[match.end():]
 
-        if node_spec.endswith(SELECTOR_CHILDREN):
+        match = SELECTOR_CHILDREN_RE.search(node_spec)
+        if match is not None:
             self.select_children = True
-            node_spec = node_spec[:-1]
+            self.select_children_max_depth = _max_depth(match.group(1))
+            node_spec = node_spec[:match.start()]
 
         if self.select_children and self.select_childrens_parents:
             raise dbt.exceptions.RuntimeException(
@@ -114,6 +132,130 @@ def _node_is_match(qualified_name, package_names, fqn):
     return False
 
 
+class _FqnTrie(object):
+    """A trie over the fqns of the nodes in a graph. Each entry holds every
+    node whose fqn starts with the entry's path, and those nodes by name, so
+    a qualified name selector is matched by walking down it once instead of
+    checking every node.
+    """
+    def __init__(self):
+        self.children = {}
+        self.nodes = set()
+        self.by_name = {}
+
+    def add(self, fqn, node):
+        entry = self
+        for depth in range(len(fqn) + 1):
+            entry.nodes.add(node)
+            entry.by_name.setdefault(fqn[-1], set()).add(node)
+            if depth == len(fqn):
+                break
+            entry = entry.children.setdefault(fqn[depth], _FqnTrie())
+
+    def select(self, node_selector):
+        """Return the nodes that is_selected_node would select with
+        node_selector, starting from this entry.
+        """
+        selected = set()
+        entry = self
+        for i, selector_part in enumerate(node_selector):
+            if selector_part == SELECTOR_GLOB:
+                selected.update(entry.nodes)
+                return selected
+            if i == len(node_selector) - 1:
+                selected.update(entry.by_name.get(selector_part, ()))
+            entry = entry.children.get(selector_part)
+            if entry is None:
+                return selected
+        selected.update(entry.nodes)
+        return selected
+
+
+class SelectorIndex(object):
+    """Indexes of the nodes in a graph, for looking up the nodes that
+    fqn, tag and source selectors match without scanning every node.
+
+    :attr Set[str] package_names: The names of the packages in the graph.
+    """
+    def __init__(self, graph, manifest):
+        self.package_names = get_package_names(graph)
+        self._fqns = _FqnTrie()
+        self._tags = {}
+        self._sources = {}
+        for node in graph.nodes():
+            real_node = manifest.nodes[node]
+            if real_node.resource_type == NodeType.Source:
+                self._sources.setdefault(real_node.source_name, []).append(
+                    (node, real_node)
+                )
+                continue
+            self._fqns.add(real_node.fqn, node)
+            for tag in real_node.tags:
+                self._tags.setdefault(tag, set()).add(node)
+
+    def nodes_by_qualified_name(self, qualified_name):
+        """The non-source nodes that `_node_is_match` matches with
+        qualified_name.
+        """
+        selected = set()
+        if len(qualified_name) == 1:
+            selected.update(self._fqns.by_name.get(qualified_name[0], ()))
+
+        if qualified_name[0] in self.package_names:
+            selected.update(self._fqns.select(qualified_name))
+
+        for package_name in self.package_names:
+            entry = self._fqns.children.get(package_name)
+            if entry is not None:
+                selected.update(entry.select(qualified_name))
+        return selected
+
+    def nodes_by_tag(self, tag_name):
+        return self._tags.get(tag_name, set())
+
+    def sources(self, source_name):
+        """Yield (unique ID, node) for each source with the given source name,
+        or every source if it's SELECTOR_GLOB.
+        """
+        if source_name == SELECTOR_GLOB:
+            for sources in self._sources.values():
+                for source in sources:
+                    yield source
+        else:
+            for source in self._sources.get(source_name, ()):
+                yield source
+
+
+def _traverse(neighbors, nodes, max_depth=None):
+    """Breadth-first search from all of nodes at once, so shared lineage is
+    only walked once.
+
+    :param Callable[[str], Iterable[str]] neighbors: Given a node, return the
+        nodes one step away, like graph.successors.
+    :param Iterable[str] nodes: The nodes to start from.
+    :param Optional[int] max_depth: If set, stop this many steps away from
+        the nearest of nodes.
+    :return Set[str]: Every node reached, which is the union of what
+        nx.descendants or nx.ancestors would find from each of nodes. A
+        starting node is only included if another one reaches it.
+    """
+    found = set()
+    seen = set(nodes)
+    frontier = list(seen)
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbor in neighbors(node):
+                found.add(neighbor)
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return found
+
+
 def warn_if_useless_spec(spec, nodes):
     if len(nodes) > 0:
         return
@@ -129,6 +271,18 @@ class NodeSelector(object):
     def __init__(self, linker, manifest):
         self.linker = linker
         self.manifest = manifest
+        self._index = None
+        self._traversals = weakref.WeakKeyDictionary()
+
+    @property
+    def index(self):
+        """The SelectorIndex of the linker's graph, built the first time it's
+        needed. Selection on any subgraph of the linker's graph uses it, and
+        keeps only the nodes in the subgraph.
+        """
+        if self._index is None:
+            self._index = SelectorIndex(self.linker.graph, self.manifest)
+        return self._index
 
     def _node_iterator(self, graph, exclude, include):
         for node in graph.nodes():
@@ -157,15 +311,14 @@ class NodeSelector(object):
         :param str qualified_name_selector: The selector or node name
         """
         qualified_name = qualified_name_selector.split(".")
-        package_names = get_package_names(graph)
-        for node, real_node in self.parsed_nodes(graph):
-            if _node_is_match(qualified_name, package_names, real_node.fqn):
+        for node in self.index.nodes_by_qualified_name(qualified_name):
+            if node in graph:
                 yield node
 
     def get_nodes_by_tag(self, graph, tag_name):
         """ yields nodes from graph that have the specified tag """
-        for node, real_node in self.parsed_nodes(graph):
-            if tag_name in real_node.tags:
+        for node in self.index.nodes_by_tag(tag_name):
+            if node in graph:
                 yield node
 
     def get_nodes_by_source(self, graph, source_full_name):
@@ -187,7 +340,9 @@ class NodeSelector(object):
             ).format(source_full_name)
             raise dbt.exceptions.RuntimeException(msg)
 
-        for node, real_node in self.source_nodes(graph):
+        for node, real_node in self.index.sources(target_source):
+            if node not in graph:
+                continue
             if target_package not in (real_node.package_name, SELECTOR_GLOB):
                 continue
             if target_source not in (real_node.source_name, SELECTOR_GLOB):
@@ -195,30 +350,41 @@ class NodeSelector(object):
             if target_table in (None, real_node.name, SELECTOR_GLOB):
                 yield node
 
+    def _traverse(self, graph, neighbors, selected, max_depth):
+        """Traverse graph from selected, remembering the result for the
+        lifetime of graph. The graph must not change while it's used for
+        selection.
+        """
+        key = (neighbors, frozenset(selected), max_depth)
+        traversals = self._traversals.setdefault(graph, {})
+        if key not in traversals:
+            traversals[key] = frozenset(_traverse(
+                getattr(graph, neighbors), key[1], max_depth
+            ))
+        return traversals[key]
+
     def select_childrens_parents(self, graph, selected):
         ancestors_for = self.select_children(graph, selected) | selected
         return self.select_parents(graph, ancestors_for) | ancestors_for
 
-    def select_children(self, graph, selected):
-        descendants = set()
-        for node in selected:
-            descendants.update(nx.descendants(graph, node))
-        return descendants
+    def select_children(self, graph, selected, max_depth=None):
+        return self._traverse(graph, 'successors', selected, max_depth)
 
-    def select_parents(self, graph, selected):
-        ancestors = set()
-        for node in selected:
-            ancestors.update(nx.ancestors(graph, node))
-        return ancestors
+    def select_parents(self, graph, selected, max_depth=None):
+        return self._traverse(graph, 'predecessors', selected, max_depth)
 
     def collect_models(self, graph, selected, spec):
         additional = set()
         if spec.select_childrens_parents:
             additional.update(self.select_childrens_parents(graph, selected))
         if spec.select_parents:
-            additional.update(self.select_parents(graph, selected))
+            additional.update(self.select_parents(
+                graph, selected, spec.select_parents_max_depth
+            ))
         if spec.select_children:
-            additional.update(self.select_children(graph, selected))
+            additional.update(self.select_children(
+                graph, selected, spec.select_children_max_depth
+            ))
         return additional
 
     def collect_tests(self, graph, model_nodes):
@@ -321,24 +487,12 @@ class NodeSelector(object):
         return is_model and is_ephemeral
 
     def get_ancestor_ephemeral_nodes(self, selected_nodes):
-        node_names = {}
-        for node_id in selected_nodes:
-            if node_id not in self.manifest.nodes:
-                continue
-            node = self.manifest.nodes[node_id]
-            # sources don't have ancestors and this results in a silly select()
-            if node.resource_type == NodeType.Source:
-                continue
-            node_names[node_id] = node.name
-
-        include_spec = [
-            '+{}'.format(node_names[node])
-            for node in selected_nodes if node in node_names
+        graph = self.linker.graph
+        roots = [
+            node_id for node_id in selected_nodes
+            if node_id in self.manifest.nodes and node_id in graph
         ]
-        if not include_spec:
-            return set()
-
-        all_ancestors = self.select_nodes(self.linker.graph, include_spec, [])
+        all_ancestors = self.select_parents(graph, roots)
 
         res = []
         for ancestor in all_ancestors:
@@ -87,11 +87,31 @@
 {% endmacro %}
 
 
-{% macro get_catalog(information_schemas) -%}
-  {{ return(adapter_macro('get_catalog', information_schemas)) }}
+{#-- schemas, if given, is a list of lowercase schema names to limit the catalog
+  -- to. It's only passed on when given, so implementations that don't accept it
+  -- still work for a full catalog. Adapters set CATALOG_BY_SCHEMA when theirs
+  -- does. #}
+{% macro get_catalog(information_schemas, schemas=none) -%}
+  {% if schemas is none %}
+    {{ return(adapter_macro('get_catalog', information_schemas)) }}
+  {% else %}
+    {{ return(adapter_macro('get_catalog', information_schemas, schemas)) }}
+  {% endif %}
+{%- endmacro %}
+
+{#-- A condition limiting column to the lowercase schema names in schemas, for
+  -- get_catalog implementations. Renders nothing if schemas is none. keyword
+  -- goes before the condition: "where" or "and". #}
+{% macro catalog_schemas_filter(schemas, column='table_schema', keyword='and') -%}
+  {%- if schemas is not none %}
+    {{ keyword }} lower({{ column }}) in (
+      {%- for schema in schemas -%}
+        '{{ schema }}'{% if not loop.last %}, {% endif %}
+      {%- endfor -%})
+  {%- endif %}
 {%- endmacro %}
 
-{% macro default__get_catalog(information_schemas) -%}
+{% macro default__get_catalog(information_schemas, schemas=none) -%}
 
   {% set typename = adapter.type() %}
   {% set msg -%}
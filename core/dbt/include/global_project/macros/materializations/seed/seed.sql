@@ -11,6 +11,17 @@
   {{ adapter_macro('load_csv_rows', model) }}
 {%- endmacro %}
 
+{% macro get_seed_checksum(relation) -%}
+  {{ return(adapter_macro('get_seed_checksum', relation)) }}
+{%- endmacro %}
+
+{#-- stores checksum where get_seed_checksum finds it: the table's comment on
+  -- postgres, redshift and snowflake, and its description on bigquery. Any
+  -- existing comment is replaced. --#}
+{% macro persist_seed_checksum(relation, checksum) -%}
+  {{ adapter_macro('persist_seed_checksum', relation, checksum) }}
+{%- endmacro %}
+
 {% macro default__create_csv_table(model) %}
   {%- set agate_table = model['agate_table'] -%}
   {%- set column_override = model['config'].get('column_types', {}) -%}
@@ -85,7 +96,21 @@
 
 
 {% macro default__load_csv_rows(model) %}
-  {{ return(basic_load_csv_rows(model, 10000) )}}
+  {% set sql = adapter.bulk_load_csv_rows(this, model['agate_table']) %}
+  {% if sql is none %}
+    {% set sql = basic_load_csv_rows(model, 10000) %}
+  {% endif %}
+  {{ return(sql) }}
+{% endmacro %}
+
+
+{% macro default__get_seed_checksum(relation) %}
+  {#-- without a way to store the checksum, seeds are always reloaded --#}
+  {{ return(none) }}
+{% endmacro %}
+
+
+{% macro default__persist_seed_checksum(relation, checksum) %}
 {% endmacro %}
 
 
@@ -100,6 +125,15 @@
   {%- set exists_as_view = (old_relation is not none and old_relation.is_view) -%}
 
   {%- set csv_table = model["agate_table"] -%}
+  {#-- the checksum is stored in the table's comment, so it's only computed and
+    -- stored with --skip-unchanged, to leave other comments alone --#}
+  {%- set skip_unchanged = (flags.SKIP_UNCHANGED_SEEDS == True) -%}
+  {%- set checksum = csv_table.checksum() if skip_unchanged else none -%}
+  {%- set unchanged = (
+        skip_unchanged
+        and not full_refresh_mode
+        and exists_as_table
+        and get_seed_checksum(old_relation) == checksum) -%}
 
   {{ run_hooks(pre_hooks, inside_transaction=False) }}
 
@@ -110,21 +144,30 @@
   {% set create_table_sql = "" %}
   {% if exists_as_view %}
     {{ exceptions.raise_compiler_error("Cannot seed to '{}', it is a view".format(old_relation)) }}
-  {% elif exists_as_table %}
-    {% set create_table_sql = reset_csv_table(model, full_refresh_mode, old_relation) %}
+  {% elif unchanged %}
+    {% call noop_statement('main', 'UNCHANGED') %}
+      -- dbt seed: {{ old_relation }} is unchanged --
+    {% endcall %}
   {% else %}
-    {% set create_table_sql = create_csv_table(model) %}
-  {% endif %}
+    {% if exists_as_table %}
+      {% set create_table_sql = reset_csv_table(model, full_refresh_mode, old_relation) %}
+    {% else %}
+      {% set create_table_sql = create_csv_table(model) %}
+    {% endif %}
 
-  {% set status = 'CREATE' if full_refresh_mode else 'INSERT' %}
-  {% set num_rows = (csv_table.rows | length) %}
-  {% set sql = load_csv_rows(model) %}
+    {% set status = 'CREATE' if full_refresh_mode else 'INSERT' %}
+    {% set num_rows = (csv_table.rows | length) %}
+    {% set sql = load_csv_rows(model) %}
+    {% if skip_unchanged %}
+      {{ persist_seed_checksum(this, checksum) }}
+    {% endif %}
 
-  {% call noop_statement('main', status ~ ' ' ~ num_rows) %}
-    {{ create_table_sql }};
-    -- dbt seed --
-    {{ sql }}
-  {% endcall %}
+    {% call noop_statement('main', status ~ ' ' ~ num_rows) %}
+      {{ create_table_sql }};
+      -- dbt seed --
+      {{ sql }}
+    {% endcall %}
+  {% endif %}
 
   {{ run_hooks(post_hooks, inside_transaction=True) }}
 
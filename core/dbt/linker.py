@@ -3,6 +3,7 @@ import threading
 
 from dbt.compat import PriorityQueue
 from dbt.node_types import NodeType
+import dbt.exceptions
 
 
 GRAPH_SERIALIZE_BLACKLIST = [
@@ -21,17 +22,107 @@ def is_blocking_dependency(node):
     return node.resource_type == NodeType.Model
 
 
+def _popcount(value):
+    return bin(value).count('1')
+
+
+def _release_when_consumed(graph, node, values, remaining):
+    """Once every predecessor of a node has read its value in a reverse
+    topological sweep, the value can be dropped. This keeps the working set
+    of large per-node values (like reachability bitsets) down to the
+    'frontier' of the sweep.
+    """
+    for successor in graph.successors(node):
+        remaining[successor] -= 1
+        if remaining[successor] == 0:
+            del values[successor]
+
+
+def descendant_scores(graph, include_in_cost, timings=None):
+    """Score each node by the number of its descendants that are included in
+    the cost, in one reverse-topological pass over the graph.
+
+    Each node's descendants are held as a bitset (a python int) with one bit
+    per cost-included node, so a node's set is the union of its children's
+    sets plus the children themselves.
+    """
+    bits = {}
+    for node in graph.nodes():
+        if include_in_cost(node):
+            bits[node] = 1 << len(bits)
+
+    reachable = {}
+    remaining = dict(graph.in_degree())
+    scores = {}
+    for node in reversed(list(nx.topological_sort(graph))):
+        descendants = 0
+        for successor in graph.successors(node):
+            descendants |= reachable[successor] | bits.get(successor, 0)
+        reachable[node] = descendants
+        scores[node] = -1 * _popcount(descendants)
+        if remaining[node] == 0:
+            del reachable[node]
+        _release_when_consumed(graph, node, reachable, remaining)
+    return scores
+
+
+def critical_path_scores(graph, include_in_cost, timings=None):
+    """Score each node by the length of the longest path from it to the end
+    of the graph, where each node on the path is weighted by its runtime in a
+    previous run (from `timings`, a dict of unique ID -> seconds). Nodes with
+    no recorded runtime count as 1 if they are included in the cost and 0
+    otherwise.
+    """
+    if timings is None:
+        timings = {}
+
+    scores = {}
+    for node in reversed(list(nx.topological_sort(graph))):
+        weight = timings.get(node)
+        if weight is None:
+            weight = 1 if include_in_cost(node) else 0
+        longest = max([-scores[s] for s in graph.successors(node)] or [0])
+        scores[node] = -1 * (weight + longest)
+    return scores
+
+
+def fanout_scores(graph, include_in_cost, timings=None):
+    """Score each node by the number of its direct children that are included
+    in the cost.
+    """
+    return {
+        node: -1 * len([
+            s for s in graph.successors(node) if include_in_cost(s)
+        ])
+        for node in graph.nodes()
+    }
+
+
+PRIORITY_POLICIES = {
+    'descendants': descendant_scores,
+    'critical-path': critical_path_scores,
+    'fanout': fanout_scores,
+}
+
+DEFAULT_PRIORITY_POLICY = 'descendants'
+
+
 class GraphQueue(object):
     """A fancy queue that is backed by the dependency graph.
-    Note: this will mutate input!
+
+    Each node's count of unfinished dependencies is kept up to date as nodes
+    are marked done, so finishing a node only looks at its own successors.
 
     This queue is thread-safe for `mark_done` calls, though you must ensure
     that separate threads do not call `.empty()` or `__len__()` and `.get()` at
     the same time, as there is an unlocked race!
     """
-    def __init__(self, graph, manifest):
+    def __init__(self, graph, manifest, priority=DEFAULT_PRIORITY_POLICY,
+                 timings=None):
         self.graph = graph
         self.manifest = manifest
+        self.priority = priority
+        self.timings = timings
         # store the queue as a priority queue.
         self.inner = PriorityQueue()
         # things that have been popped off the queue but not finished
@@ -39,12 +130,18 @@ class GraphQueue(object):
         self.in_progress = set()
         # things that are in the queue
         self.queued = set()
+        # the number of nodes that have been marked done
+        self.num_done = 0
         # this lock controls most things
         self.lock = threading.Lock()
         # store the 'score' of each node as a number. Lower is higher priority.
         self._scores = self._calculate_scores()
+        # the number of each node's dependencies that aren't done yet
+        self._remaining = dict(self.graph.in_degree())
         # populate the initial queue
-        self._find_new_additions()
+        for node, remaining in self._remaining.items():
+            if remaining == 0:
+                self._add(node)
 
     def get_node(self, node_id):
         return self.manifest.nodes[node_id]
@@ -58,30 +155,28 @@ class GraphQueue(object):
         return True
 
     def _calculate_scores(self):
-        """Calculate the 'value' of each node in the graph based on how many
-        blocking descendants it has. We use this score for the internal
-        priority queue's ordering, so the quality of this metric is important.
+        """Calculate the 'value' of each node in the graph according to the
+        queue's priority policy (see PRIORITY_POLICIES). By default this is
+        how many blocking descendants each node has. We use this score for the
+        internal priority queue's ordering, so the quality of this metric is
+        important.
 
         The score is stored as a negative number because the internal
         PriorityQueue picks lowest values first.
 
-        We could do this in one pass over the graph instead of len(self.graph)
-        passes but this is easy. For large graphs this may hurt performance.
-
         This operates on the graph, so it would require a lock if called from
         outside __init__.
 
         :return Dict[str, int]: The score dict, mapping unique IDs to integer
             scores. Lower scores are higher priority.
         """
-        scores = {}
-        for node in self.graph.nodes():
-            score = -1 * len([
-                d for d in nx.descendants(self.graph, node)
-                if self._include_in_cost(d)
-            ])
-            scores[node] = score
-        return scores
+        if self.priority not in PRIORITY_POLICIES:
+            raise dbt.exceptions.RuntimeException(
+                'Unknown priority policy "{}", expected one of: {}'
+                .format(self.priority, ', '.join(sorted(PRIORITY_POLICIES)))
+            )
+        score_func = PRIORITY_POLICIES[self.priority]
+        return score_func(self.graph, self._include_in_cost, self.timings)
 
     def get(self, block=True, timeout=None):
         """Get a node off the inner priority queue. By default, this blocks.
@@ -109,7 +204,7 @@ class GraphQueue(object):
         This takes the lock.
         """
         with self.lock:
-            return len(self.graph) - len(self.in_progress)
+            return len(self.graph) - self.num_done - len(self.in_progress)
 
     def empty(self):
         """The graph queue is 'empty' if it all remaining nodes in the graph
@@ -119,30 +214,18 @@ class GraphQueue(object):
         """
         return len(self) == 0
 
-    def _already_known(self, node):
-        """Decide if a node is already known (either handed out as a task, or
-        in the queue).
-
-        Callers must hold the lock.
-
-        :param str node: The node ID to check
-        :returns bool: If the node is in progress/queued.
-        """
-        return node in self.in_progress or node in self.queued
-
-    def _find_new_additions(self):
-        """Find any nodes in the graph that need to be added to the internal
-        queue and add them.
+    def _add(self, node):
+        """Add a node whose dependencies are all done to the internal queue.
 
         Callers must hold the lock.
         """
-        for node, in_degree in dict(self.graph.in_degree()).items():
-            if not self._already_known(node) and in_degree == 0:
-                self.inner.put((self._scores[node], node))
-                self.queued.add(node)
+        self.inner.put((self._scores[node], node))
+        self.queued.add(node)
 
     def mark_done(self, node_id):
-        """Given a node's unique ID, mark it as done.
+        """Given a node's unique ID, mark it as done, and add each of its
+        successors that no longer has any unfinished dependencies to the
+        internal queue.
 
         This method takes the lock.
 
@@ -150,8 +233,11 @@ class GraphQueue(object):
         """
         with self.lock:
             self.in_progress.remove(node_id)
-            self.graph.remove_node(node_id)
-            self._find_new_additions()
+            self.num_done += 1
+            for successor in self.graph.successors(node_id):
+                self._remaining[successor] -= 1
+                if self._remaining[successor] == 0:
+                    self._add(successor)
             self.inner.task_done()
 
     def _mark_in_progress(self, node_id):
@@ -172,28 +258,133 @@ class GraphQueue(object):
         self.inner.join()
 
 
+def _upstream_of(graph, nodes):
+    """Return the set of nodes that are either in nodes or ancestors of any
+    of them, in a single traversal.
+    """
+    found = set(nodes)
+    frontier = list(found)
+    while frontier:
+        node = frontier.pop()
+        for predecessor in graph.predecessors(node):
+            if predecessor not in found:
+                found.add(predecessor)
+                frontier.append(predecessor)
+    return found
+
+
+def _iter_bits(value):
+    """Yield the index of each set bit in value, lowest first."""
+    while value:
+        lowest = value & -value
+        yield lowest.bit_length() - 1
+        value ^= lowest
+
+
 def _subset_graph(graph, include_nodes):
     """Create and return a new graph that is a shallow copy of graph but with
     only the nodes in include_nodes. Transitive edges across removed nodes are
     preserved as explicit new edges.
-    """
-    new_graph = nx.algorithms.transitive_closure(graph)
 
+    Rather than computing the transitive closure of the whole graph, this
+    makes one reverse-topological pass over the nodes that can reach an
+    included node, tracking two bitsets over the included nodes for each
+    node: the included nodes reachable without passing through another
+    included node ('first'), and the included nodes only reachable through
+    another one ('beyond'). Each included node gets an edge to every node in
+    first but not in beyond, so the new graph has the same ordering as the
+    old one without any redundant edges.
+    """
     include_nodes = set(include_nodes)
 
-    for node in graph.nodes():
-        if node not in include_nodes:
-            new_graph.remove_node(node)
-
     for node in include_nodes:
-        if node not in new_graph:
+        if node not in graph:
             raise RuntimeError(
                 "Couldn't find model '{}' -- does it exist or is "
                 "it disabled?".format(node)
             )
+
+    if len(include_nodes) == len(graph):
+        # everything is selected, so there's nothing to preserve
+        return graph.copy()
+
+    new_graph = graph.__class__()
+    included = []
+    for node, data in graph.nodes(data=True):
+        if node in include_nodes:
+            new_graph.add_node(node, **data)
+            included.append(node)
+    bits = {node: 1 << idx for idx, node in enumerate(included)}
+
+    upstream = _upstream_of(graph, include_nodes)
+    remaining = {
+        node: len([p for p in graph.predecessors(node) if p in upstream])
+        for node in upstream
+    }
+    # node -> (first, beyond) bitsets, dropped once all predecessors are done
+    reachable = {}
+    for node in reversed(list(nx.topological_sort(graph.subgraph(upstream)))):
+        first = 0
+        beyond = 0
+        for successor in graph.successors(node):
+            if successor not in reachable:
+                continue
+            succ_first, succ_beyond = reachable[successor]
+            if successor in bits:
+                first |= bits[successor]
+                beyond |= succ_first | succ_beyond
+            else:
+                first |= succ_first
+                beyond |= succ_beyond
+
+        if node in bits:
+            for idx in _iter_bits(first & ~beyond):
+                new_graph.add_edge(node, included[idx])
+
+        if remaining[node]:
+            reachable[node] = (first, beyond)
+
+        for successor in graph.successors(node):
+            if successor in reachable:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    del reachable[successor]
+
     return new_graph
 
 
+def _find_cycle(graph):
+    """Return the nodes of one cycle in graph, or None if it has none.
+
+    This is a depth-first search for an edge back to a node on the current
+    path, so it visits each node and edge at most once. It keeps its own
+    stack instead of recursing, so long chains don't hit the recursion
+    limit.
+    """
+    done = set()
+    for start in graph.nodes():
+        if start in done:
+            continue
+        path = [start]
+        on_path = {start}
+        successors = [iter(graph.successors(start))]
+        while successors:
+            for child in successors[-1]:
+                if child in on_path:
+                    return path[path.index(child):]
+                if child not in done:
+                    path.append(child)
+                    on_path.add(child)
+                    successors.append(iter(graph.successors(child)))
+                    break
+            else:
+                node = path.pop()
+                on_path.remove(node)
+                done.add(node)
+                successors.pop()
+    return None
+
+
 class Linker(object):
     def __init__(self, data=None):
         if data is None:
@@ -208,19 +399,18 @@ class Linker(object):
 
     def find_cycles(self):
         # There's a networkx find_cycle function, but there's a bug in the
-        # nx 1.11 release that prevents us from using it. We should use that
-        # function when we upgrade to 2.X. More info:
+        # nx 1.11 release that prevents us from using it. More info:
         #     https://github.com/networkx/networkx/pull/2473
-        cycles = list(nx.simple_cycles(self.graph))
+        cycle_nodes = _find_cycle(self.graph)
 
-        if len(cycles) > 0:
-            cycle_nodes = cycles[0]
+        if cycle_nodes is not None:
             cycle_nodes.append(cycle_nodes[0])
             return " --> ".join(cycle_nodes)
 
         return None
 
-    def as_graph_queue(self, manifest, limit_to=None):
+    def as_graph_queue(self, manifest, limit_to=None,
+                       priority=DEFAULT_PRIORITY_POLICY, timings=None):
         """Returns a queue over nodes in the graph that tracks progress of
         dependecies.
         """
@@ -230,7 +420,8 @@ class Linker(object):
             graph_nodes = limit_to
 
         new_graph = _subset_graph(self.graph, graph_nodes)
-        return GraphQueue(new_graph, manifest)
+        return GraphQueue(new_graph, manifest, priority=priority,
+                          timings=timings)
 
     def get_dependent_nodes(self, node):
         return nx.descendants(self.graph, node)
@@ -249,17 +440,31 @@ class Linker(object):
         self.graph.remove_node(node)
         return children
 
-    def write_graph(self, outfile, manifest):
-        """Write the graph to a gpickle file. Before doing so, serialize and
-        include all nodes in their corresponding graph entries.
+    def write_graph(self, outfile, manifest, full=False):
+        """Write the graph to a gpickle file. Nodes are just their unique IDs
+        unless full is set, in which case serialize and include all nodes in
+        their corresponding graph entries.
         """
-        out_graph = _updated_graph(self.graph, manifest)
+        if full:
+            out_graph = _updated_graph(self.graph, manifest)
+        else:
+            out_graph = _slim_graph(self.graph)
         nx.write_gpickle(out_graph, outfile)
 
     def read_graph(self, infile):
         self.graph = nx.read_gpickle(infile)
 
 
+def _slim_graph(graph):
+    """Return a copy of graph with only its nodes and edges, and none of
+    their attributes.
+    """
+    slim = nx.DiGraph()
+    slim.add_nodes_from(graph.nodes())
+    slim.add_edges_from(graph.edges())
+    return slim
+
+
 def _updated_graph(graph, manifest):
     graph = graph.copy()
     for node_id in graph.nodes():
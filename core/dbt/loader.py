@@ -5,6 +5,7 @@ from dbt.include.global_project import PACKAGES
 import dbt.exceptions
 import dbt.flags
 
+from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.node_types import NodeType
 from dbt.contracts.graph.manifest import Manifest
 from dbt.utils import timestring
@@ -12,14 +13,23 @@ from dbt.utils import timestring
 from dbt.parser import MacroParser, ModelParser, SeedParser, AnalysisParser, \
     DocumentationParser, DataTestParser, HookParser, SchemaParser, \
     ParserUtils, SnapshotParser
+from dbt.parser.cache import ParseCache, PARTIAL_PARSE_FILE_NAME, \
+    manifest_fingerprint, \
+    project_fingerprint
+from dbt.parser.parallel import ParsePool
 
 from dbt.contracts.project import ProjectList
 
 
 class GraphLoader(object):
-    def __init__(self, root_project, all_projects):
+    def __init__(self, root_project, all_projects, partial_parse=False,
+                 parse_processes=None):
         self.root_project = root_project
         self.all_projects = all_projects
+        self.partial_parse = partial_parse
+        self.parse_processes = parse_processes
+        self.parse_cache = None
+        self.parse_pool = None
         self.nodes = {}
         self.docs = {}
         self.macros = {}
@@ -31,7 +41,9 @@ class GraphLoader(object):
     def _load_sql_nodes(self, parser_type, resource_type, relative_dirs_attr,
                         **kwargs):
         parser = parser_type(self.root_project, self.all_projects,
-                             self.macro_manifest)
+                             self.macro_manifest,
+                             parse_cache=self.parse_cache,
+                             parse_pool=self.parse_pool)
 
         for project_name, project in self.all_projects.items():
             parse_results = parser.load_and_parse(
@@ -99,7 +111,8 @@ class GraphLoader(object):
 
     def _load_schema_tests(self):
         parser = SchemaParser(self.root_project, self.all_projects,
-                              self.macro_manifest)
+                              self.macro_manifest,
+                              parse_cache=self.parse_cache)
         for project_name, project in self.all_projects.items():
             tests, patches, sources = parser.load_and_parse(
                 package_name=project_name,
@@ -128,14 +141,34 @@ class GraphLoader(object):
                     )
                 self.patches[name] = patch
 
+    def _load_parse_cache(self):
+        path = os.path.join(self.root_project.target_path,
+                            PARTIAL_PARSE_FILE_NAME)
+        fingerprint = project_fingerprint(self.root_project,
+                                          self.all_projects, self.macros)
+        self.parse_cache = ParseCache.load(path, fingerprint)
+
     def load(self, internal_manifest=None):
         self._load_macros(internal_manifest=internal_manifest)
         # make a manifest with just the macros to get the context
         self.macro_manifest = Manifest(macros=self.macros, nodes={}, docs={},
                                        generated_at=timestring(), disabled=[])
-        self._load_nodes()
+        if self.partial_parse:
+            self._load_parse_cache()
+        if self.parse_processes is not None and self.parse_processes > 1:
+            self.parse_pool = ParsePool(self.parse_processes,
+                                        self.root_project, self.all_projects,
+                                        self.macro_manifest)
+        try:
+            self._load_nodes()
+        finally:
+            if self.parse_pool is not None:
+                self.parse_pool.close()
+                self.parse_pool = None
         self._load_docs()
         self._load_schema_tests()
+        if self.parse_cache is not None:
+            self.parse_cache.write()
 
     def create_manifest(self):
         manifest = Manifest(
@@ -155,19 +188,54 @@ class GraphLoader(object):
         return manifest
 
     @classmethod
-    def _load_from_projects(cls, root_config, projects, internal_manifest):
+    def _load_from_projects(cls, root_config, projects, internal_manifest,
+                            partial_parse=False, parse_processes=None):
         if dbt.flags.STRICT_MODE:
             ProjectList(**projects)
 
-        loader = cls(root_config, projects)
+        loader = cls(root_config, projects, partial_parse=partial_parse,
+                     parse_processes=parse_processes)
         loader.load(internal_manifest=internal_manifest)
         return loader.create_manifest()
 
     @classmethod
-    def load_all(cls, root_config, internal_manifest=None):
-        projects = load_all_projects(root_config)
+    def load_all(cls, root_config, internal_manifest=None, projects=None):
+        if projects is None:
+            projects = load_all_projects(root_config)
         manifest = cls._load_from_projects(root_config, projects,
-                                           internal_manifest)
+                                           internal_manifest,
+                                           dbt.flags.PARTIAL_PARSE,
+                                           dbt.flags.PARSE_PROCESSES)
+        _check_manifest(manifest, root_config)
+        return manifest
+
+    @classmethod
+    def fingerprint(cls, root_config, projects=None):
+        """Return a digest of the state of the project and its packages,
+        which changes whenever parsing them could give a different manifest.
+        Changes to environment variables read with env_var() aren't detected.
+        """
+        if projects is None:
+            projects = load_all_projects(root_config)
+        return manifest_fingerprint(root_config, projects)
+
+    @classmethod
+    def load_binary(cls, root_config, path, fingerprint):
+        """Load the binary manifest at path if it was written by this version
+        of dbt with the given fingerprint. Otherwise, return None.
+        """
+        if not os.path.exists(path):
+            return None
+
+        try:
+            manifest = Manifest.read_binary(path, fingerprint)
+        except Exception as exc:
+            logger.debug('Not reusing binary manifest {}: {}'
+                         .format(path, exc))
+            return None
+
+        logger.debug('Reusing binary manifest {}'.format(path))
+        manifest.metadata = Manifest.get_metadata(root_config)
         _check_manifest(manifest, root_config)
         return manifest
 
@@ -26,6 +26,7 @@ from dbt.task.list import ListTask
 from dbt.task.migrate import MigrationTask
 from dbt.task.rpc_server import RPCServerTask
 from dbt.adapters.factory import reset_adapters
+from dbt.linker import PRIORITY_POLICIES, DEFAULT_PRIORITY_POLICY
 
 import dbt.tracking
 import dbt.ui.printer
@@ -279,6 +280,52 @@ def _build_base_subparser():
         dest='use_cache',
         help='If set, bypass the adapter-level cache of database state',
     )
+
+    base_subparser.add_argument(
+        '--relation-cache-ttl',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help='''If set, save the adapter-level cache of database state in the
+        target directory at the end of the run. A later run with this option
+        reuses a saved cache that is at most this many seconds old, and only
+        queries the database again for the schemas of the selected nodes.''',
+    )
+
+    base_subparser.add_argument(
+        '--refresh-relation-cache',
+        action='store_true',
+        help='''If set, ignore any saved cache of database state and query
+        every schema, as if --relation-cache-ttl was not set.''',
+    )
+
+    base_subparser.add_argument(
+        '--connection-pool-max',
+        type=int,
+        default=None,
+        metavar='N',
+        help='''The most database connections to have open at once. Threads
+        wait for a connection to be released instead of opening more. It is
+        raised to at least one more than the number of threads.''',
+    )
+
+    base_subparser.add_argument(
+        '--connection-pool-min',
+        type=int,
+        default=0,
+        metavar='N',
+        help='''The number of idle database connections to keep open however
+        long they have been idle.''',
+    )
+
+    base_subparser.add_argument(
+        '--connection-idle-timeout',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help='''If set, close database connections that have been idle for
+        this many seconds, except for --connection-pool-min of them.''',
+    )
     return base_subparser
 
 
@@ -462,6 +509,17 @@ def _add_common_arguments(*subparsers):
             If set, skip ensuring dbt's version matches the one specified in
             the dbt_project.yml file ('require-dbt-version')
             """)
+        sub.add_argument(
+            '--priority',
+            choices=sorted(PRIORITY_POLICIES),
+            default=DEFAULT_PRIORITY_POLICY,
+            help="""
+            How to order nodes that are ready to run. 'descendants' (the
+            default) runs nodes with the most downstream models first,
+            'critical-path' runs nodes on the longest path (weighted by their
+            runtime in the previous run_results.json) first, and 'fanout' runs
+            nodes with the most direct children first.
+            """)
 
 
 def _build_seed_subparser(subparsers, base_subparser):
@@ -479,6 +537,15 @@ def _build_seed_subparser(subparsers, base_subparser):
         action='store_true',
         help='Show a sample of the loaded data in the terminal'
     )
+    seed_sub.add_argument(
+        '--skip-unchanged',
+        action='store_true',
+        help='''Skip reloading seed tables whose csv file and column_types
+        config haven't changed since they were last loaded with this option.
+        To tell, a checksum of the file is stored as the comment (on
+        BigQuery, the description) of each seed table it loads, replacing any
+        comment the table had.'''
+    )
     seed_sub.set_defaults(cls=seed_task.SeedTask, which='seed')
     return seed_sub
 
@@ -571,6 +638,15 @@ def _build_rpc_subparser(subparsers, base_subparser):
         type=int,
         help='Specify the port number for the rpc server.'
     )
+    sub.add_argument(
+        '--max-rows',
+        default=None,
+        type=int,
+        help='''The most rows to return for a "run" request. Rows past this
+        are never fetched into memory, and the result is marked as truncated.
+        By default there is no limit. A request can ask for fewer rows with
+        its max_rows parameter.'''
+    )
     sub.set_defaults(cls=RPCServerTask, which='rpc')
     # the rpc task does a 'compile', so we need these attributes to exist, but
     # we don't want users to be allowed to set them.
@@ -736,6 +812,44 @@ def parse_args(args):
         configurations with no associated models, invalid test configurations,
         and missing sources/refs in tests''')
 
+    p.add_argument(
+        '--partial-parse',
+        action='store_true',
+        help='''Reuse the parse results of unchanged files from the previous
+        invocation, stored in the target directory. Changing any macro, var
+        or project/profile setting reparses everything, but changes to
+        environment variables read with env_var() are not detected.''')
+
+    p.add_argument(
+        '--parse-processes',
+        type=int,
+        default=None,
+        help='''Parse model, snapshot, analysis and data test files across
+        this many processes. By default, files are parsed serially in the
+        main process.''')
+
+    p.add_argument(
+        '--manifest-format',
+        choices=['json', 'binary'],
+        default='json',
+        help='''The format to write the manifest in. "binary" writes
+        manifest.pickle instead of manifest.json. It is faster to write and
+        load, but can only be read by this version of dbt. Later invocations
+        with "binary" load it instead of parsing the project, until a file
+        in the project or a package, the project configuration or the dbt
+        version changes. manifest.json is then not written or updated, except
+        by "dbt docs generate", which always writes it as well. Changes to
+        environment variables read with env_var() are not detected, so the
+        stale manifest is still loaded after them.''')
+
+    p.add_argument(
+        '--full-graph',
+        action='store_true',
+        help='''If set, include every node's serialized contents in
+        graph.gpickle, as older versions of dbt did. By default it only holds
+        the unique IDs of the nodes and the edges between them, and the nodes
+        can be looked up in the manifest.''')
+
     # if set, run dbt in single-threaded mode: thread count is ignored, and
     # calls go through `map` instead of the thread pool. This is useful for
     # getting performance information about aspects of dbt that normally run in
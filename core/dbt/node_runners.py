@@ -565,6 +565,10 @@ class RPCCompileRunner(CompileRunner):
 
 
 class RPCExecuteRunner(RPCCompileRunner):
+    # the most rows to return, or None for all of them. The task sets this
+    # from the request, bounded by the server's --max-rows.
+    max_rows = None
+
     def from_run_result(self, result, start_time, timing_info):
         timing = [t.serialize() for t in timing_info]
         return RemoteRunResult(
@@ -576,11 +580,17 @@ class RPCExecuteRunner(RPCCompileRunner):
         )
 
     def execute(self, compiled_node, manifest):
-        status, table = self.adapter.execute(compiled_node.injected_sql,
-                                             fetch=True)
+        status, result = self.adapter.execute_iter(compiled_node.injected_sql,
+                                                   limit=self.max_rows)
+        if result.types_known:
+            # no inference needed, so don't build an agate table
+            rows = list(result.iter_cast())
+        else:
+            rows = [list(row) for row in result.to_table()]
         table = {
-            'column_names': list(table.column_names),
-            'rows': [list(row) for row in table]
+            'column_names': list(result.column_names),
+            'rows': rows,
+            'truncated': result.truncated,
         }
 
         return RemoteRunResult(
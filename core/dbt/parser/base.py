@@ -52,12 +52,15 @@ class BaseParser(object):
 
 
 class MacrosKnownParser(BaseParser):
-    def __init__(self, root_project_config, all_projects, macro_manifest):
+    def __init__(self, root_project_config, all_projects, macro_manifest,
+                 parse_cache=None, parse_pool=None):
         super(MacrosKnownParser, self).__init__(
             root_project_config=root_project_config,
             all_projects=all_projects
         )
         self.macro_manifest = macro_manifest
+        self.parse_cache = parse_cache
+        self.parse_pool = parse_pool
         self._get_schema_func = None
         self._get_alias_func = None
 
@@ -61,7 +61,43 @@ class BaseSqlParser(MacrosKnownParser):
                 'raw_sql': file_contents
             })
 
-        return self.parse_sql_nodes(result, tags)
+        if self.parse_cache is None and self.parse_pool is None:
+            return self.parse_sql_nodes(result, tags)
+
+        results = SQLParseResult()
+        for file_result in self._parse_sql_files(result, tags):
+            results.update(file_result)
+        return results
+
+    def _parse_sql_files(self, node_dicts, tags):
+        """Parse each file in node_dicts on its own, reusing results from the
+        parse cache and fanning the rest out to the parse pool where
+        available. Return a list of SQLParseResults in file order, so merging
+        them finds the same duplicates as serial parsing does.
+        """
+        keys = [None] * len(node_dicts)
+        file_results = [None] * len(node_dicts)
+        if self.parse_cache is not None:
+            for idx, node_dict in enumerate(node_dicts):
+                keys[idx] = self.parse_cache.file_key(
+                    type(self).__name__, node_dict, tags
+                )
+                file_results[idx] = self.parse_cache.get(keys[idx])
+
+        missing = [
+            idx for idx, found in enumerate(file_results) if found is None
+        ]
+        to_parse = [node_dicts[idx] for idx in missing]
+        if self.parse_pool is None:
+            parsed = [self.parse_sql_nodes([n], tags) for n in to_parse]
+        else:
+            parsed = self.parse_pool.parse_files(self, to_parse, tags)
+
+        for idx, found in zip(missing, parsed):
+            file_results[idx] = found
+            if self.parse_cache is not None:
+                self.parse_cache.set(keys[idx], found)
+        return file_results
 
     def parse_sql_node(self, node_dict, tags=None):
         if tags is None:
@@ -0,0 +1,163 @@
+import json
+import os
+import pickle
+
+import dbt.clients.system
+import dbt.utils
+from dbt.logger import GLOBAL_LOGGER as logger
+from dbt.version import __version__ as dbt_version
+
+
+PARTIAL_PARSE_FILE_NAME = 'partial_parse.pickle'
+
+
+def _hash_json(value):
+    return dbt.utils.md5(json.dumps(value, sort_keys=True, default=str))
+
+
+def project_fingerprint(root_project, all_projects, macros):
+    """Build a digest of everything outside of a file that can change the
+    result of parsing it: the dbt version, the root project's full
+    configuration (including its target and CLI vars), the configuration of
+    every loaded project, and the source of every macro.
+
+    dbt doesn't know which macros a node called while it was parsed, so a
+    change to any macro invalidates every entry.
+    """
+    return _hash_json({
+        'dbt_version': dbt_version,
+        'root_project': root_project.serialize(),
+        'projects': {
+            name: project.to_project_config(with_packages=True)
+            for name, project in all_projects.items()
+        },
+        'macros': {
+            unique_id: macro.raw_sql for unique_id, macro in macros.items()
+        },
+    })
+
+
+MANIFEST_FINGERPRINT_PATHS = (
+    'source_paths', 'macro_paths', 'data_paths', 'test_paths',
+    'analysis_paths', 'docs_paths', 'snapshot_paths',
+)
+
+
+def manifest_fingerprint(root_project, all_projects):
+    """Build a digest of everything a parsed manifest depends on: the dbt
+    version, the root project's full configuration, the configuration of
+    every loaded project, and the path, size and modification time of every
+    file in their resource directories.
+
+    Unlike `project_fingerprint`, this only needs the projects to be loaded,
+    so it can be used to decide whether to parse at all.
+    """
+    files = {}
+    for name, project in all_projects.items():
+        root = project.project_root
+        for attr in MANIFEST_FINGERPRINT_PATHS:
+            for relative_dir in getattr(project, attr):
+                for current, _, filenames in os.walk(
+                        os.path.join(root, relative_dir)):
+                    for filename in filenames:
+                        path = os.path.join(current, filename)
+                        stat = os.stat(path)
+                        files[path] = (stat.st_size, stat.st_mtime)
+
+    return _hash_json({
+        'dbt_version': dbt_version,
+        'root_project': root_project.serialize(),
+        'projects': {
+            name: project.to_project_config(with_packages=True)
+            for name, project in all_projects.items()
+        },
+        'files': files,
+    })
+
+
+class ParseCache(object):
+    """An on-disk cache of parse results, keyed by a digest of each parsed
+    file's contents (plus whatever else the parser passes in to `file_key`).
+
+    The whole cache is stamped with a fingerprint of the project (see
+    `project_fingerprint`), and discarded when the fingerprint changes. A
+    changed file just gets a new key, so only the nodes parsed from that file
+    are parsed again.
+
+    Entries are pickled as soon as they are stored, so later mutation of the
+    parsed nodes (ref processing, patching, compilation) doesn't leak into
+    the cache, and each lookup returns fresh objects. Only entries that were
+    looked up or stored during this run are written back out, so entries for
+    deleted files don't accumulate.
+    """
+    VERSION = 1
+
+    def __init__(self, path, fingerprint, entries=None):
+        self.path = path
+        self.fingerprint = fingerprint
+        self._previous = {} if entries is None else entries
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path, fingerprint):
+        """Load the cache at path. If it doesn't exist, can't be read, or was
+        written for a different fingerprint, return an empty cache.
+        """
+        if not os.path.exists(path):
+            return cls(path, fingerprint)
+
+        try:
+            with open(path, 'rb') as fp:
+                data = pickle.load(fp)
+        except Exception as exc:
+            logger.debug('Could not read partial parse file {}: {}'
+                         .format(path, exc))
+            return cls(path, fingerprint)
+
+        if data.get('version') != cls.VERSION:
+            logger.debug('Partial parse file has an old version, ignoring it')
+            return cls(path, fingerprint)
+
+        if data.get('fingerprint') != fingerprint:
+            logger.debug('Project configuration or macros changed, ignoring '
+                         'partial parse file')
+            return cls(path, fingerprint)
+
+        return cls(path, fingerprint, data.get('entries', {}))
+
+    @staticmethod
+    def file_key(*parts):
+        """Build a cache key from everything that goes into parsing a file:
+        typically its contents, path, package and resource type.
+        """
+        return _hash_json(parts)
+
+    def get(self, key):
+        """Return a fresh copy of the value stored for key, or None."""
+        blob = self._entries.get(key)
+        if blob is None:
+            blob = self._previous.get(key)
+        if blob is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries[key] = blob
+        return pickle.loads(blob)
+
+    def set(self, key, value):
+        self._entries[key] = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def write(self):
+        logger.debug('Partial parse: {} files reused, {} files parsed'
+                     .format(self.hits, self.misses))
+        dbt.clients.system.make_directory(os.path.dirname(self.path))
+        data = {
+            'version': self.VERSION,
+            'fingerprint': self.fingerprint,
+            'entries': self._entries,
+        }
+        with open(self.path, 'wb') as fp:
+            pickle.dump(data, fp, pickle.HIGHEST_PROTOCOL)
@@ -0,0 +1,104 @@
+import multiprocessing
+
+import dbt.flags
+from dbt.adapters.factory import cleanup_connections, load_plugin
+from dbt.logger import GLOBAL_LOGGER as logger
+
+
+# the flags that can change how a file is parsed. Forked workers inherit them,
+# but spawned workers (on Windows) start from the defaults.
+_WORKER_FLAGS = ('STRICT_MODE', 'FULL_REFRESH', 'WARN_ERROR',
+                 'TEST_NEW_PARSER')
+
+# the state of a worker process, set up by _init_worker
+_WORKER = {}
+
+
+def _init_worker(root_project, all_projects, macro_manifest, flags):
+    for name, value in flags.items():
+        setattr(dbt.flags, name, value)
+    load_plugin(root_project.credentials.type)
+    _WORKER.update({
+        'root_project': root_project,
+        'all_projects': all_projects,
+        'macro_manifest': macro_manifest,
+        'parsers': {},
+    })
+
+
+def _parse_in_worker(task):
+    parser_type, node_dict, tags = task
+    parsers = _WORKER['parsers']
+    if parser_type not in parsers:
+        parsers[parser_type] = parser_type(_WORKER['root_project'],
+                                           _WORKER['all_projects'],
+                                           _WORKER['macro_manifest'])
+    try:
+        return parsers[parser_type].parse_sql_nodes([node_dict], tags)
+    except Exception as exc:
+        # The parent process parses this file again to raise the error, so
+        # it's exactly what serial parsing would have raised.
+        logger.debug('Error parsing {} in a worker process: {}'
+                     .format(node_dict.get('original_file_path'), exc))
+        return None
+
+
+class ParsePool(object):
+    """A pool of processes that parse sql files in parallel.
+
+    Each worker gets its own copy of the project configs and the macro
+    manifest when it starts, and its own database connection if parsing
+    needs one. The process pool is started the first time there is more than
+    one file to parse, and must be shut down with `close`.
+    """
+    CHUNKS_PER_PROCESS = 4
+
+    def __init__(self, processes, root_project, all_projects,
+                 macro_manifest):
+        self.processes = processes
+        self.root_project = root_project
+        self.all_projects = all_projects
+        self.macro_manifest = macro_manifest
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            # forked workers must not share the parent's connections
+            cleanup_connections()
+            flags = {name: getattr(dbt.flags, name) for name in _WORKER_FLAGS}
+            self._pool = multiprocessing.Pool(
+                processes=self.processes,
+                initializer=_init_worker,
+                initargs=(self.root_project, self.all_projects,
+                          self.macro_manifest, flags)
+            )
+        return self._pool
+
+    def parse_files(self, parser, node_dicts, tags):
+        """Parse each file in node_dicts with a parser of the same type as the
+        given parser. Return a list of SQLParseResults in the same order as
+        node_dicts.
+
+        Files that fail to parse in a worker are parsed again with the given
+        parser, so errors are raised in the parent process and look the same
+        as they would in serial parsing.
+        """
+        if len(node_dicts) < 2:
+            return [parser.parse_sql_nodes([n], tags) for n in node_dicts]
+
+        tasks = [(type(parser), n, tags) for n in node_dicts]
+        chunksize = max(
+            1, len(tasks) // (self.processes * self.CHUNKS_PER_PROCESS)
+        )
+        results = self._get_pool().map(_parse_in_worker, tasks, chunksize)
+
+        for idx, result in enumerate(results):
+            if result is None:
+                results[idx] = parser.parse_sql_nodes([node_dicts[idx]], tags)
+        return results
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
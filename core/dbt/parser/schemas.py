@@ -536,10 +536,12 @@ class SchemaSourceParser(SchemaBaseTestParser):
 
 
 class SchemaParser(object):
-    def __init__(self, root_project_config, all_projects, macro_manifest):
+    def __init__(self, root_project_config, all_projects, macro_manifest,
+                 parse_cache=None):
         self.root_project_config = root_project_config
         self.all_projects = all_projects
         self.macro_manifest = macro_manifest
+        self.parse_cache = parse_cache
 
     @classmethod
     def find_schema_yml(cls, package_name, root_dir, relative_dirs):
@@ -590,6 +592,23 @@ class SchemaParser(object):
             source_parser.parse_all(sources, path, package_name, root_dir),
         )
 
+    def _parse_schema_cached(self, path, test_yml, package_name, root_dir):
+        """Parse the given schema file, reusing the results from the parse
+        cache if the file and its surroundings haven't changed.
+        """
+        if self.parse_cache is None:
+            return self.parse_schema(path, test_yml, package_name, root_dir)
+
+        key = self.parse_cache.file_key(type(self).__name__, path, test_yml,
+                                        package_name, root_dir)
+        results = self.parse_cache.get(key)
+        if results is None:
+            results = list(
+                self.parse_schema(path, test_yml, package_name, root_dir)
+            )
+            self.parse_cache.set(key, results)
+        return results
+
     def _parse_format_version(self, path, test_yml):
         if 'version' not in test_yml:
             dbt.exceptions.raise_invalid_schema_yml_version(
@@ -622,7 +641,8 @@ class SchemaParser(object):
                     'version {} is not supported'.format(version)
                 )
 
-            results = self.parse_schema(path, test_yml, package_name, root_dir)
+            results = self._parse_schema_cached(path, test_yml, package_name,
+                                                root_dir)
             for result_type, node in results:
                 if result_type == 'patch':
                     node_patches[node.name] = node
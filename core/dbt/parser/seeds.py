@@ -2,6 +2,7 @@ import os
 
 import dbt.flags
 import dbt.clients.agate_helper
+import dbt.clients.seed_table
 import dbt.clients.system
 import dbt.context.parser
 import dbt.contracts.project
@@ -16,8 +17,8 @@ from dbt.parser.base import MacrosKnownParser
 class SeedParser(MacrosKnownParser):
     @classmethod
     def parse_seed_file(cls, file_match, root_dir, package_name, should_parse):
-        """Parse the given seed file, returning an UnparsedNode and the agate
-        table.
+        """Parse the given seed file, returning an UnparsedNode and the table
+        that its rows are read from.
         """
         abspath = file_match['absolute_path']
         logger.debug("Parsing {}".format(abspath))
@@ -35,15 +36,25 @@ class SeedParser(MacrosKnownParser):
                                             file_match.get('relative_path')),
         )
         if should_parse:
-            try:
-                table = dbt.clients.agate_helper.from_csv(abspath)
-            except ValueError as e:
-                dbt.exceptions.raise_compiler_error(str(e), node)
+            # the file is read once the seed's config is known
+            table = dbt.clients.seed_table.SeedTable(abspath)
         else:
             table = dbt.clients.agate_helper.empty_table()
-        table.original_abspath = abspath
+            table.original_abspath = abspath
         return node, table
 
+    @classmethod
+    def read_seed_sample(cls, node):
+        """Infer the column types of a parsed seed from a sample of its rows,
+        skipping the columns that have their types configured.
+        """
+        table = node.agate_table
+        table.column_overrides = node.config.get('column_types', {})
+        try:
+            table.read_sample()
+        except ValueError as e:
+            dbt.exceptions.raise_compiler_error(str(e), node)
+
     def load_and_parse(self, package_name, root_dir, relative_dirs, tags=None):
         """Load and parse seed files in a list of directories. Returns a dict
            that maps unique ids onto ParsedNodes"""
@@ -69,6 +80,8 @@ class SeedParser(MacrosKnownParser):
             parsed = self.parse_node(node, node_path,
                                      self.all_projects.get(package_name),
                                      tags=tags, agate_table=agate_table)
+            if should_parse:
+                self.read_seed_sample(parsed)
             result[node_path] = parsed
 
         return result
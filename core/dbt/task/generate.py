@@ -2,15 +2,18 @@ import os
 import shutil
 
 from dbt.adapters.factory import get_adapter
-from dbt.clients.system import write_json
+from dbt.clients.system import write_file_chunks
 from dbt.compat import bigint
 from dbt.include.global_project import DOCS_INDEX_FILE_PATH
 import dbt.ui.printer
 import dbt.utils
 import dbt.compilation
 import dbt.exceptions
+import dbt.flags
+import dbt.loader
 
 from dbt.task.compile import CompileTask
+from dbt.task.runnable import read_binary_manifest
 
 
 CATALOG_FILENAME = 'catalog.json'
@@ -161,8 +164,15 @@ def unflatten(columns):
     return structured
 
 
-def incorporate_catalog_unique_ids(catalog, manifest):
+def incorporate_catalog_unique_ids(catalog, manifest, matched=None):
+    """Map the unique ID of each node in the manifest to its table in the
+    catalog. If given, matched maps the unique IDs matched in other parts of
+    the catalog to their tables' metadata, and is updated with this part's
+    matches.
+    """
     nodes = {}
+    if matched is None:
+        matched = {}
 
     for schema, tables in catalog.items():
         for table_name, table_def in tables.items():
@@ -170,24 +180,61 @@ def incorporate_catalog_unique_ids(catalog, manifest):
                 schema, table_name)
 
             for unique_id in unique_ids:
-                if unique_id in nodes:
+                if unique_id in matched:
                     dbt.exceptions.raise_ambiguous_catalog_match(
-                        unique_id, nodes[unique_id], table_def)
+                        unique_id, matched[unique_id], table_def)
 
                 else:
                     table_def_copy = table_def.copy()
                     table_def_copy['unique_id'] = unique_id
                     nodes[unique_id] = table_def_copy
+                    matched[unique_id] = {'metadata': table_def['metadata']}
 
     return nodes
 
 
+def iter_catalog_nodes(catalog_tables, manifest):
+    """Given an iterable of tables of catalog rows, each holding
+    everything for the tables it mentions, yield the (unique ID, JSON chunks)
+    pair of each node's catalog entry, a table at a time.
+    """
+    matched = {}
+    for table in catalog_tables:
+        columns = list(table.to_dicts())
+        nodes = incorporate_catalog_unique_ids(unflatten(columns), manifest,
+                                               matched)
+        for unique_id, node in nodes.items():
+            yield unique_id, dbt.utils.json_chunks(node)
+
+
 class GenerateTask(CompileTask):
+    def manifest_formats(self):
+        # the docs site always reads manifest.json
+        formats = super(GenerateTask, self).manifest_formats()
+        return formats | {'json'}
+
     def _get_manifest(self):
-        manifest = dbt.loader.GraphLoader.load_all(self.config)
+        if self.manifest is not None:
+            # compiling already loaded it
+            return self.manifest
+        projects = None
+        if dbt.flags.MANIFEST_FORMAT == 'binary':
+            projects = dbt.loader.load_all_projects(self.config)
+            fingerprint = dbt.loader.GraphLoader.fingerprint(self.config,
+                                                             projects)
+            manifest = read_binary_manifest(self.config, fingerprint)
+            if manifest is not None:
+                return manifest
+        manifest = dbt.loader.GraphLoader.load_all(self.config,
+                                                   projects=projects)
         return manifest
 
     def run(self):
+        """Compile the project unless --no-compile was given, then write
+        catalog.json. Catalog entries are written as they're fetched and
+        aren't kept, so unlike older versions the results have no 'nodes'
+        entry; 'path' is where to find them.
+        """
         compile_results = None
         if self.args.compile:
             compile_results = super(GenerateTask, self).run()
@@ -202,29 +249,25 @@ class GenerateTask(CompileTask):
             os.path.join(self.config.target_path, 'index.html'))
 
         adapter = get_adapter(self.config)
+        path = os.path.join(self.config.target_path, CATALOG_FILENAME)
         with adapter.connection_named('generate_catalog'):
             manifest = self._get_manifest()
 
             dbt.ui.printer.print_timestamped_line("Building catalog")
-            results = adapter.get_catalog(manifest)
-
-        results = [
-            dict(zip(results.column_names, row))
-            for row in results
-        ]
-
-        nested_results = unflatten(results)
-        results = {
-            'nodes': incorporate_catalog_unique_ids(nested_results, manifest),
-            'generated_at': dbt.utils.timestring(),
-        }
-
-        path = os.path.join(self.config.target_path, CATALOG_FILENAME)
-        write_json(path, results)
+            # each schema's part of the catalog is written out as soon as it
+            # has been fetched
+            catalog_nodes = iter_catalog_nodes(adapter.iter_catalog(manifest),
+                                               manifest)
+            generated_at = dbt.utils.timestring()
+            write_file_chunks(path, dbt.utils.json_object_chunks([
+                ('nodes', dbt.utils.json_object_chunks(catalog_nodes)),
+                ('generated_at', dbt.utils.json_chunks(generated_at)),
+            ]))
 
         dbt.ui.printer.print_timestamped_line(
             'Catalog written to {}'.format(os.path.abspath(path))
         )
+        results = {'generated_at': generated_at, 'path': path}
         # now that we've serialized the data we can add compile_results in to
         # make interpret_results happy.
         results['compile_results'] = compile_results
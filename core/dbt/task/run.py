@@ -1,6 +1,7 @@
 from __future__ import print_function
 
 import functools
+import os
 import time
 
 from dbt.logger import GLOBAL_LOGGER as logger
@@ -18,11 +19,15 @@ from dbt.ui.printer import \
     print_run_end_messages, \
     get_counts
 
+from dbt.compat import bigint
 from dbt.compilation import compile_node
 from dbt.task.compile import CompileTask, RemoteCompileTask
 from dbt.utils import get_nodes_by_tags
 
 
+RELATION_CACHE_FILE_NAME = 'relation_cache.pickle'
+
+
 class Timer(object):
     def __init__(self):
         self.start = None
@@ -59,8 +64,28 @@ class RunTask(CompileTask):
     def raise_on_first_error(self):
         return False
 
-    def populate_adapter_cache(self, adapter):
-        adapter.set_relations_cache(self.manifest)
+    def _relation_cache_path(self):
+        return os.path.join(self.config.target_path,
+                            RELATION_CACHE_FILE_NAME)
+
+    def populate_adapter_cache(self, adapter, selected_uids=None):
+        max_age = dbt.flags.RELATION_CACHE_TTL
+        if max_age is None or dbt.flags.REFRESH_RELATION_CACHE:
+            adapter.set_relations_cache(self.manifest)
+            return
+
+        if selected_uids is None:
+            selected_uids = self.manifest.nodes
+        adapter.set_relations_cache_from_snapshot(
+            self.manifest,
+            self._relation_cache_path(),
+            max_age,
+            self.get_model_schemas(selected_uids)
+        )
+
+    def save_adapter_cache(self, adapter):
+        if dbt.flags.RELATION_CACHE_TTL is not None:
+            adapter.save_relations_cache(self._relation_cache_path())
 
     def get_hook_sql(self, adapter, hook, idx, num_hooks, extra_context):
         compiled = compile_node(adapter, self.config, hook, self.manifest,
@@ -147,7 +172,7 @@ class RunTask(CompileTask):
     def before_run(self, adapter, selected_uids):
         with adapter.connection_named('master'):
             self.create_schemas(adapter, selected_uids)
-            self.populate_adapter_cache(adapter)
+            self.populate_adapter_cache(adapter, selected_uids)
             self.safe_run_hooks(adapter, RunHookType.Start, {})
 
     def after_run(self, adapter, results):
@@ -161,6 +186,7 @@ class RunTask(CompileTask):
         with adapter.connection_named('master'):
             self.safe_run_hooks(adapter, RunHookType.End,
                                 {'schemas': schemas, 'results': results})
+        self.save_adapter_cache(adapter)
 
     def after_hooks(self, adapter, results, elapsed):
         self.print_results_line(results, elapsed)
@@ -181,8 +207,44 @@ class RunTask(CompileTask):
             print_run_end_messages(results)
 
 
+def _bounded_max_rows(requested, server_max):
+    """Return the most rows to send back for a request that asked for
+    requested rows (None for the server's limit), when the server allows at
+    most server_max (None for no limit).
+    """
+    if requested is None:
+        return server_max
+    if isinstance(requested, bool) or \
+            not isinstance(requested, (int, bigint)) or requested < 0:
+        raise dbt.exceptions.RuntimeException(
+            'max_rows must be a non-negative integer, got {!r}'
+            .format(requested)
+        )
+    if server_max is None:
+        return requested
+    return min(requested, server_max)
+
+
 class RemoteRunTask(RemoteCompileTask, RunTask):
     METHOD_NAME = 'run'
 
+    def __init__(self, args, config, manifest):
+        super(RemoteRunTask, self).__init__(args, config, manifest)
+        self.max_rows = getattr(args, 'max_rows', None)
+
     def get_runner_type(self):
         return RPCExecuteRunner
+
+    def get_runner(self, node):
+        runner = super(RemoteRunTask, self).get_runner(node)
+        runner.max_rows = self.max_rows
+        return runner
+
+    def handle_request(self, name, sql, macros=None, max_rows=None):
+        """Run sql and return its results, with at most max_rows rows (and
+        never more than the server's --max-rows, if it was set). All the rows
+        are returned if neither is set.
+        """
+        self.max_rows = _bounded_max_rows(max_rows,
+                                          getattr(self.args, 'max_rows', None))
+        return super(RemoteRunTask, self).handle_request(name, sql, macros)
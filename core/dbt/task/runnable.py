@@ -1,4 +1,5 @@
 import base64
+import json
 import os
 import re
 import time
@@ -13,9 +14,12 @@ from dbt.compat import to_unicode
 from dbt.compilation import compile_manifest
 from dbt.contracts.graph.manifest import CompileResultNode
 from dbt.contracts.results import ExecutionResult
-from dbt.loader import GraphLoader
+from dbt.linker import DEFAULT_PRIORITY_POLICY
+from dbt.loader import GraphLoader, load_all_projects
+from dbt.clients.system import load_file_contents
 
 import dbt.exceptions
+import dbt.flags
 import dbt.ui.printer
 import dbt.utils
 
@@ -23,27 +27,91 @@ import dbt.graph.selector
 
 RESULT_FILE_NAME = 'run_results.json'
 MANIFEST_FILE_NAME = 'manifest.json'
+BINARY_MANIFEST_FILE_NAME = 'manifest.pickle'
+
+
+def write_manifest(config, manifest, formats, fingerprint=None):
+    """Write the manifest to the target path in each of the given formats
+    ('json' and/or 'binary'). fingerprint is stored in the binary manifest.
+    """
+    if 'json' in formats:
+        manifest.write(os.path.join(config.target_path, MANIFEST_FILE_NAME))
+    if 'binary' in formats:
+        manifest.write_binary(
+            os.path.join(config.target_path, BINARY_MANIFEST_FILE_NAME),
+            fingerprint
+        )
+
 
+def read_binary_manifest(config, fingerprint):
+    """Return the manifest in the target path's manifest.pickle if it was
+    written with the given fingerprint, or None.
+    """
+    path = os.path.join(config.target_path, BINARY_MANIFEST_FILE_NAME)
+    return GraphLoader.load_binary(config, path, fingerprint)
+
+
+def load_manifest(config, formats=None):
+    """Parse the project into a manifest and write it out in each of formats
+    (by default, the --manifest-format). With the binary format, a
+    manifest.pickle written for the project as it is now is loaded instead
+    of parsing the project again.
+    """
+    if formats is None:
+        formats = {dbt.flags.MANIFEST_FORMAT}
+
+    fingerprint = None
+    projects = None
+    if 'binary' in formats:
+        # the projects are loaded once, to fingerprint and then to parse them
+        projects = load_all_projects(config)
+        fingerprint = GraphLoader.fingerprint(config, projects)
+        manifest = read_binary_manifest(config, fingerprint)
+        if manifest is not None:
+            write_manifest(config, manifest, formats - {'binary'})
+            return manifest
 
-def load_manifest(config):
     # performance trick: if the adapter has a manifest loaded, use that to
     # avoid parsing internal macros twice.
     internal_manifest = get_adapter(config).check_internal_manifest()
     manifest = GraphLoader.load_all(config,
-                                    internal_manifest=internal_manifest)
+                                    internal_manifest=internal_manifest,
+                                    projects=projects)
 
-    manifest.write(os.path.join(config.target_path, MANIFEST_FILE_NAME))
+    write_manifest(config, manifest, formats, fingerprint)
     return manifest
 
 
+def load_previous_timings(path):
+    """Load the execution time of each node in a previous run_results.json as
+    a dict mapping unique IDs to seconds. If there are no usable previous
+    results, return an empty dict.
+    """
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        results = json.loads(load_file_contents(path))['results']
+        return {
+            r['node']['unique_id']: r['execution_time'] for r in results
+        }
+    except (ValueError, KeyError, TypeError) as exc:
+        logger.debug('Could not load previous run timings from {}: {}'
+                     .format(path, exc))
+        return {}
+
+
 class ManifestTask(ConfiguredTask):
     def __init__(self, args, config):
         super(ManifestTask, self).__init__(args, config)
         self.manifest = None
         self.linker = None
 
+    def manifest_formats(self):
+        return {dbt.flags.MANIFEST_FORMAT}
+
     def _runtime_initialize(self):
-        self.manifest = load_manifest(self.config)
+        self.manifest = load_manifest(self.config, self.manifest_formats())
         self.linker = compile_manifest(self.config, self.manifest)
 
 
@@ -58,6 +126,7 @@ class GraphRunnableTask(ManifestTask):
         self.node_results = []
         self._skipped_children = {}
         self._raise_next_tick = None
+        self.connection_pool_stats = None
 
     def select_nodes(self):
         selector = dbt.graph.selector.NodeSelector(self.linker, self.manifest)
@@ -67,8 +136,14 @@ class GraphRunnableTask(ManifestTask):
     def _runtime_initialize(self):
         super(GraphRunnableTask, self)._runtime_initialize()
         selected_nodes = self.select_nodes()
+        priority = getattr(self.args, 'priority', DEFAULT_PRIORITY_POLICY)
+        timings = None
+        if priority == 'critical-path':
+            timings = load_previous_timings(self.result_path())
         self.job_queue = self.linker.as_graph_queue(self.manifest,
-                                                    selected_nodes)
+                                                    selected_nodes,
+                                                    priority=priority,
+                                                    timings=timings)
 
         # we use this a couple times. order does not matter.
         self._flattened_nodes = [
@@ -176,7 +251,7 @@ class GraphRunnableTask(ManifestTask):
 
         node = CompileResultNode(**result.node)
         node_id = node.unique_id
-        self.manifest.nodes[node_id] = node
+        self.manifest.update_node(node)
 
         if result.error is not None:
             if is_ephemeral:
@@ -257,6 +332,8 @@ class GraphRunnableTask(ManifestTask):
 
         finally:
             adapter.cleanup_connections()
+            self.connection_pool_stats = \
+                adapter.connections.pool.stats.serialize()
 
         result = self.get_result(
             results=res,
@@ -317,17 +394,22 @@ class GraphRunnableTask(ManifestTask):
         required_databases = set(db for db, _ in required_schemas)
 
         existing_schemas = set()
-        for db in required_databases:
-            existing_schemas.update((db, s) for s in adapter.list_schemas(db))
+        schemas_by_db = adapter.list_schemas_in_databases(required_databases)
+        for db, schemas in schemas_by_db.items():
+            existing_schemas.update((db, s) for s in schemas)
 
         for database, schema in (required_schemas - existing_schemas):
             adapter.create_schema(database, schema)
 
     def get_result(self, results, elapsed_time, generated_at):
+        kwargs = {}
+        if self.connection_pool_stats is not None:
+            kwargs['connection_pool'] = self.connection_pool_stats
         return ExecutionResult(
             results=results,
             elapsed_time=elapsed_time,
-            generated_at=generated_at
+            generated_at=generated_at,
+            **kwargs
         )
 
     def task_end_messages(self, results):
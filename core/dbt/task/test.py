@@ -14,10 +14,10 @@ class TestTask(RunTask):
 
     def before_run(self, adapter, selected_uids):
         # Don't execute on-run-* hooks for tests
-        self.populate_adapter_cache(adapter)
+        self.populate_adapter_cache(adapter, selected_uids)
 
     def after_run(self, adapter, results):
-        pass
+        self.save_adapter_cache(adapter)
 
     def build_query(self):
         query = {
@@ -63,12 +63,9 @@ def compiler_warning(model, msg, resource_type='model'):
     )
 
 
-def id_matches(unique_id, target_name, target_package, nodetypes, model):
-    """Return True if the unique ID matches the given name, package, and type.
-
-    If package is None, any package is allowed.
-    nodetypes should be a container of NodeTypes that implements the 'in'
-    operator.
+def split_unique_id(unique_id, model):
+    """Split the unique ID of the given model into its resource type, package
+    name and node name, raising a compiler error if it is malformed.
     """
     node_type = model.get('resource_type', 'node')
     node_parts = unique_id.split('.', 2)
@@ -87,6 +84,18 @@ def id_matches(unique_id, target_name, target_package, nodetypes, model):
             msg = "{} names cannot contain '.' characters".format(node_type)
             dbt.exceptions.raise_compiler_error(msg, model)
 
+    return resource_type, package_name, node_name
+
+
+def id_matches(unique_id, target_name, target_package, nodetypes, model):
+    """Return True if the unique ID matches the given name, package, and type.
+
+    If package is None, any package is allowed.
+    nodetypes should be a container of NodeTypes that implements the 'in'
+    operator.
+    """
+    resource_type, package_name, node_name = split_unique_id(unique_id, model)
+
     if resource_type not in nodetypes:
         return False
 
@@ -177,6 +186,27 @@ def _merge(a, b):
     return to_return
 
 
+_ATOMIC_TYPES = frozenset(
+    [int, float, bool, type(None), str, type(u'')]
+)
+
+
+def copy_json(value):
+    """A faster copy.deepcopy for the plain dicts, lists and scalars that
+    make up most of dbt's contracts. Anything else (including subclasses of
+    dict and list) is copied with copy.deepcopy.
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value
+    elif value_type is dict:
+        return {k: copy_json(v) for k, v in value.items()}
+    elif value_type is list:
+        return [copy_json(v) for v in value]
+    else:
+        return copy.deepcopy(value)
+
+
 # http://stackoverflow.com/questions/20656135/python-deep-merge-dictionary-data
 def deep_merge(*args):
     """
@@ -187,15 +217,18 @@ def deep_merge(*args):
         return None
 
     if len(args) == 1:
-        return copy.deepcopy(args[0])
+        return copy_json(args[0])
 
     lst = list(args)
-    last = copy.deepcopy(lst.pop(len(lst) - 1))
+    last = copy_json(lst.pop(len(lst) - 1))
 
     return _deep_merge(deep_merge(*lst), last)
 
 
 def _deep_merge(destination, source):
+    """Merge source into destination in place. Both must already be private
+    copies.
+    """
     if isinstance(source, dict):
         for key, value in source.items():
             deep_merge_item(destination, key, value)
@@ -205,7 +238,7 @@ def _deep_merge(destination, source):
 def deep_merge_item(destination, key, value):
     if isinstance(value, dict):
         node = destination.setdefault(key, {})
-        destination[key] = deep_merge(node, value)
+        destination[key] = _deep_merge(node, value)
     elif isinstance(value, tuple) or isinstance(value, list):
         if key in destination:
             destination[key] = list(value) + list(destination[key])
@@ -456,6 +489,72 @@ class JSONEncoder(json.JSONEncoder):
         return super(JSONEncoder, self).default(obj)
 
 
+def json_chunks(value):
+    """Return the JSON encoding of value as a one-item tuple, for use as the
+    chunks of a value in `json_object_chunks`.
+    """
+    return (json.dumps(value, cls=JSONEncoder),)
+
+
+def json_object_chunks(items):
+    """Yield the JSON encoding of an object piece by piece, given its (key,
+    chunks) pairs, where chunks is an iterable of the pieces of the encoded
+    value. The pieces join up to exactly what json.dumps would produce.
+    """
+    yield '{'
+    for position, (key, chunks) in enumerate(items):
+        if position:
+            yield ', '
+        yield json.dumps(key) + ': '
+        for chunk in chunks:
+            yield chunk
+    yield '}'
+
+
+def json_list_chunks(values):
+    """Yield the JSON encoding of a list piece by piece, encoding each value
+    as it's reached.
+    """
+    yield '['
+    for position, value in enumerate(values):
+        if position:
+            yield ', '
+        yield json.dumps(value, cls=JSONEncoder)
+    yield ']'
+
+
+class ChunkReader(object):
+    """A read-only file-like object over an iterable of strings, for APIs
+    that read their input from a file, so the whole input never has to be
+    built up in memory.
+    """
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._chunk = ''
+        self._position = 0
+
+    def read(self, size=-1):
+        parts = []
+        while size != 0:
+            if self._position >= len(self._chunk):
+                try:
+                    self._chunk = next(self._chunks)
+                except StopIteration:
+                    break
+                self._position = 0
+                continue
+
+            end = len(self._chunk)
+            if size > 0:
+                end = min(end, self._position + size)
+            part = self._chunk[self._position:end]
+            self._position = end
+            parts.append(part)
+            if size > 0:
+                size -= len(part)
+        return ''.join(parts)
+
+
 def translate_aliases(kwargs, aliases):
     """Given a dict of keyword arguments and a dict mapping aliases to their
     canonical values, canonicalize the keys in the kwargs dict.
@@ -9,6 +9,7 @@ import google.cloud.bigquery
 import dbt.clients.agate_helper
 import dbt.exceptions
 from dbt.adapters.base import BaseConnectionManager, Credentials
+from dbt.adapters.base import QueryResult
 from dbt.logger import GLOBAL_LOGGER as logger
 
 
@@ -42,6 +43,22 @@ BIGQUERY_CREDENTIALS_CONTRACT = {
 }
 
 
+# the agate types of the values the client returns for standard sql types
+AGATE_TYPES = {
+    'INTEGER': dbt.clients.agate_helper.NUMBER,
+    'INT64': dbt.clients.agate_helper.NUMBER,
+    'FLOAT': dbt.clients.agate_helper.NUMBER,
+    'FLOAT64': dbt.clients.agate_helper.NUMBER,
+    'NUMERIC': dbt.clients.agate_helper.NUMBER,
+    'BOOLEAN': dbt.clients.agate_helper.BOOLEAN,
+    'BOOL': dbt.clients.agate_helper.BOOLEAN,
+    'STRING': dbt.clients.agate_helper.TEXT,
+    'DATE': dbt.clients.agate_helper.DATE,
+    'DATETIME': dbt.clients.agate_helper.DATETIME,
+    'TIMESTAMP': dbt.clients.agate_helper.DATETIME,
+}
+
+
 class BigQueryCredentials(Credentials):
     SCHEMA = BIGQUERY_CREDENTIALS_CONTRACT
     ALIASES = {
@@ -179,10 +196,23 @@ class BigQueryConnectionManager(BaseConnectionManager):
         return credentials.get('timeout_seconds', cls.QUERY_TIMEOUT)
 
     @classmethod
-    def get_table_from_response(cls, resp):
+    def get_agate_type(cls, field):
+        if field.mode == 'REPEATED':
+            return None
+        return AGATE_TYPES.get(field.field_type)
+
+    @classmethod
+    def iter_result_from_response(cls, resp, limit=None):
         column_names = [field.name for field in resp.schema]
-        rows = [dict(row.items()) for row in resp]
-        return dbt.clients.agate_helper.table_from_data(rows, column_names)
+        column_types = [cls.get_agate_type(field) for field in resp.schema]
+        # the row iterator fetches one page of results at a time
+        rows = (row.values() for row in resp)
+        return QueryResult.from_iterator(column_names, column_types, rows,
+                                         limit=limit)
+
+    @classmethod
+    def get_table_from_response(cls, resp):
+        return cls.iter_result_from_response(resp).to_table()
 
     def raw_execute(self, sql, fetch=False):
         conn = self.get_thread_connection()
@@ -213,6 +243,11 @@ class BigQueryConnectionManager(BaseConnectionManager):
         status = 'OK'
         return status, res
 
+    def execute_iter(self, sql, auto_begin=False, limit=None):
+        # auto_begin is ignored on bigquery, and only included for consistency
+        _, iterator = self.raw_execute(sql, fetch=True)
+        return 'OK', self.iter_result_from_response(iterator, limit=limit)
+
     def create_bigquery_table(self, database, schema, table_name, callback,
                               sql):
         """Create a bigquery table. The caller must supply a callback
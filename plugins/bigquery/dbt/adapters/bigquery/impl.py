@@ -8,6 +8,7 @@ import dbt.exceptions
 import dbt.flags as flags
 import dbt.clients.gcloud
 import dbt.clients.agate_helper
+import dbt.clients.columnar
 
 from dbt.adapters.base import BaseAdapter, available
 from dbt.adapters.bigquery import BigQueryRelation
@@ -364,6 +365,29 @@ class BigQueryAdapter(BaseAdapter):
         new_table = google.cloud.bigquery.Table(table_ref, schema=new_schema)
         client.update_table(new_table, ['schema'])
 
+    @available.parse_none
+    def get_table_description(self, relation):
+        """Get the description of a table, or None if it has none."""
+        conn = self.connections.get_thread_connection()
+        client = conn.handle
+        table_ref = self.connections.table_ref(relation.database,
+                                               relation.schema,
+                                               relation.identifier, conn)
+        with self.connections.exception_handler('get table'):
+            return client.get_table(table_ref).description
+
+    @available.parse_none
+    def update_table_description(self, relation, description):
+        conn = self.connections.get_thread_connection()
+        client = conn.handle
+        table_ref = self.connections.table_ref(relation.database,
+                                               relation.schema,
+                                               relation.identifier, conn)
+        with self.connections.exception_handler('update table'):
+            table = client.get_table(table_ref)
+            table.description = description
+            client.update_table(table, ['description'])
+
     @available.parse_none
     def load_dataframe(self, database, schema, table_name, agate_table,
                        column_override):
@@ -452,62 +476,81 @@ class BigQueryAdapter(BaseAdapter):
         )
         return zip(column_names, column_values)
 
-    def get_catalog(self, manifest):
+    _CATALOG_COLUMN_NAMES = (
+        'table_database',
+        'table_schema',
+        'table_name',
+        'table_type',
+        'table_comment',
+        # does not exist in bigquery, but included for consistency
+        'table_owner',
+        'column_name',
+        'column_index',
+        'column_type',
+        'column_comment',
+    )
+
+    def _get_schema_catalog_rows(self, database_name, schema_name):
         connection = self.connections.get_thread_connection()
         client = connection.handle
-
-        schemas = manifest.get_used_schemas()
-
-        column_names = (
-            'table_database',
-            'table_schema',
-            'table_name',
-            'table_type',
-            'table_comment',
-            # does not exist in bigquery, but included for consistency
-            'table_owner',
-            'column_name',
-            'column_index',
-            'column_type',
-            'column_comment',
-        )
-        all_names = column_names + self._get_stats_column_names()
+        column_names = self._CATALOG_COLUMN_NAMES
         columns = []
 
-        for database_name, schema_name in schemas:
-            relations = self.list_relations(database_name, schema_name)
-            for relation in relations:
+        relations = self.list_relations(database_name, schema_name)
+        for relation in relations:
 
-                # This relation contains a subset of the info we care about.
-                # Fetch the full table object here
-                table_ref = self.connections.table_ref(
-                    database_name,
+            # This relation contains a subset of the info we care about.
+            # Fetch the full table object here
+            table_ref = self.connections.table_ref(
+                database_name,
+                relation.schema,
+                relation.identifier,
+                connection
+            )
+            table = client.get_table(table_ref)
+
+            flattened = self._flat_columns_in_table(table)
+            relation_stats = dict(self._get_stats_columns(table,
+                                                          relation.type))
+
+            for index, column in enumerate(flattened, start=1):
+                column_data = (
+                    relation.database,
                     relation.schema,
-                    relation.identifier,
-                    connection
+                    relation.name,
+                    relation.type,
+                    None,
+                    None,
+                    column.name,
+                    index,
+                    column.data_type,
+                    None,
                 )
-                table = client.get_table(table_ref)
-
-                flattened = self._flat_columns_in_table(table)
-                relation_stats = dict(self._get_stats_columns(table,
-                                                              relation.type))
-
-                for index, column in enumerate(flattened, start=1):
-                    column_data = (
-                        relation.database,
-                        relation.schema,
-                        relation.name,
-                        relation.type,
-                        None,
-                        None,
-                        column.name,
-                        index,
-                        column.data_type,
-                        None,
-                    )
-                    column_dict = dict(zip(column_names, column_data))
-                    column_dict.update(copy.deepcopy(relation_stats))
-
-                    columns.append(column_dict)
+                column_dict = dict(zip(column_names, column_data))
+                column_dict.update(copy.deepcopy(relation_stats))
+
+                columns.append(column_dict)
+        return columns
+
+    def _get_schema_catalog(self, database_name, schema_name):
+        all_names = self._CATALOG_COLUMN_NAMES + \
+            self._get_stats_column_names()
+        columns = self._get_schema_catalog_rows(database_name, schema_name)
+        return dbt.clients.columnar.ColumnarTable.from_dicts(columns,
+                                                             all_names)
+
+    def get_catalog(self, manifest):
+        all_names = self._CATALOG_COLUMN_NAMES + \
+            self._get_stats_column_names()
+        columns = []
+        for database_name, schema_name in manifest.get_used_schemas():
+            columns.extend(
+                self._get_schema_catalog_rows(database_name, schema_name)
+            )
 
         return dbt.clients.agate_helper.table_from_data(columns, all_names)
+
+    def iter_catalog(self, manifest):
+        schemas = sorted(manifest.get_used_schemas())
+        return self._imap_on_connections(self._get_schema_catalog, schemas,
+                                         'generate_catalog')
@@ -5,6 +5,8 @@ import google.cloud.bigquery
 
 
 class BigQueryRelation(BaseRelation):
+    __slots__ = ()
+
     External = "external"
 
     DEFAULTS = {
@@ -114,6 +116,8 @@ class BigQueryRelation(BaseRelation):
 
 
 class BigQueryColumn(Column):
+    __slots__ = ('fields', 'mode')
+
     TYPE_LABELS = {
         'STRING': 'STRING',
         'TIMESTAMP': 'TIMESTAMP',
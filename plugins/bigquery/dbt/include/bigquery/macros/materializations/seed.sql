@@ -13,3 +13,11 @@
   {{ adapter.load_dataframe(model['database'], model['schema'], model['alias'], model['agate_table'], column_override) }}
 
 {% endmacro %}
+
+{% macro bigquery__get_seed_checksum(relation) %}
+  {{ return(adapter.get_table_description(relation)) }}
+{% endmacro %}
+
+{% macro bigquery__persist_seed_checksum(relation, checksum) %}
+  {{ adapter.update_table_description(relation, checksum) }}
+{% endmacro %}
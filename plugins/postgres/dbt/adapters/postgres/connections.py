@@ -1,9 +1,12 @@
 from contextlib import contextmanager
+import time
 
 import psycopg2
 
+import dbt.clients.agate_helper
 import dbt.compat
 import dbt.exceptions
+import dbt.utils
 from dbt.adapters.base import Credentials
 from dbt.adapters.sql import SQLConnectionManager
 from dbt.logger import GLOBAL_LOGGER as logger
@@ -44,6 +47,25 @@ POSTGRES_CREDENTIALS_CONTRACT = {
 }
 
 
+# the agate types of the values psycopg2 returns for common type oids
+AGATE_TYPES = {
+    16: dbt.clients.agate_helper.BOOLEAN,  # bool
+    20: dbt.clients.agate_helper.NUMBER,  # int8
+    21: dbt.clients.agate_helper.NUMBER,  # int2
+    23: dbt.clients.agate_helper.NUMBER,  # int4
+    700: dbt.clients.agate_helper.NUMBER,  # float4
+    701: dbt.clients.agate_helper.NUMBER,  # float8
+    1700: dbt.clients.agate_helper.NUMBER,  # numeric
+    25: dbt.clients.agate_helper.TEXT,  # text
+    1042: dbt.clients.agate_helper.TEXT,  # bpchar
+    1043: dbt.clients.agate_helper.TEXT,  # varchar
+    1082: dbt.clients.agate_helper.DATE,  # date
+    1114: dbt.clients.agate_helper.DATETIME,  # timestamp
+    1184: dbt.clients.agate_helper.DATETIME,  # timestamptz
+    1186: dbt.clients.agate_helper.TIMEDELTA,  # interval
+}
+
+
 class PostgresCredentials(Credentials):
     SCHEMA = POSTGRES_CREDENTIALS_CONTRACT
     ALIASES = {
@@ -62,6 +84,7 @@ class PostgresCredentials(Credentials):
 class PostgresConnectionManager(SQLConnectionManager):
     DEFAULT_TCP_KEEPALIVE = 0  # 0 means to use the default value
     TYPE = 'postgres'
+    COPY_READ_SIZE = 1024 * 1024
 
     @contextmanager
     def exception_handler(self, sql):
@@ -140,6 +163,12 @@ class PostgresConnectionManager(SQLConnectionManager):
 
         return connection
 
+    @classmethod
+    def is_healthy(cls, connection):
+        # psycopg2 notices a dropped connection the next time it's used, and
+        # marks it closed
+        return connection.state == 'open' and connection.handle.closed == 0
+
     def cancel(self, connection):
         connection_name = connection.name
         pid = connection.handle.get_backend_pid()
@@ -160,3 +189,31 @@ class PostgresConnectionManager(SQLConnectionManager):
     @classmethod
     def get_status(cls, cursor):
         return cursor.statusmessage
+
+    def copy_from(self, sql, chunks):
+        """Run a `copy ... from stdin` statement, streaming the strings in
+        chunks to it as its input.
+        """
+        connection = self.get_thread_connection()
+        if connection.transaction_open is False:
+            self.begin()
+
+        logger.debug('Using {} connection "{}".'
+                     .format(self.TYPE, connection.name))
+
+        with self.exception_handler(sql):
+            logger.debug('On %s: %s', connection.name, sql)
+            pre = time.time()
+
+            cursor = connection.handle.cursor()
+            cursor.copy_expert(sql, dbt.utils.ChunkReader(chunks),
+                               size=self.COPY_READ_SIZE)
+
+            logger.debug("SQL status: %s in %0.2f seconds",
+                         self.get_status(cursor), (time.time() - pre))
+
+            return connection, cursor
+
+    @classmethod
+    def get_agate_type(cls, type_code):
+        return AGATE_TYPES.get(type_code)
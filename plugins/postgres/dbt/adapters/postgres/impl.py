@@ -2,6 +2,7 @@ from dbt.adapters.base.meta import available
 from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.postgres import PostgresConnectionManager
 from dbt.adapters.postgres import PostgresColumn
+import dbt.clients.agate_helper
 import dbt.compat
 import dbt.exceptions
 
@@ -14,6 +15,8 @@ class PostgresAdapter(SQLAdapter):
     ConnectionManager = PostgresConnectionManager
     Column = PostgresColumn
 
+    CATALOG_BY_SCHEMA = True
+
     @classmethod
     def date_function(cls):
         return 'now()'
@@ -33,6 +36,19 @@ class PostgresAdapter(SQLAdapter):
         # return an empty string on success so macros can call this
         return ''
 
+    @available
+    def bulk_load_csv_rows(self, relation, agate_table):
+        if not dbt.clients.agate_helper.can_write_csv(agate_table):
+            return None
+
+        sql = 'copy {} ({}) from stdin with csv'.format(
+            relation.render(False), ', '.join(agate_table.column_names)
+        )
+        self.connections.copy_from(
+            sql, dbt.clients.agate_helper.csv_chunks(agate_table)
+        )
+        return sql
+
     def _link_cached_database_relations(self, schemas):
         """
 
@@ -83,6 +99,8 @@ class PostgresAdapter(SQLAdapter):
 
         self._link_cached_database_relations(schemas)
 
-    def _relations_cache_for_schemas(self, manifest):
-        super(PostgresAdapter, self)._relations_cache_for_schemas(manifest)
+    def _relations_cache_for_schemas(self, manifest, cache_schemas=None):
+        super(PostgresAdapter, self)._relations_cache_for_schemas(
+            manifest, cache_schemas
+        )
         self._link_cached_relations(manifest)
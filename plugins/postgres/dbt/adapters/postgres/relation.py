@@ -2,6 +2,8 @@ from dbt.adapters.base import Column
 
 
 class PostgresColumn(Column):
+    __slots__ = ()
+
     @property
     def data_type(self):
         # on postgres, do not convert 'text' to 'varchar()'
@@ -107,3 +107,23 @@
                                   })) -%}
 {% endmacro %}
 
+
+{% macro postgres__get_seed_checksum(relation) %}
+  {% call statement('get_seed_checksum', fetch_result=True) %}
+    select description
+    from pg_description
+    join pg_class on pg_class.oid = pg_description.objoid
+    join pg_namespace on pg_namespace.oid = pg_class.relnamespace
+    where pg_namespace.nspname = '{{ relation.schema }}'
+      and pg_class.relname = '{{ relation.identifier }}'
+      and pg_description.objsubid = 0
+  {% endcall %}
+  {% set table = load_result('get_seed_checksum').table %}
+  {{ return(table[0][0] if table | length else none) }}
+{% endmacro %}
+
+{% macro postgres__persist_seed_checksum(relation, checksum) %}
+  {% call statement('persist_seed_checksum') %}
+    comment on table {{ relation }} is '{{ checksum }}'
+  {% endcall %}
+{% endmacro %}
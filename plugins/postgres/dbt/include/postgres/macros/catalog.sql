@@ -1,5 +1,5 @@
 
-{% macro postgres__get_catalog(information_schemas) -%}
+{% macro postgres__get_catalog(information_schemas, schemas=none) -%}
 
   {%- call statement('catalog', fetch_result=True) -%}
     {% if (information_schemas | length) != 1 %}
@@ -65,6 +65,7 @@
 
     where table_schema != 'information_schema'
       and table_schema not like 'pg_%'
+      {{ catalog_schemas_filter(schemas) }}
 
     order by column_index
 
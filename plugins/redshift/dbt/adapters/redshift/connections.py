@@ -1,5 +1,8 @@
 from contextlib import contextmanager
 import multiprocessing
+import os
+import threading
+import time
 
 from dbt.adapters.postgres import PostgresConnectionManager
 from dbt.adapters.postgres import PostgresCredentials
@@ -65,6 +68,124 @@ REDSHIFT_CREDENTIALS_CONTRACT = {
 }
 
 
+class _ClusterCredentials(object):
+    def __init__(self, credentials, expires_at, refresh_at):
+        self.credentials = credentials
+        self.expires_at = expires_at
+        self.refresh_at = refresh_at
+        self.refreshing = False
+
+
+class ClusterCredentialsCache(object):
+    """Temporary cluster credentials from AWS, shared by every connection the
+    process opens, keyed by (user, database, cluster). Each is fetched once
+    and used until it's about to expire, so connections don't each make their
+    own request.
+
+    Credentials are treated as expiring iam_duration_seconds after they were
+    requested. The first connection opened in the last REFRESH_AHEAD_SECONDS
+    before then starts fetching new ones in the background, and it and the
+    connections after it keep using the old ones until the new ones arrive.
+    """
+    REFRESH_AHEAD_SECONDS = 120
+
+    def __init__(self):
+        self._reset({})
+
+    def _reset(self, entries):
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._entries = entries
+        self._fetch_locks = {}
+
+    def _check_pid(self):
+        # a forked process gets its parent's locks as they were, possibly
+        # held by threads it doesn't have, and entries that a background
+        # refresh in its parent will never finish refreshing. The
+        # credentials themselves are still good.
+        if self._pid != os.getpid():
+            self._reset({
+                key: _ClusterCredentials(entry.credentials,
+                                         expires_at=entry.expires_at,
+                                         refresh_at=entry.refresh_at)
+                for key, entry in list(self._entries.items())
+            })
+
+    def clear(self):
+        self._check_pid()
+        with self._lock:
+            self._entries.clear()
+
+    def _valid_entry(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and time.time() < entry.expires_at:
+            return entry
+        return None
+
+    def _fetch(self, fetch, key, duration_s):
+        requested_at = time.time()
+        credentials = fetch(*(key + (duration_s,)))
+        logger.debug('Fetched temporary Redshift credentials for user "{}" '
+                     'on cluster "{}", valid for {} seconds'
+                     .format(key[0], key[2], duration_s))
+        expires_at = requested_at + duration_s
+        entry = _ClusterCredentials(
+            credentials,
+            expires_at=expires_at,
+            refresh_at=expires_at - self.REFRESH_AHEAD_SECONDS
+        )
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def _refresh(self, fetch, key, duration_s, entry, fetch_lock):
+        try:
+            with fetch_lock:
+                self._fetch(fetch, key, duration_s)
+        except Exception as exc:
+            # the old credentials are still good until they expire, and the
+            # first connection after that fetches new ones or fails to
+            logger.debug('Failed to refresh temporary Redshift credentials: '
+                         '{!s}'.format(exc))
+        finally:
+            with self._lock:
+                entry.refreshing = False
+
+    def get(self, fetch, db_user, db_name, cluster_id, duration_s):
+        """Get the credentials for a user, database and cluster, calling
+        fetch(db_user, db_name, cluster_id, duration_s) if there are none
+        yet or they've expired.
+        """
+        self._check_pid()
+        key = (db_user, db_name, cluster_id)
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+            entry = self._valid_entry(key)
+            if entry is not None:
+                if time.time() >= entry.refresh_at and not entry.refreshing:
+                    logger.debug('Refreshing temporary Redshift credentials '
+                                 'in the background')
+                    entry.refreshing = True
+                    thread = threading.Thread(
+                        target=self._refresh,
+                        args=(fetch, key, duration_s, entry, fetch_lock)
+                    )
+                    thread.daemon = True
+                    thread.start()
+                return entry.credentials
+
+        with fetch_lock:
+            # another thread may have fetched them while this one waited
+            with self._lock:
+                entry = self._valid_entry(key)
+            if entry is None:
+                entry = self._fetch(fetch, key, duration_s)
+            return entry.credentials
+
+
+CLUSTER_CREDENTIALS = ClusterCredentialsCache()
+
+
 class RedshiftCredentials(PostgresCredentials):
     SCHEMA = REDSHIFT_CREDENTIALS_CONTRACT
 
@@ -85,6 +206,46 @@ class RedshiftCredentials(PostgresCredentials):
 class RedshiftConnectionManager(PostgresConnectionManager):
     DEFAULT_TCP_KEEPALIVE = 240
     TYPE = 'redshift'
+    # redshift rejects statements longer than 16MB
+    MAX_INSERT_BYTES = 8 * 1024 * 1024
+
+    def insert_rows(self, sql, rows, num_columns):
+        """Insert rows with multi-row `insert` statements that start with sql
+        and are each kept under MAX_INSERT_BYTES. The values are rendered by
+        psycopg2 a row at a time instead of bound as parameters.
+        """
+        connection = self.get_thread_connection()
+        if connection.transaction_open is False:
+            self.begin()
+
+        logger.debug('Using {} connection "{}".'
+                     .format(self.TYPE, connection.name))
+
+        template = '({})'.format(', '.join(['%s'] * num_columns))
+        prefix = sql.encode('utf-8')
+
+        with self.exception_handler(sql):
+            logger.debug('On %s: %s', connection.name, sql)
+            pre = time.time()
+
+            cursor = connection.handle.cursor()
+            values = []
+            size = len(prefix)
+            for row in rows:
+                value = cursor.mogrify(template, tuple(row))
+                if values and size + len(value) > self.MAX_INSERT_BYTES:
+                    cursor.execute(prefix + b', '.join(values))
+                    values = []
+                    size = len(prefix)
+                values.append(value)
+                size += len(value) + 2
+            if values:
+                cursor.execute(prefix + b', '.join(values))
+
+            logger.debug("SQL status: %s in %0.2f seconds",
+                         self.get_status(cursor), (time.time() - pre))
+
+            return connection, cursor
 
     @contextmanager
     def fresh_transaction(self, name=None):
@@ -142,7 +303,8 @@ class RedshiftConnectionManager(PostgresConnectionManager):
                 "'cluster_id' must be provided in profile if IAM "
                 "authentication method selected")
 
-        cluster_creds = cls.fetch_cluster_credentials(
+        cluster_creds = CLUSTER_CREDENTIALS.get(
+            cls.fetch_cluster_credentials,
             credentials.user,
             credentials.database,
             credentials.cluster_id,
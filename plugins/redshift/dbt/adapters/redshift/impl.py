@@ -1,6 +1,8 @@
+from dbt.adapters.base.meta import available
 from dbt.adapters.postgres import PostgresAdapter
 from dbt.adapters.redshift import RedshiftConnectionManager
 from dbt.adapters.redshift import RedshiftColumn
+from dbt.clients.agate_helper import MaxByteLength
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
 
 
@@ -33,12 +35,21 @@ class RedshiftAdapter(PostgresAdapter):
             parent = super(RedshiftAdapter, self)
             return parent.drop_relation(relation)
 
+    @available
+    def bulk_load_csv_rows(self, relation, agate_table):
+        # redshift can only `copy` from S3 and other AWS services, so build
+        # large multi-row inserts in python instead
+        sql = 'insert into {} ({}) values '.format(
+            relation.render(False), ', '.join(agate_table.column_names)
+        )
+        self.connections.insert_rows(sql, agate_table.rows,
+                                     len(agate_table.column_names))
+        return sql + '...'
+
     @classmethod
     def convert_text_type(cls, agate_table, col_idx):
-        column = agate_table.columns[col_idx]
-        lens = (len(d.encode("utf-8")) for d in column.values_without_nulls())
-        max_len = max(lens) if lens else 64
-        return "varchar({})".format(max_len)
+        max_len = agate_table.aggregate(MaxByteLength(col_idx))
+        return "varchar({})".format(int(max_len) or 64)
 
     @classmethod
     def convert_time_type(cls, agate_table, col_idx):
@@ -2,4 +2,4 @@ from dbt.adapters.base import Column
 
 
 class RedshiftColumn(Column):
-    pass  # redshift does not inherit from postgres here
+    __slots__ = ()  # redshift does not inherit from postgres here
@@ -175,3 +175,12 @@
 {% macro redshift__make_temp_relation(base_relation, suffix) %}
     {% do return(postgres__make_temp_relation(base_relation, suffix)) %}
 {% endmacro %}
+
+
+{% macro redshift__get_seed_checksum(relation) %}
+  {{ return(postgres__get_seed_checksum(relation)) }}
+{% endmacro %}
+
+{% macro redshift__persist_seed_checksum(relation, checksum) %}
+  {{ postgres__persist_seed_checksum(relation, checksum) }}
+{% endmacro %}
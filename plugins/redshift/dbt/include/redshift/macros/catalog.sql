@@ -1,5 +1,5 @@
 
-{% macro redshift__get_base_catalog(information_schemas) -%}
+{% macro redshift__get_base_catalog(information_schemas, schemas=none) -%}
   {%- call statement('base_catalog', fetch_result=True) -%}
     {% if (information_schemas | length) != 1 %}
         {{ exceptions.raise_compiler_error('redshift get_catalog requires exactly one database') }}
@@ -99,6 +99,7 @@
 
     where table_schema != 'information_schema'
       and table_schema not like 'pg_%'
+      {{ catalog_schemas_filter(schemas) }}
 
     order by "column_index"
   {%- endcall -%}
@@ -106,7 +107,7 @@
   {{ return(load_result('base_catalog').table) }}
 {%- endmacro %}
 
-{% macro redshift__get_extended_catalog(information_schemas) %}
+{% macro redshift__get_extended_catalog(schemas=none) %}
   {%- call statement('extended_catalog', fetch_result=True) -%}
 
     select
@@ -183,6 +184,7 @@
         (skew_rows is not null) as "stats:skew_rows:include"
 
     from svv_table_info
+    {{ catalog_schemas_filter(schemas, column='"schema"', keyword='where') }}
 
   {%- endcall -%}
 
@@ -218,16 +220,16 @@
 {% endmacro %}
 
 
-{% macro redshift__get_catalog(information_schemas) %}
+{% macro redshift__get_catalog(information_schemas, schemas=none) %}
 
     {#-- Compute a left-outer join in memory. Some Redshift queries are
       -- leader-only, and cannot be joined to other compute-based queries #}
 
-    {% set catalog = redshift__get_base_catalog(information_schemas) %}
+    {% set catalog = redshift__get_base_catalog(information_schemas, schemas) %}
 
     {% set select_extended =  redshift__can_select_from('svv_table_info') %}
     {% if select_extended %}
-        {% set extended_catalog = redshift__get_extended_catalog() %}
+        {% set extended_catalog = redshift__get_extended_catalog(schemas) %}
         {% set catalog = catalog.join(extended_catalog, 'table_id') %}
     {% else %}
         {{ redshift__no_svv_table_info_warning() }}
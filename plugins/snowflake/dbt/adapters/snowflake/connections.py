@@ -5,6 +5,7 @@ from contextlib import contextmanager
 import snowflake.connector
 import snowflake.connector.errors
 
+import dbt.clients.agate_helper
 import dbt.compat
 import dbt.exceptions
 from cryptography.hazmat.backends import default_backend
@@ -57,6 +58,21 @@ SNOWFLAKE_CREDENTIALS_CONTRACT = {
 }
 
 
+# the agate types of the values the connector returns for its type codes
+# (see snowflake.connector.constants.FIELD_TYPES)
+AGATE_TYPES = {
+    0: dbt.clients.agate_helper.NUMBER,  # FIXED
+    1: dbt.clients.agate_helper.NUMBER,  # REAL
+    2: dbt.clients.agate_helper.TEXT,  # TEXT
+    3: dbt.clients.agate_helper.DATE,  # DATE
+    4: dbt.clients.agate_helper.DATETIME,  # TIMESTAMP
+    6: dbt.clients.agate_helper.DATETIME,  # TIMESTAMP_LTZ
+    7: dbt.clients.agate_helper.DATETIME,  # TIMESTAMP_TZ
+    8: dbt.clients.agate_helper.DATETIME,  # TIMESTAMP_NTZ
+    13: dbt.clients.agate_helper.BOOLEAN,  # BOOLEAN
+}
+
+
 class SnowflakeCredentials(Credentials):
     SCHEMA = SNOWFLAKE_CREDENTIALS_CONTRACT
 
@@ -146,6 +162,11 @@ class SnowflakeConnectionManager(SQLConnectionManager):
 
             raise dbt.exceptions.FailedToConnectException(str(e))
 
+    @classmethod
+    def is_healthy(cls, connection):
+        return connection.state == 'open' and \
+            not connection.handle.is_closed()
+
     def cancel(self, connection):
         handle = connection.handle
         sid = handle.session_id
@@ -170,6 +191,10 @@ class SnowflakeConnectionManager(SQLConnectionManager):
 
         return "{} {}".format(state, cursor.rowcount)
 
+    @classmethod
+    def get_agate_type(cls, type_code):
+        return AGATE_TYPES.get(type_code)
+
     @classmethod
     def _split_queries(cls, sql):
         "Splits sql statements at semicolons into discrete queries"
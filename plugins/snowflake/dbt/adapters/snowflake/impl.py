@@ -1,5 +1,11 @@
 from __future__ import absolute_import
 
+import os
+import tempfile
+
+import dbt.clients.agate_helper
+import dbt.compat
+from dbt.adapters.base.meta import available
 from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.snowflake import SnowflakeConnectionManager
 from dbt.adapters.snowflake import SnowflakeRelation
@@ -11,6 +17,7 @@ class SnowflakeAdapter(SQLAdapter):
     ConnectionManager = SnowflakeConnectionManager
 
     AdapterSpecificConfigs = frozenset({"transient"})
+    CATALOG_BY_SCHEMA = True
 
     @classmethod
     def date_function(cls):
@@ -26,6 +33,37 @@ class SnowflakeAdapter(SQLAdapter):
         return super(SnowflakeAdapter, cls)._catalog_filter_table(lowered,
                                                                   manifest)
 
+    @available
+    def bulk_load_csv_rows(self, relation, agate_table):
+        if not dbt.clients.agate_helper.can_write_csv(agate_table):
+            return None
+
+        fd, path = tempfile.mkstemp(prefix='dbt_seed_', suffix='.csv')
+        os.close(fd)
+        try:
+            dbt.compat.write_file_chunks(
+                path, dbt.clients.agate_helper.csv_chunks(agate_table)
+            )
+            # every table has a stage of its own to load files from
+            stage = '@{}.%{}'.format(
+                relation.include(identifier=False).render(),
+                relation.quote_if(relation.identifier,
+                                  relation.should_quote('identifier'))
+            )
+            self.execute("put 'file://{}' {} auto_compress = true"
+                         .format(path.replace('\\', '/'), stage))
+            sql = (
+                "copy into {} ({}) from {} files = ('{}.gz') "
+                "file_format = (type = csv "
+                "field_optionally_enclosed_by = '\"') purge = true"
+            ).format(relation.render(False),
+                     ', '.join(agate_table.column_names),
+                     stage, os.path.basename(path))
+            self.execute(sql)
+        finally:
+            os.remove(path)
+        return sql
+
     def _make_match_kwargs(self, database, schema, identifier):
         quoting = self.config.quoting
         if identifier is not None and quoting['identifier'] is False:
@@ -2,6 +2,8 @@ from dbt.adapters.base.relation import BaseRelation
 
 
 class SnowflakeRelation(BaseRelation):
+    __slots__ = ()
+
     DEFAULTS = {
         'metadata': {
             'type': 'SnowflakeRelation'
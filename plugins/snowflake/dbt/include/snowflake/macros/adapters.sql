@@ -90,3 +90,25 @@
     alter table {{ from_relation }} rename to {{ to_relation }}
   {%- endcall %}
 {% endmacro %}
+
+
+{% macro snowflake__get_seed_checksum(relation) %}
+  {#-- match the names exactly: with ilike, _ matches any character. Unquoted
+       names are stored upper cased --#}
+  {%- set schema = relation.schema if relation.should_quote('schema') else relation.schema.upper() -%}
+  {%- set identifier = relation.identifier if relation.should_quote('identifier') else relation.identifier.upper() -%}
+  {% call statement('get_seed_checksum', fetch_result=True) %}
+    select comment
+    from {{ relation.information_schema('tables') }}
+    where table_schema = '{{ schema }}'
+      and table_name = '{{ identifier }}'
+  {% endcall %}
+  {% set table = load_result('get_seed_checksum').table %}
+  {{ return(table[0][0] if table | length else none) }}
+{% endmacro %}
+
+{% macro snowflake__persist_seed_checksum(relation, checksum) %}
+  {% call statement('persist_seed_checksum') %}
+    comment on table {{ relation }} is '{{ checksum }}'
+  {% endcall %}
+{% endmacro %}
@@ -0,0 +1,123 @@
+"""Time scheduling synthetic DAGs of no-op nodes through GraphQueue from many
+worker threads, with the current mark_done and the one it replaced.
+
+Run from the repository root with dbt-core on the path, for example:
+
+    python -m test.benchmark.graph_queue --nodes 5000 50000 --threads 32
+
+The previous mark_done scanned every remaining node each time a node
+finished, so on large graphs pass --skip-legacy to time only the current
+queue.
+"""
+import argparse
+import random
+import threading
+import time
+
+import networkx as nx
+
+from dbt.compat import QueueEmpty
+from dbt.linker import GraphQueue
+from dbt.node_types import NodeType
+
+
+class LegacyGraphQueue(GraphQueue):
+    """GraphQueue with the previous implementation of mark_done."""
+    def mark_done(self, node_id):
+        with self.lock:
+            self.in_progress.remove(node_id)
+            self.graph.remove_node(node_id)
+            for node, in_degree in dict(self.graph.in_degree()).items():
+                known = node in self.in_progress or node in self.queued
+                if not known and in_degree == 0:
+                    self._add(node)
+            self.inner.task_done()
+
+
+class FakeNode(object):
+    resource_type = NodeType.Model
+
+    def __init__(self, unique_id):
+        self.unique_id = unique_id
+
+    def get_materialization(self):
+        return 'view'
+
+
+class FakeManifest(object):
+    def __init__(self, graph):
+        self.nodes = {node: FakeNode(node) for node in graph.nodes()}
+
+
+def make_dag(num_nodes, max_parents, window, seed):
+    """Build a random DAG where each node depends on up to max_parents of
+    the `window` nodes before it.
+    """
+    rand = random.Random(seed)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(num_nodes))
+    for node in range(1, num_nodes):
+        low = max(0, node - window)
+        for _ in range(rand.randint(0, max_parents)):
+            graph.add_edge(rand.randrange(low, node), node)
+    return graph
+
+
+def drain(queue, num_nodes, num_threads):
+    """Have num_threads workers take nodes off the queue and immediately
+    mark them done, until every node has been.
+    """
+    done = threading.Event()
+    counter = {'done': 0}
+    counter_lock = threading.Lock()
+
+    def work():
+        while not done.is_set():
+            try:
+                node = queue.get(timeout=0.01)
+            except QueueEmpty:
+                continue
+            queue.mark_done(node.unique_id)
+            with counter_lock:
+                counter['done'] += 1
+                if counter['done'] == num_nodes:
+                    done.set()
+
+    threads = [threading.Thread(target=work) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def time_queue(queue_cls, graph, num_threads):
+    queue = queue_cls(graph.copy(), FakeManifest(graph))
+    start = time.time()
+    drain(queue, len(graph), num_threads)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--nodes', type=int, nargs='+', default=[50000])
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--max-parents', type=int, default=3)
+    parser.add_argument('--window', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args()
+
+    for num_nodes in args.nodes:
+        graph = make_dag(num_nodes, args.max_parents, args.window, args.seed)
+        current = time_queue(GraphQueue, graph, args.threads)
+        line = '{:>7} nodes, {} threads: current {:8.3f}s'.format(
+            num_nodes, args.threads, current
+        )
+        if not args.skip_legacy:
+            legacy = time_queue(LegacyGraphQueue, graph, args.threads)
+            line += ', legacy {:8.3f}s'.format(legacy)
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""Time dbt.context.runtime.generate against a manifest with many macros,
+with lazily bound macros and with the eager binding they replaced.
+
+Run from the repository root with dbt-core and dbt-postgres on the path,
+for example:
+
+    python -m test.benchmark.macro_context --macros 1500 --contexts 1000
+"""
+import argparse
+import time
+
+import mock
+
+import dbt.context.common
+import dbt.context.runtime
+from dbt.adapters.factory import load_plugin, reset_adapters
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.parsed import ParsedMacro, ParsedNode
+from dbt.include.global_project import PACKAGES
+from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
+from dbt.node_types import NodeType
+from dbt.utils import timestring
+
+from test.unit.utils import config_from_parts_or_dicts
+
+
+def _add_macro_map(context, package_name, macro_map):
+    key = package_name
+    if package_name in PACKAGES:
+        key = GLOBAL_PROJECT_NAME
+    if key not in context:
+        context[key] = {}
+
+    context[key].update(macro_map)
+
+
+def legacy_add_macros(context, model, manifest):
+    """The previous implementation of dbt.context.common._add_macros."""
+    macros_to_add = {'global': [], 'local': []}
+
+    for unique_id, macro in manifest.macros.items():
+        if macro.resource_type != NodeType.Macro:
+            continue
+        package_name = macro.package_name
+
+        macro_map = {
+            macro.name: macro.generator(context)
+        }
+
+        _add_macro_map(context, package_name, macro_map)
+
+        if package_name == model.package_name:
+            macros_to_add['local'].append(macro_map)
+        elif package_name in PACKAGES:
+            macros_to_add['global'].append(macro_map)
+
+    unprefixed_macros = macros_to_add['global'] + macros_to_add['local']
+    for macro_map in unprefixed_macros:
+        context.update(macro_map)
+
+    return context
+
+
+def make_config():
+    load_plugin('postgres')
+    return config_from_parts_or_dicts(
+        project={
+            'name': 'root',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': '/usr/src/app',
+        },
+        profile={
+            'outputs': {
+                'test': {
+                    'type': 'postgres',
+                    'host': 'localhost',
+                    'schema': 'analytics',
+                    'user': 'test',
+                    'pass': 'test',
+                    'dbname': 'test',
+                    'port': 1,
+                }
+            },
+            'target': 'test',
+        },
+    )
+
+
+def make_macro(package_name, name):
+    unique_id = 'macro.{}.{}'.format(package_name, name)
+    return unique_id, ParsedMacro(
+        name=name,
+        resource_type=NodeType.Macro,
+        unique_id=unique_id,
+        package_name=package_name,
+        depends_on={'macros': []},
+        original_file_path='macros/{}.sql'.format(name),
+        root_path='/usr/src/app',
+        tags=[],
+        path='macros/{}.sql'.format(name),
+        raw_sql='{{% macro {}() %}}select 1{{% endmacro %}}'.format(name),
+    )
+
+
+def make_manifest(num_macros, num_packages):
+    packages = [GLOBAL_PROJECT_NAME, 'root'] + [
+        'package_{}'.format(idx) for idx in range(num_packages)
+    ]
+    macros = dict(
+        make_macro(packages[idx % len(packages)], 'macro_{}'.format(idx))
+        for idx in range(num_macros)
+    )
+    return Manifest(macros=macros, nodes={}, docs={},
+                    generated_at=timestring(), disabled=[])
+
+
+def make_model():
+    return ParsedNode(
+        alias='model_one',
+        name='model_one',
+        database='dbt',
+        schema='analytics',
+        resource_type=NodeType.Model,
+        unique_id='model.root.model_one',
+        fqn=['root', 'model_one'],
+        empty=False,
+        package_name='root',
+        original_file_path='model_one.sql',
+        root_path='/usr/src/app',
+        refs=[],
+        sources=[],
+        depends_on={'nodes': [], 'macros': []},
+        config={
+            'enabled': True,
+            'materialized': 'view',
+            'persist_docs': {},
+            'post-hook': [],
+            'pre-hook': [],
+            'vars': {},
+            'quoting': {},
+            'column_types': {},
+            'tags': [],
+        },
+        tags=[],
+        path='model_one.sql',
+        raw_sql='select 1',
+        description='',
+        columns={},
+    )
+
+
+def time_generate(model, config, manifest, num_contexts):
+    start = time.time()
+    for _ in range(num_contexts):
+        context = dbt.context.runtime.generate(model, config, manifest)
+        # call one macro, as a typical model would
+        context['macro_1']()
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--macros', type=int, nargs='+', default=[1500])
+    parser.add_argument('--packages', type=int, default=10)
+    parser.add_argument('--contexts', type=int, default=1000)
+    args = parser.parse_args()
+
+    config = make_config()
+    model = make_model()
+    try:
+        for num_macros in args.macros:
+            manifest = make_manifest(num_macros, args.packages)
+            current = time_generate(model, config, manifest, args.contexts)
+            with mock.patch.object(dbt.context.common, '_add_macros',
+                                   legacy_add_macros):
+                legacy = time_generate(model, config, manifest,
+                                       args.contexts)
+            print('{:>6} macros, {} contexts: current {:8.3f}s, '
+                  'legacy {:8.3f}s'.format(num_macros, args.contexts,
+                                           current, legacy))
+    finally:
+        reset_adapters()
+
+
+if __name__ == '__main__':
+    main()
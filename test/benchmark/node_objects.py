@@ -0,0 +1,122 @@
+"""Measure the time to create, copy and compare nodes and relations, and
+the memory held by the nodes of a synthetic manifest.
+
+Run from the repository root with dbt-core on the path, for example:
+
+    python -m test.benchmark.node_objects --models 5000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from dbt.adapters.base.relation import BaseRelation
+from dbt.contracts.graph.compiled import CompiledNode
+from dbt.contracts.graph.parsed import ParsedNode
+from dbt.node_types import NodeType
+
+
+def node_dict(idx):
+    name = 'model_{}'.format(idx)
+    return {
+        'alias': name,
+        'name': name,
+        'database': 'dbt',
+        'schema': 'analytics',
+        'resource_type': NodeType.Model,
+        'unique_id': 'model.root.{}'.format(name),
+        'fqn': ['root', 'staging', name],
+        'empty': False,
+        'package_name': 'root',
+        'original_file_path': 'models/staging/{}.sql'.format(name),
+        'root_path': '/usr/src/app',
+        'refs': [['model_{}'.format(idx - 1)]] if idx else [],
+        'sources': [],
+        'depends_on': {
+            'nodes': ['model.root.model_{}'.format(idx - 1)] if idx else [],
+            'macros': [],
+        },
+        'config': {
+            'enabled': True,
+            'materialized': 'view',
+            'persist_docs': {},
+            'post-hook': [],
+            'pre-hook': [],
+            'vars': {},
+            'quoting': {},
+            'column_types': {},
+            'tags': [],
+        },
+        'tags': [],
+        'path': 'staging/{}.sql'.format(name),
+        'raw_sql': 'select * from {{{{ ref("model_{}") }}}}'.format(idx - 1),
+        'description': 'The {} model'.format(name),
+        'columns': {
+            'id': {'name': 'id', 'description': 'The primary key'},
+        },
+    }
+
+
+def _timed(func, *args):
+    start = time.time()
+    result = func(*args)
+    return time.time() - start, result
+
+
+def make_nodes(dicts):
+    return [ParsedNode(**d) for d in dicts]
+
+
+def compile_nodes(nodes):
+    return [
+        CompiledNode(compiled=True, compiled_sql=n.raw_sql, extra_ctes=[],
+                     extra_ctes_injected=False, injected_sql=None,
+                     wrapped_sql=None, **n.serialize())
+        for n in nodes
+    ]
+
+
+def incorporate_nodes(nodes):
+    return [n.incorporate(description='changed') for n in nodes]
+
+
+def compare_nodes(left, right):
+    return sum(1 for a, b in zip(left, right) if a == b)
+
+
+def make_relations(count):
+    return [
+        BaseRelation.create(database='dbt', schema='analytics',
+                            identifier='model_{}'.format(idx), type='view')
+        for idx in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--models', type=int, default=5000)
+    args = parser.parse_args()
+
+    dicts = [node_dict(idx) for idx in range(args.models)]
+
+    gc.collect()
+    tracemalloc.start()
+    elapsed, nodes = _timed(make_nodes, dicts)
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print('create {} nodes:      {:8.3f}s, {:8.1f} MiB'.format(
+        args.models, elapsed, memory / 2.0 ** 20
+    ))
+
+    for name, func, func_args in (
+            ('compile', compile_nodes, (nodes,)),
+            ('incorporate', incorporate_nodes, (nodes,)),
+            ('compare', compare_nodes, (nodes, list(nodes))),
+            ('create relations', make_relations, (args.models,))):
+        elapsed, _ = _timed(func, *func_args)
+        print('{:<20} {:8.3f}s'.format(name, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""Time NodeSelector on a synthetic project with the selector indexes and
+multi-source traversals, and with the per-node scans they replaced.
+
+Run from the repository root with dbt-core on the path, for example:
+
+    python -m test.benchmark.node_selection --nodes 10000 50000
+
+The previous lookups scanned every node for each selector, so selecting
+many models on large graphs is slow; pass --skip-legacy to time only the
+current selector.
+"""
+import argparse
+import random
+import time
+
+import networkx as nx
+
+from dbt.graph.selector import NodeSelector, get_package_names, \
+    _node_is_match
+from dbt.node_types import NodeType
+
+
+class LegacyNodeSelector(NodeSelector):
+    """NodeSelector with the previous fqn, tag, ephemeral and parent/child
+    lookups.
+    """
+    def get_nodes_by_qualified_name(self, graph, qualified_name_selector):
+        qualified_name = qualified_name_selector.split(".")
+        package_names = get_package_names(graph)
+        for node, real_node in self.parsed_nodes(graph):
+            if _node_is_match(qualified_name, package_names, real_node.fqn):
+                yield node
+
+    def get_nodes_by_tag(self, graph, tag_name):
+        for node, real_node in self.parsed_nodes(graph):
+            if tag_name in real_node.tags:
+                yield node
+
+    def select_children(self, graph, selected, max_depth=None):
+        descendants = set()
+        for node in selected:
+            descendants.update(nx.descendants(graph, node))
+        return descendants
+
+    def select_parents(self, graph, selected, max_depth=None):
+        ancestors = set()
+        for node in selected:
+            ancestors.update(nx.ancestors(graph, node))
+        return ancestors
+
+    def get_ancestor_ephemeral_nodes(self, selected_nodes):
+        node_names = {}
+        for node_id in selected_nodes:
+            if node_id not in self.manifest.nodes:
+                continue
+            node = self.manifest.nodes[node_id]
+            if node.resource_type == NodeType.Source:
+                continue
+            node_names[node_id] = node.name
+
+        include_spec = [
+            '+{}'.format(node_names[node])
+            for node in selected_nodes if node in node_names
+        ]
+        if not include_spec:
+            return set()
+
+        all_ancestors = self.select_nodes(self.linker.graph, include_spec, [])
+
+        res = []
+        for ancestor in all_ancestors:
+            ancestor_node = self.manifest.nodes.get(ancestor, None)
+
+            if ancestor_node and self.is_ephemeral_model(ancestor_node):
+                res.append(ancestor)
+
+        return set(res)
+
+
+class FakeNode(dict):
+    def __init__(self, unique_id, fqn, tags, materialized):
+        super(FakeNode, self).__init__(
+            unique_id=unique_id,
+            resource_type=NodeType.Model,
+            config={'enabled': True, 'materialized': materialized},
+        )
+        self.unique_id = unique_id
+        self.resource_type = NodeType.Model
+        self.package_name = fqn[0]
+        self.name = fqn[-1]
+        self.fqn = fqn
+        self.tags = tags
+
+
+class FakeManifest(object):
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+
+class FakeLinker(object):
+    def __init__(self, graph):
+        self.graph = graph
+
+
+def make_project(num_nodes, num_packages, max_parents, window, seed):
+    """Build a random DAG of models spread across packages and directories,
+    where each model depends on up to max_parents of the `window` models
+    before it and one in ten is ephemeral.
+    """
+    rand = random.Random(seed)
+    graph = nx.DiGraph()
+    nodes = {}
+    unique_ids = []
+    for index in range(num_nodes):
+        package = 'package_{}'.format(index % num_packages)
+        name = 'model_{}'.format(index)
+        fqn = [package, 'dir_{}'.format(index % 20), name]
+        unique_id = 'model.{}.{}'.format(package, name)
+        materialized = 'ephemeral' if rand.random() < 0.1 else 'view'
+        tags = ['tag_{}'.format(index % 50)]
+        nodes[unique_id] = FakeNode(unique_id, fqn, tags, materialized)
+        graph.add_node(unique_id)
+        if index:
+            low = max(0, index - window)
+            for _ in range(rand.randint(1, max_parents)):
+                parent = unique_ids[rand.randrange(low, index)]
+                graph.add_edge(parent, unique_id)
+        unique_ids.append(unique_id)
+    return graph, FakeManifest(nodes)
+
+
+def selections(nodes, seed):
+    rand = random.Random(seed)
+    names = sorted(node.name for node in nodes.values())
+    yield 'one model', [rand.choice(names)]
+    yield '100 models', rand.sample(names, 100)
+    yield 'directory', ['package_0.dir_5.*']
+    yield '5 tags', ['tag:tag_{}'.format(i) for i in range(5)]
+    yield '+tag', ['+tag:tag_0']
+    yield 'tag+', ['tag:tag_0+']
+    yield '@tag', ['@tag:tag_0']
+
+
+def time_select(selector_cls, graph, manifest, include):
+    selector = selector_cls(FakeLinker(graph), manifest)
+    start = time.time()
+    selected = selector.select_nodes(graph, include, [])
+    selected |= selector.get_ancestor_ephemeral_nodes(selected)
+    return time.time() - start, selected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--nodes', type=int, nargs='+',
+                        default=[10000, 50000])
+    parser.add_argument('--packages', type=int, default=5)
+    parser.add_argument('--max-parents', type=int, default=3)
+    parser.add_argument('--window', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args()
+
+    for num_nodes in args.nodes:
+        graph, manifest = make_project(num_nodes, args.packages,
+                                       args.max_parents, args.window,
+                                       args.seed)
+        print('{} nodes, {} edges'.format(len(graph), graph.number_of_edges()))
+        for name, include in selections(manifest.nodes, args.seed):
+            elapsed, selected = time_select(NodeSelector, graph, manifest,
+                                            include)
+            line = '  {:<12} {:>6} selected: current {:8.3f}s'.format(
+                name, len(selected), elapsed
+            )
+            if not args.skip_legacy:
+                legacy_elapsed, legacy_selected = time_select(
+                    LegacyNodeSelector, graph, manifest, include
+                )
+                assert legacy_selected == selected
+                line += ', legacy {:8.3f}s'.format(legacy_elapsed)
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
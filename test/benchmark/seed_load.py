@@ -0,0 +1,150 @@
+"""Time loading a synthetic seed into a local Postgres database with batched
+inserts, the way `basic_load_csv_rows` does, and with `copy ... from stdin`.
+
+Run from the repository root with dbt-core and dbt-postgres on the path and a
+Postgres server to load into, for example:
+
+    python -m test.benchmark.seed_load --rows 1000000 --dbname dbt
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+import dbt.clients.agate_helper
+from dbt.adapters.factory import get_adapter, load_plugin, reset_adapters
+
+from test.unit.utils import config_from_parts_or_dicts
+
+
+COLUMNS = 'id,name,amount,is_active,created_at,signup_date'
+
+
+def write_csv(path, num_rows):
+    rng = random.Random(42)
+    names = ['alice', 'bob', 'carol', 'dan', 'erin', 'frank']
+    with open(path, 'w') as fp:
+        fp.write(COLUMNS + '\n')
+        for idx in range(num_rows):
+            fp.write('{},{},{:.2f},{},2019-{:02d}-{:02d} {:02d}:00:00,'
+                     '2019-01-{:02d}\n'.format(
+                         idx, rng.choice(names), rng.random() * 1000,
+                         rng.choice(['true', 'false']),
+                         rng.randint(1, 12), rng.randint(1, 28),
+                         rng.randint(0, 23), rng.randint(1, 28)))
+
+
+def make_config(args):
+    load_plugin('postgres')
+    return config_from_parts_or_dicts(
+        project={
+            'name': 'root',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': os.getcwd(),
+        },
+        profile={
+            'outputs': {
+                'test': {
+                    'type': 'postgres',
+                    'host': args.host,
+                    'port': args.port,
+                    'user': args.user,
+                    'pass': args.password,
+                    'dbname': args.dbname,
+                    'schema': args.schema,
+                }
+            },
+            'target': 'test',
+        },
+    )
+
+
+def create_table(adapter, relation, table):
+    columns = ', '.join(
+        '{} {}'.format(name, adapter.convert_type(table, idx))
+        for idx, name in enumerate(table.column_names)
+    )
+    adapter.execute('drop table if exists {}'.format(relation))
+    adapter.execute('create table {} ({})'.format(relation, columns))
+
+
+def insert_rows(adapter, relation, table, batch_size=10000):
+    """The statements `basic_load_csv_rows` runs, without the Jinja."""
+    cols_sql = ', '.join(table.column_names)
+    row_sql = '({})'.format(', '.join(['%s'] * len(table.column_names)))
+    rows = table.rows
+    for start in range(0, len(rows), batch_size):
+        chunk = rows[start:start + batch_size]
+        bindings = [value for row in chunk for value in row]
+        sql = 'insert into {} ({}) values {}'.format(
+            relation, cols_sql, ', '.join([row_sql] * len(chunk))
+        )
+        adapter.add_query(sql, bindings=bindings, abridge_sql_log=True)
+
+
+def copy_rows(adapter, relation, table):
+    adapter.bulk_load_csv_rows(relation, table)
+
+
+def time_load(adapter, relation, table, func):
+    create_table(adapter, relation, table)
+    start = time.time()
+    func(adapter, relation, table)
+    adapter.commit_if_has_connection()
+    elapsed = time.time() - start
+    _, result = adapter.execute('select count(*) from {}'.format(relation),
+                                fetch=True)
+    assert result[0][0] == len(table.rows), 'wrong number of rows loaded'
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=5432)
+    parser.add_argument('--user', default='root')
+    parser.add_argument('--password', default='password')
+    parser.add_argument('--dbname', default='dbt')
+    parser.add_argument('--schema', default='dbt_benchmark')
+    parser.add_argument('--skip-inserts', action='store_true',
+                        help='only time the copy path')
+    args = parser.parse_args()
+
+    tempdir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tempdir, 'seed.csv')
+        write_csv(path, args.rows)
+        start = time.time()
+        table = dbt.clients.agate_helper.from_csv(path)
+        print('read {} rows:     {:8.3f}s'.format(args.rows,
+                                                  time.time() - start))
+    finally:
+        shutil.rmtree(tempdir)
+
+    config = make_config(args)
+    adapter = get_adapter(config)
+    try:
+        with adapter.connection_named('seed_benchmark'):
+            adapter.create_schema(args.dbname, args.schema)
+            relation = adapter.Relation.create(
+                database=args.dbname, schema=args.schema,
+                identifier='seed_benchmark', type='table'
+            )
+            loads = [('copy', copy_rows)]
+            if not args.skip_inserts:
+                loads.insert(0, ('insert batches', insert_rows))
+            for name, func in loads:
+                elapsed = time_load(adapter, relation, table, func)
+                print('{:<20} {:8.3f}s'.format(name, elapsed))
+            adapter.drop_relation(relation)
+            adapter.commit_if_has_connection()
+    finally:
+        reset_adapters()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Compare Linker subgraphing against the transitive-closure routine it
+replaced, on synthetic DAGs.
+
+Run from the repository root with dbt-core on the path, for example:
+
+    python -m test.benchmark.subset_graph --nodes 10000 50000
+
+The closure-based routine is O(V*E) in time and memory, so on large graphs
+pass --skip-legacy to time only the current routine.
+"""
+import argparse
+import random
+import time
+
+import networkx as nx
+
+from dbt.linker import _subset_graph
+
+
+def legacy_subset_graph(graph, include_nodes):
+    """The previous implementation of dbt.linker._subset_graph."""
+    new_graph = nx.algorithms.transitive_closure(graph)
+
+    include_nodes = set(include_nodes)
+
+    for node in graph.nodes():
+        if node not in include_nodes:
+            new_graph.remove_node(node)
+    return new_graph
+
+
+def make_dag(num_nodes, max_parents, window, seed):
+    """Build a random DAG where each node depends on up to max_parents of
+    the `window` nodes before it, which gives long, overlapping lineages
+    like a real project.
+    """
+    rand = random.Random(seed)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(num_nodes))
+    for node in range(1, num_nodes):
+        low = max(0, node - window)
+        for _ in range(rand.randint(1, max_parents)):
+            graph.add_edge(rand.randrange(low, node), node)
+    return graph
+
+
+def selections(graph, seed):
+    rand = random.Random(seed)
+    nodes = list(graph.nodes())
+    target = nodes[len(nodes) // 2]
+    yield '+one_model', nx.ancestors(graph, target) | {target}
+    yield 'random 10%', set(rand.sample(nodes, len(nodes) // 10))
+    yield 'all', set(nodes)
+
+
+def _timed(func, *args):
+    start = time.time()
+    result = func(*args)
+    return time.time() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--nodes', type=int, nargs='+',
+                        default=[10000, 50000])
+    parser.add_argument('--max-parents', type=int, default=3)
+    parser.add_argument('--window', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args()
+
+    for num_nodes in args.nodes:
+        graph = make_dag(num_nodes, args.max_parents, args.window, args.seed)
+        print('{} nodes, {} edges'.format(len(graph), graph.number_of_edges()))
+        for name, include in selections(graph, args.seed):
+            elapsed, subset = _timed(_subset_graph, graph, include)
+            line = '  {:<12} {:>6} selected: current {:8.3f}s'.format(
+                name, len(include), elapsed
+            )
+            if not args.skip_legacy:
+                legacy_elapsed, _ = _timed(legacy_subset_graph, graph,
+                                           include)
+                line += ', legacy {:8.3f}s'.format(legacy_elapsed)
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -64,3 +64,41 @@ class TestAgateHelper(unittest.TestCase):
         self.assertEqual(len(tbl), len(EXPECTED))
         for idx, row in enumerate(tbl):
             self.assertEqual(list(row), EXPECTED[idx])
+
+    def test_table_from_rows(self):
+        rows = [(1, '2'), (3, None)]
+        table = agate_helper.table_from_rows(
+            rows, ['a', 'b'], [agate_helper.TEXT, None]
+        )
+        self.assertEqual(table.column_names, ('a', 'b'))
+        self.assertEqual([list(row) for row in table], [['1', 2], ['3', None]])
+
+        table = agate_helper.table_from_rows([], ['a', 'b'])
+        self.assertEqual(table.column_names, ('a', 'b'))
+        self.assertEqual(len(table.rows), 0)
+
+    def test_csv_chunks(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_DATA.encode('utf-8'))
+        tbl = agate_helper.from_csv(path)
+        self.assertTrue(agate_helper.can_write_csv(tbl))
+
+        chunks = list(agate_helper.csv_chunks(tbl, rows_per_chunk=1))
+        self.assertEqual(chunks, [
+            '1,"n","test",3.2,2018-08-06 11:33:29.320000+00:00,true,\n',
+            '2,"y","asdf",900,2018-08-06 11:35:29.320000+00:00,false,'
+            '"a string"\n',
+        ])
+
+    def test_csv_chunks_quoting(self):
+        tbl = agate_helper.table_from_rows([('say "hi"\n', None)], ['a', 'b'],
+                                           [agate_helper.TEXT,
+                                            agate_helper.TEXT])
+        self.assertEqual(list(agate_helper.csv_chunks(tbl)),
+                         ['"say ""hi""\n",\n'])
+
+    def test_can_write_csv_timedelta(self):
+        tbl = agate_helper.table_from_rows([('1 day',)], ['a'],
+                                           [agate_helper.TIMEDELTA])
+        self.assertFalse(agate_helper.can_write_csv(tbl))
@@ -4,7 +4,11 @@ from dbt.adapters.base.relation import BaseRelation
 from multiprocessing.dummy import Pool as ThreadPool
 import dbt.exceptions
 
+import mock
+import os
 import random
+import shutil
+import tempfile
 import time
 
 
@@ -481,3 +485,64 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations('dbt', 'bar')), 1)
         self.assertEqual(len(self.cache.get_relations('dbt_2', 'foo')), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+
+class TestSnapshot(TestCache):
+    def setUp(self):
+        super(TestSnapshot, self).setUp()
+        self.tempdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempdir, 'target', 'cache.pickle')
+        self.cache.add(make_mock_relationship('dbt', 'foo', 'table1'))
+        self.cache.add(make_mock_relationship('dbt', 'foo', 'view1'))
+        self.cache.add(make_mock_relationship('dbt', 'bar', 'view2'))
+        self.cache.add_link(make_relation('dbt', 'foo', 'table1'),
+                            make_relation('dbt', 'foo', 'view1'))
+        self.cache.add_link(make_relation('dbt', 'foo', 'view1'),
+                            make_relation('dbt', 'bar', 'view2'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_save_load(self):
+        self.cache.save(self.path, 'abc')
+        loaded = RelationsCache()
+        self.assertTrue(loaded.load(self.path, 'abc', 60))
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(loaded.dump_graph(), self.cache.dump_graph())
+        self.assertEqual(loaded.schemas, self.cache.schemas)
+
+        # links survive the round trip, so drops still cascade
+        loaded.drop(make_relation('dbt', 'foo', 'table1'))
+        self.assertEqual(len(loaded.relations), 0)
+
+    def test_load_missing(self):
+        self.assertFalse(self.cache.load(self.path, 'abc', 60))
+        self.assertEqual(len(self.cache.relations), 3)
+
+    def test_load_other_fingerprint(self):
+        self.cache.save(self.path, 'abc')
+        loaded = RelationsCache()
+        self.assertFalse(loaded.load(self.path, 'def', 60))
+        self.assertEqual(len(loaded.relations), 0)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_load_expired(self):
+        self.cache.save(self.path, 'abc')
+        loaded = RelationsCache()
+        with mock.patch('time.time', return_value=time.time() + 61):
+            self.assertFalse(loaded.load(self.path, 'abc', 60))
+        self.assertEqual(len(loaded.relations), 0)
+
+    def test_load_corrupt(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'wb') as fp:
+            fp.write(b'not a pickle')
+        self.assertFalse(self.cache.load(self.path, 'abc', 60))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_remove_schemas(self):
+        self.cache.remove_schemas([('DBT', 'Foo')])
+        self.assertEqual(self.cache.schemas, {('dbt', 'bar')})
+        self.assert_relations_exist('dbt', 'bar', 'view2')
+        self.assertEqual(len(self.cache.relations), 1)
+        self.assertEqual(self.cache.dump_graph(), {'dbt.bar.view2': []})
@@ -0,0 +1,157 @@
+from __future__ import unicode_literals
+import os
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+from shutil import rmtree
+from tempfile import mkdtemp
+
+import agate
+import mock
+
+from dbt.clients import agate_helper
+from dbt.clients.columnar import ColumnarTable
+
+
+SAMPLE_ROWS = [
+    ('1', 'n', '2018-08-06', '20180806T11:33:29.320Z', 'true', 'null', '1'),
+    ('2', 'y', '2018-08-07', '', 'False', 'a string', '1.5'),
+    ('2', 'n', '', '20180806T11:35:29.320Z', '', '3', 'x'),
+]
+
+SAMPLE_COLUMNS = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
+
+
+class TestColumnarTable(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.tempdir)
+
+    def assertSameAsAgate(self, table, rows, column_names):
+        expected = agate.Table(rows, column_names,
+                               agate_helper.DEFAULT_TYPE_TESTER)
+        self.assertEqual(table.column_names, expected.column_names)
+        self.assertEqual(
+            [type(t) for t in table.column_types],
+            [type(t) for t in expected.column_types]
+        )
+        self.assertEqual(list(table), [tuple(row) for row in expected])
+
+    def test_from_rows_infers_like_agate(self):
+        table = ColumnarTable.from_rows(SAMPLE_ROWS, SAMPLE_COLUMNS)
+        self.assertSameAsAgate(table, SAMPLE_ROWS, SAMPLE_COLUMNS)
+        self.assertEqual(table.column('a'), (1, 2, 2))
+        self.assertEqual(table.column('c'),
+                         (date(2018, 8, 6), date(2018, 8, 7), None))
+
+    def test_from_rows_python_values(self):
+        rows = [
+            (1, 1.5, True, datetime(2019, 1, 1), 'x', None),
+            (Decimal('2.25'), 2, False, None, '2', None),
+        ]
+        column_names = ['a', 'b', 'c', 'd', 'e', 'f']
+        table = ColumnarTable.from_rows(rows, column_names)
+        self.assertSameAsAgate(table, rows, column_names)
+        self.assertEqual(table.column('a'), (Decimal(1), Decimal('2.25')))
+
+    def test_from_rows_known_types(self):
+        table = ColumnarTable.from_rows([('1', '2')], ['a', 'b'],
+                                        [agate_helper.TEXT, None])
+        self.assertIsInstance(table.column_types[0], agate.Text)
+        self.assertIsInstance(table.column_types[1], agate.Number)
+        self.assertEqual(list(table), [('1', Decimal(2))])
+
+    def test_from_rows_short_and_long(self):
+        table = ColumnarTable.from_rows([('1',), ('2', 'x')], ['a', 'b'])
+        self.assertEqual(list(table), [(1, None), (2, 'x')])
+
+        with self.assertRaises(ValueError):
+            ColumnarTable.from_rows([('1', '2', '3')], ['a', 'b'])
+
+    def test_empty(self):
+        table = ColumnarTable.from_rows([], ['a', 'b'])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(list(table), [])
+        self.assertEqual(len(table.to_agate().rows), 0)
+
+    def test_from_dicts(self):
+        data = [{'a': 1, 'b': 'x', 'c': 'unused'}, {'a': 2}]
+        table = ColumnarTable.from_dicts(data, ['b', 'a'])
+        self.assertEqual(table.column_names, ('b', 'a'))
+        self.assertEqual(list(table), [('x', 1), (None, 2)])
+
+    def test_where_select_rename(self):
+        table = ColumnarTable.from_rows(SAMPLE_ROWS, SAMPLE_COLUMNS)
+        filtered = table.where(lambda row: row['b'] == 'n')
+        self.assertEqual(filtered.column('a'), (1, 2))
+        self.assertEqual(len(table), 3)
+
+        selected = filtered.select(['b', 'a'])
+        self.assertEqual(list(selected), [('n', 1), ('n', 2)])
+        self.assertEqual(selected.column_types,
+                         (table.column_types[1], table.column_types[0]))
+
+        renamed = selected.rename(['B', 'A'])
+        self.assertEqual(list(renamed.to_dicts()),
+                         [{'B': 'n', 'A': 1}, {'B': 'n', 'A': 2}])
+
+    def test_to_and_from_agate(self):
+        table = ColumnarTable.from_rows(SAMPLE_ROWS, SAMPLE_COLUMNS)
+        agate_table = table.to_agate()
+        self.assertEqual(agate_table.column_names, table.column_names)
+        self.assertEqual(agate_table.column_types, table.column_types)
+        self.assertEqual([tuple(row) for row in agate_table], list(table))
+        self.assertEqual(agate_table.rows[0]['b'], 'n')
+        self.assertEqual(list(agate_table.columns['a'].values()), [1, 2, 2])
+        self.assertEqual(agate_table.aggregate(agate.MaxPrecision('a')), 0)
+
+        round_trip = ColumnarTable.from_agate(agate_table)
+        self.assertEqual(list(round_trip), list(table))
+        self.assertEqual(round_trip.column_types, table.column_types)
+
+    def test_table_from_cast_rows(self):
+        table = ColumnarTable.from_rows(SAMPLE_ROWS, SAMPLE_COLUMNS)
+        rows = list(table)
+        # the table agate builds from the rows, casting them again
+        expected = agate.Table(rows, table.column_names, table.column_types)
+
+        def check(agate_table):
+            self.assertEqual(agate_table.column_names, expected.column_names)
+            self.assertEqual(agate_table.column_types, expected.column_types)
+            self.assertEqual([tuple(row) for row in agate_table],
+                             [tuple(row) for row in expected])
+            self.assertEqual([row.keys() for row in agate_table],
+                             [row.keys() for row in expected])
+            self.assertEqual(agate_table.rows[1]['g'], '1.5')
+            self.assertEqual(
+                agate_table.select(['b', 'a']).rows[0].values(), ('n', 1)
+            )
+
+        check(agate_helper.table_from_cast_rows(rows, table.column_names,
+                                                table.column_types))
+
+        # with an agate that has no _is_fork, the public constructor is used
+        def table_without_fork(rows, column_names, column_types, **kwargs):
+            if kwargs:
+                raise TypeError('unexpected keyword arguments')
+            return agate_table_type(rows, column_names, column_types)
+
+        agate_table_type = agate.Table
+        with mock.patch('agate.Table', side_effect=table_without_fork):
+            agate_table = agate_helper.table_from_cast_rows(
+                rows, table.column_names, table.column_types
+            )
+        check(agate_table)
+
+    def test_from_csv(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        contents = '\n'.join(
+            [','.join(SAMPLE_COLUMNS)] + [','.join(r) for r in SAMPLE_ROWS]
+        )
+        with open(path, 'wb') as fp:
+            fp.write((agate_helper.BOM + contents).encode('utf-8'))
+
+        table = ColumnarTable.from_csv(path)
+        self.assertSameAsAgate(table, SAMPLE_ROWS, SAMPLE_COLUMNS)
@@ -0,0 +1,164 @@
+import mock
+import threading
+import unittest
+
+import dbt.flags as flags
+from dbt.adapters.base.connections import ConnectionPool
+from dbt.adapters.postgres import PostgresAdapter
+from dbt.contracts.results import ExecutionResult
+
+from .utils import config_from_parts_or_dicts, inject_adapter
+
+
+def _new_handle(*args, **kwargs):
+    handle = mock.MagicMock()
+    handle.closed = 0
+    return handle
+
+
+class TestConnectionPool(unittest.TestCase):
+    def test_take_and_put(self):
+        pool = ConnectionPool()
+        self.assertIsNone(pool.take())
+        pool.put('conn')
+        self.assertEqual(pool.take(), 'conn')
+        self.assertEqual(pool.stats.acquired, 2)
+        self.assertEqual(pool.stats.reused, 1)
+        self.assertEqual(pool.stats.max_open, 1)
+
+    def test_wait_when_full(self):
+        pool = ConnectionPool(max_size=1)
+        self.assertIsNone(pool.take())
+
+        taken = []
+        waiter = threading.Thread(target=lambda: taken.append(pool.take()))
+        waiter.start()
+        waiter.join(0.1)
+        self.assertTrue(waiter.is_alive())
+
+        pool.put('conn')
+        waiter.join(5)
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(taken, ['conn'])
+        self.assertEqual(pool.stats.waits, 1)
+        self.assertGreater(pool.stats.wait_time, 0)
+
+    def test_evict_idle(self):
+        pool = ConnectionPool(min_size=1, idle_timeout=10)
+        with mock.patch('time.time', return_value=100):
+            pool.take()
+            pool.take()
+            pool.put('old')
+            pool.put('new')
+        with mock.patch('time.time', return_value=105):
+            self.assertEqual(pool.evict_idle(), [])
+        with mock.patch('time.time', return_value=120):
+            # min_size connections are kept however long they're idle
+            self.assertEqual(pool.evict_idle(), ['old'])
+        self.assertEqual(pool.drain(), ['new'])
+        self.assertEqual(pool.stats.evicted, 1)
+
+    def test_forked(self):
+        pool = ConnectionPool()
+        pool.take()
+        pool.put('conn')
+        with mock.patch('os.getpid', return_value=-1):
+            self.assertIsNone(pool.take())
+
+
+class TestPooledConnections(unittest.TestCase):
+    def setUp(self):
+        flags.STRICT_MODE = True
+        project_cfg = {
+            'name': 'X',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': '/tmp/dbt/does-not-exist',
+        }
+        profile_cfg = {
+            'outputs': {
+                'test': {
+                    'type': 'postgres',
+                    'dbname': 'postgres',
+                    'user': 'root',
+                    'host': 'thishostshouldnotexist',
+                    'pass': 'password',
+                    'port': 5432,
+                    'schema': 'public'
+                }
+            },
+            'target': 'test',
+        }
+        self.config = config_from_parts_or_dicts(project_cfg, profile_cfg)
+        self.adapter = PostgresAdapter(self.config)
+        inject_adapter(self.adapter)
+
+    def tearDown(self):
+        flags.reset()
+
+    def acquire_in_thread(self, name):
+        def acquire():
+            with self.adapter.connection_named(name) as conn:
+                handles.append(conn.handle)
+        handles = []
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        thread.join()
+        return handles[0]
+
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_reuse_across_threads(self, psycopg2):
+        psycopg2.connect.side_effect = _new_handle
+        first = self.acquire_in_thread('model_one')
+        second = self.acquire_in_thread('model_two')
+
+        self.assertIs(first, second)
+        psycopg2.connect.assert_called_once()
+        self.assertEqual(self.adapter.connections.thread_connections, {})
+
+        self.adapter.cleanup_connections()
+        first.close.assert_called_once()
+        stats = self.adapter.connections.pool.stats
+        self.assertEqual((stats.opened, stats.reused, stats.closed), (1, 1, 1))
+
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_unhealthy(self, psycopg2):
+        psycopg2.connect.side_effect = _new_handle
+        first = self.acquire_in_thread('model_one')
+        # the server went away while the connection was idle
+        first.closed = 2
+        second = self.acquire_in_thread('model_two')
+
+        self.assertIsNot(first, second)
+        self.assertEqual(psycopg2.connect.call_count, 2)
+        self.assertEqual(self.adapter.connections.pool.stats.unhealthy, 1)
+
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_idle_timeout(self, psycopg2):
+        flags.CONNECTION_IDLE_TIMEOUT = 0
+        adapter = PostgresAdapter(self.config)
+        psycopg2.connect.side_effect = _new_handle
+        with adapter.connection_named('model_one') as conn:
+            first = conn.handle
+        with adapter.connection_named('model_two') as conn:
+            second = conn.handle
+
+        self.assertIsNot(first, second)
+        first.close.assert_called_once()
+        self.assertEqual(adapter.connections.pool.stats.evicted, 1)
+
+    def test_max_size(self):
+        flags.CONNECTION_POOL_MAX = 1
+        adapter = PostgresAdapter(self.config)
+        # each thread and the main thread can hold a connection at once
+        self.assertEqual(adapter.connections.pool.max_size,
+                         self.config.threads + 1)
+
+    def test_execution_result(self):
+        stats = self.adapter.connections.pool.stats.serialize()
+        result = ExecutionResult(results=[], generated_at='2019-01-01',
+                                 elapsed_time=1.0, connection_pool=stats)
+        self.assertEqual(result.serialize()['connection_pool'], stats)
+        result = ExecutionResult(results=[], generated_at='2019-01-01',
+                                 elapsed_time=1.0)
+        self.assertNotIn('connection_pool', result.serialize())
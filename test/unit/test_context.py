@@ -2,7 +2,7 @@ import mock
 import unittest
 
 from dbt.contracts.graph.parsed import ParsedNode
-from dbt.context import parser, runtime
+from dbt.context import common, parser, runtime
 import dbt.exceptions
 from .mock_adapter import adapter_factory
 
@@ -83,6 +83,56 @@ class TestVar(unittest.TestCase):
         self.assertEqual(var('foo'), None)
 
 
+class TestAddMacros(unittest.TestCase):
+    def make_macro(self, package_name, name):
+        macro = mock.MagicMock(resource_type='macro',
+                               package_name=package_name)
+        macro.name = name
+        macro.generator.side_effect = \
+            lambda context: lambda: '{}.{}'.format(package_name, name)
+        return macro
+
+    def setUp(self):
+        self.macros = {
+            'macro.dbt.a': self.make_macro('dbt', 'a'),
+            'macro.dbt.b': self.make_macro('dbt', 'b'),
+            'macro.root.b': self.make_macro('root', 'b'),
+            'macro.other.c': self.make_macro('other', 'c'),
+            'macro.other.b': self.make_macro('other', 'b'),
+        }
+        self.manifest = mock.MagicMock(macros=self.macros)
+
+    def add_macros(self, package_name):
+        model = mock.MagicMock(package_name=package_name)
+        return common._add_macros({}, model, self.manifest)
+
+    def test_precedence(self):
+        context = self.add_macros('root')
+        self.assertEqual(context['a'](), 'dbt.a')
+        # local macros take precedence over global ones
+        self.assertEqual(context['b'](), 'root.b')
+        # other packages' macros need a prefix
+        self.assertNotIn('c', context)
+        self.assertEqual(context['other']['c'](), 'other.c')
+        self.assertEqual(context['other']['b'](), 'other.b')
+        self.assertEqual(context['dbt']['b'](), 'dbt.b')
+        self.assertEqual(sorted(context['root']), ['b'])
+
+        context = self.add_macros('other')
+        self.assertEqual(context['b'](), 'other.b')
+        self.assertEqual(context['c'](), 'other.c')
+
+    def test_macros_bound_lazily(self):
+        context = self.add_macros('root')
+        for macro in self.macros.values():
+            macro.generator.assert_not_called()
+
+        context['b']()
+        context['root']['b']()
+        self.macros['macro.root.b'].generator.assert_called_once_with(context)
+        self.macros['macro.dbt.b'].generator.assert_not_called()
+
+
 class TestParseWrapper(unittest.TestCase):
     def setUp(self):
         self.mock_config = mock.MagicMock()
@@ -1,8 +1,12 @@
 from decimal import Decimal
+import json
+import mock
 import unittest
 import os
 
+import dbt.exceptions
 import dbt.flags
+from dbt.clients.columnar import ColumnarTable
 from dbt.compat import bigint
 from dbt.task import generate
 
@@ -227,3 +231,55 @@ class GenerateTest(unittest.TestCase):
         }
         result = generate.unflatten(columns)
         self.assertEqual(result, expected)
+
+    def _catalog_table(self, rows):
+        column_names = ['table_schema', 'table_name', 'table_type',
+                        'column_name', 'column_index', 'column_type']
+        return ColumnarTable.from_rows(rows, column_names)
+
+    def _mock_manifest(self, matches):
+        manifest = mock.MagicMock()
+        manifest.get_unique_ids_for_schema_and_table.side_effect = \
+            lambda schema, table: matches.get((schema, table), [])
+        return manifest
+
+    def test__iter_catalog_nodes(self):
+        tables = [
+            self._catalog_table([
+                ('foo', 'one', 'table', 'id', 1, 'integer'),
+                ('foo', 'one', 'table', 'name', 2, 'text'),
+                ('foo', 'unused', 'table', 'id', 1, 'integer'),
+            ]),
+            self._catalog_table([
+                ('bar', 'two', 'view', 'id', 1, 'integer'),
+            ]),
+        ]
+        manifest = self._mock_manifest({
+            ('foo', 'one'): ['model.root.one'],
+            ('bar', 'two'): ['model.root.two', 'source.root.x.two'],
+        })
+        result = {
+            unique_id: json.loads(''.join(chunks))
+            for unique_id, chunks in generate.iter_catalog_nodes(tables,
+                                                                 manifest)
+        }
+        self.assertEqual(set(result),
+                         {'model.root.one', 'model.root.two',
+                          'source.root.x.two'})
+        self.assertEqual(set(result['model.root.one']['columns']),
+                         {'id', 'name'})
+        self.assertEqual(result['source.root.x.two']['metadata']['type'],
+                         'view')
+
+    def test__iter_catalog_nodes_ambiguous(self):
+        # the second schema's table matches a node that the first's did
+        tables = [
+            self._catalog_table([('foo', 'one', 'table', 'id', 1, 'int')]),
+            self._catalog_table([('FOO', 'one', 'table', 'id', 1, 'int')]),
+        ]
+        manifest = self._mock_manifest({
+            ('foo', 'one'): ['model.root.one'],
+            ('FOO', 'one'): ['model.root.one'],
+        })
+        with self.assertRaises(dbt.exceptions.CompilationException):
+            list(generate.iter_catalog_nodes(tables, manifest))
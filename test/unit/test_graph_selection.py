@@ -127,13 +127,70 @@ class GraphSelectionTest(BaseGraphSelectionTest):
             set(['m.X.a', 'm.X.c', 'm.Y.f', 'm.X.g'])
         )
 
-    def parse_spec_and_assert(self, spec, parents, children, filter_type, filter_value, childrens_parents):
+    def test__select_parents_with_depth(self):
+        self.run_specs_and_assert(
+            self.package_graph,
+            ['1+Y.d'],
+            [],
+            set(['m.Y.b', 'm.Y.d'])
+        )
+        self.run_specs_and_assert(
+            self.package_graph,
+            ['2+Y.d'],
+            [],
+            set(['m.X.a', 'm.Y.b', 'm.Y.d'])
+        )
+
+    def test__select_children_with_depth(self):
+        self.run_specs_and_assert(
+            self.package_graph,
+            ['X.a+1'],
+            [],
+            set(['m.X.a', 'm.Y.b', 'm.X.c'])
+        )
+        self.run_specs_and_assert(
+            self.package_graph,
+            ['tag:abc+1'],
+            ['tag:abc'],
+            set(['m.Y.d', 'm.X.e', 'm.Y.f', 'm.X.g'])
+        )
+
+    def test__select_from_many_nodes(self):
+        # b is a child of a, so it's reached as well as selected
+        selected = set(['m.X.a', 'm.Y.b', 'm.X.e'])
+        self.assertEqual(
+            self.selector.select_children(self.package_graph, selected),
+            set(['m.Y.b', 'm.X.c', 'm.Y.d', 'm.X.e', 'm.Y.f', 'm.X.g'])
+        )
+        self.assertEqual(
+            self.selector.select_parents(self.package_graph, selected),
+            set(['m.X.a', 'm.Y.b'])
+        )
+        self.assertEqual(
+            self.selector.select_children(self.package_graph, selected, 1),
+            set(['m.Y.b', 'm.X.c', 'm.Y.d', 'm.X.e'])
+        )
+
+    def test__traversals_memoized(self):
+        selected = set(['m.X.c'])
+        first = self.selector.select_children(self.package_graph, selected)
+        second = self.selector.select_children(self.package_graph, selected)
+        self.assertIs(first, second)
+        subgraph = self.package_graph.subgraph(['m.X.c', 'm.Y.f'])
+        self.assertEqual(self.selector.select_children(subgraph, selected),
+                         set(['m.Y.f']))
+
+    def parse_spec_and_assert(self, spec, parents, children, filter_type,
+                              filter_value, childrens_parents,
+                              parents_depth=None, children_depth=None):
         parsed = graph_selector.SelectionCriteria(spec)
         self.assertEqual(parsed.select_parents, parents)
         self.assertEqual(parsed.select_children, children)
         self.assertEqual(parsed.selector_type, filter_type)
         self.assertEqual(parsed.selector_value, filter_value)
         self.assertEqual(parsed.select_childrens_parents, childrens_parents)
+        self.assertEqual(parsed.select_parents_max_depth, parents_depth)
+        self.assertEqual(parsed.select_children_max_depth, children_depth)
 
     def invalid_spec(self, spec):
         with self.assertRaises(dbt.exceptions.RuntimeException):
@@ -173,6 +230,16 @@ class GraphSelectionTest(BaseGraphSelectionTest):
         self.parse_spec_and_assert('@source:a', False, False, 'source', 'a', True)
         self.invalid_spec('@source:a+')
 
+        self.parse_spec_and_assert('2+a', True, False, 'fqn', 'a', False, 2)
+        self.parse_spec_and_assert('a+10', False, True, 'fqn', 'a', False,
+                                   None, 10)
+        self.parse_spec_and_assert('1+a.b+2', True, True, 'fqn', 'a.b',
+                                   False, 1, 2)
+        self.parse_spec_and_assert('3+tag:a+', True, True, 'tag', 'a', False,
+                                   3)
+        self.parse_spec_and_assert('a2+', False, True, 'fqn', 'a2', False)
+        self.invalid_spec('@a+1')
+
     def test__package_name_getter(self):
         found = graph_selector.get_package_names(self.package_graph)
 
@@ -202,3 +269,62 @@ class GraphSelectionTest(BaseGraphSelectionTest):
         self.assert_is_selected_node(('X', 'a'), ('X', 'b'), False)
         self.assert_is_selected_node(('X', 'a'), ('X', 'a', 'b'), False)
         self.assert_is_selected_node(('X', 'a'), ('Y', '*'), False)
+
+    def test__index_matches_node_is_match(self):
+        fqns = [
+            ['X', 'a'], ['X', 'staging', 'a'], ['X', 'staging', 'b', 'c'],
+            ['Y', 'X', 'd'], ['Y', 'staging', 'X'], ['Z', 'e'], ['a'],
+        ]
+        graph = nx.DiGraph()
+        nodes = {}
+        for fqn in fqns:
+            unique_id = 'model.{}.{}'.format(fqn[0], '_'.join(fqn))
+            graph.add_node(unique_id)
+            nodes[unique_id] = mock.MagicMock(fqn=fqn, tags=[])
+        manifest = mock.MagicMock(nodes=nodes)
+        index = graph_selector.SelectorIndex(graph, manifest)
+        package_names = graph_selector.get_package_names(graph)
+
+        selectors = [
+            'a', 'b', 'c', 'd', 'X', 'Y', 'staging', '*', 'X.*', 'X.a',
+            'X.staging', 'X.staging.*', 'staging.a', 'staging.b.c',
+            'staging.X', 'X.d', 'X.staging.c', 'staging.*', 'Y.staging.X',
+            'X.staging.b.c.d', 'nothing', 'nothing.*',
+        ]
+        for selector in selectors:
+            qualified_name = selector.split('.')
+            expected = set(
+                unique_id for unique_id, node in nodes.items()
+                if graph_selector._node_is_match(qualified_name,
+                                                 package_names, node.fqn)
+            )
+            self.assertEqual(
+                index.nodes_by_qualified_name(qualified_name), expected,
+                selector
+            )
+
+    def test__select_in_subgraph(self):
+        subgraph = self.package_graph.subgraph(['m.X.a', 'm.X.c', 'm.Y.d'])
+        self.run_specs_and_assert(subgraph, ['*'], [],
+                                  set(['m.X.a', 'm.X.c', 'm.Y.d']))
+        self.run_specs_and_assert(subgraph, ['tag:abc'], [],
+                                  set(['m.X.a', 'm.X.c']))
+        self.run_specs_and_assert(subgraph, ['b'], [], set())
+
+    def test__ancestor_ephemeral_nodes(self):
+        ephemeral = ('m.X.a', 'm.Y.b', 'm.X.g')
+        for unique_id, node in self.manifest.nodes.items():
+            materialized = 'ephemeral' if unique_id in ephemeral else 'view'
+            node.get.side_effect = {
+                'resource_type': 'model',
+                'config': {'materialized': materialized},
+            }.get
+
+        self.assertEqual(
+            self.selector.get_ancestor_ephemeral_nodes(['m.Y.d', 'm.X.e']),
+            set(['m.X.a', 'm.Y.b'])
+        )
+        self.assertEqual(
+            self.selector.get_ancestor_ephemeral_nodes(['m.X.a']),
+            set()
+        )
@@ -1,6 +1,9 @@
+import copy
+import linecache
 import unittest
 
-from dbt.clients.jinja import get_template
+from dbt.clients.jinja import get_template, get_rendered, get_environment
+from dbt.clients.jinja import CodeCache
 from dbt.clients.jinja import extract_toplevel_blocks
 from dbt.exceptions import CompilationException
 
@@ -13,6 +16,64 @@ class TestJinja(unittest.TestCase):
         mod = template.make_module()
         self.assertEqual(mod.my_dict, {'a': 1})
 
+    def test_environments_are_shared(self):
+        self.assertIs(get_environment(), get_environment())
+        self.assertIs(get_environment({'name': 'a'}, capture_macros=True),
+                      get_environment({'name': 'b'}, capture_macros=True))
+        self.assertIsNot(get_environment(),
+                         get_environment(capture_macros=True))
+
+    def test_compiled_templates_are_reused(self):
+        s = '{{ x }} and {{ y }}'
+        first = get_template(s, {'y': 1})
+        second = get_template(s, {'y': 2})
+        self.assertIsNot(first, second)
+        self.assertIs(first.root_render_func.__code__,
+                      second.root_render_func.__code__)
+        self.assertEqual(first.render(x=0), '0 and 1')
+        self.assertEqual(second.render(x=0), '0 and 2')
+
+    def test_capture_macros_reports_node(self):
+        node = {
+            'name': 'my_model',
+            'package_name': 'root',
+            'root_path': '/tmp',
+            'original_file_path': 'models/my_model.sql',
+        }
+        with self.assertRaises(CompilationException) as exc:
+            get_rendered('{{ f(missing) }}', {'f': copy.deepcopy}, node,
+                         capture_macros=True)
+        self.assertIn("'missing' is undefined", str(exc.exception))
+        self.assertIn('my_model', str(exc.exception))
+
+
+class TestCodeCache(unittest.TestCase):
+    def make_code(self, source):
+        return get_environment().compile(source)
+
+    def test_hits_and_misses(self):
+        cache = CodeCache(maxsize=2)
+        code = self.make_code('a')
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', code)
+        self.assertIs(cache.get('a'), code)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_evicts_least_recently_used(self):
+        cache = CodeCache(maxsize=2)
+        codes = {k: self.make_code('evict ' + k) for k in 'abc'}
+        cache.set('a', codes['a'])
+        cache.set('b', codes['b'])
+        cache.get('a')
+        cache.set('c', codes['c'])
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertIs(cache.get('a'), codes['a'])
+        self.assertIs(cache.get('c'), codes['c'])
+        self.assertNotIn(codes['b'].co_filename, linecache.cache)
+        self.assertIn(codes['a'].co_filename, linecache.cache)
+
 
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
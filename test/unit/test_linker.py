@@ -3,6 +3,7 @@ import os
 import tempfile
 import unittest
 
+import dbt.exceptions
 import dbt.utils
 
 from dbt import linker
@@ -59,6 +60,27 @@ class LinkerTest(unittest.TestCase):
 
         self.assertEqual(len(actual_nodes), len(expected_nodes))
 
+    def test_linker_write_slim_and_full_graph(self):
+        self.linker.dependency('B', 'A')
+        manifest = _mock_manifest('AB')
+        for node in manifest.nodes.values():
+            node.serialize.return_value = {'unique_id': node.unique_id,
+                                           'agate_table': None}
+        (fd, fname) = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            self.linker.write_graph(fname, manifest)
+            slim = linker.from_file(fname).graph
+            self.linker.write_graph(fname, manifest, full=True)
+            full = linker.from_file(fname).graph
+        finally:
+            os.unlink(fname)
+
+        self.assertEqual(list(slim.edges()), [('A', 'B')])
+        self.assertEqual(dict(slim.nodes(data=True)), {'A': {}, 'B': {}})
+        self.assertEqual(list(full.edges()), [('A', 'B')])
+        self.assertEqual(full.nodes['A'], {'unique_id': 'A'})
+
     def assert_would_join(self, queue):
         """test join() without timeout risk"""
         self.assertEqual(queue.inner.unfinished_tasks, 0)
@@ -132,6 +154,29 @@ class LinkerTest(unittest.TestCase):
         self.assert_would_join(queue)
         self.assertTrue(queue.empty())
 
+    def test_linker_waits_for_all_dependencies(self):
+        # D depends on both B and C, which each depend on A
+        for (l, r) in [('B', 'A'), ('C', 'A'), ('D', 'B'), ('D', 'C')]:
+            self.linker.dependency(l, r)
+
+        queue = self.linker.as_graph_queue(_mock_manifest('ABCD'))
+        self.assertEqual(queue.get(block=False).unique_id, 'A')
+        queue.mark_done('A')
+        got = {queue.get(block=False).unique_id,
+               queue.get(block=False).unique_id}
+        self.assertEqual(got, {'B', 'C'})
+        queue.mark_done('B')
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+        self.assertEqual(len(queue), 1)
+        queue.mark_done('C')
+        self.assertEqual(queue.get(block=False).unique_id, 'D')
+        self.assertTrue(queue.empty())
+        queue.mark_done('D')
+        self.assert_would_join(queue)
+        # the graph itself is left as it was
+        self.assertEqual(len(queue.graph), 4)
+
     def test_linker_dependencies_limited_to_some_nodes(self):
         actual_deps = [('A', 'B'), ('B', 'C'), ('C', 'D')]
 
@@ -187,3 +232,145 @@ class LinkerTest(unittest.TestCase):
             self.linker.dependency(l, r)
 
         self.assertIsNone(self.linker.find_cycles())
+
+    def assert_cycle(self, cycle):
+        nodes = cycle.split(' --> ')
+        self.assertEqual(nodes[0], nodes[-1])
+        self.assertEqual(len(set(nodes[:-1])), len(nodes) - 1)
+        for parent, child in zip(nodes, nodes[1:]):
+            self.assertIn(child, self.linker.graph.successors(parent))
+
+    def test__find_cycles__self_loop(self):
+        self.linker.dependency('A', 'B')
+        self.linker.dependency('B', 'B')
+        self.assertEqual(self.linker.find_cycles(), 'B --> B')
+
+    def test__find_cycles__complete_graph(self):
+        # every ordering of every subset of nodes is a cycle, far too many
+        # to enumerate
+        nodes = ['node_{}'.format(i) for i in range(200)]
+        for parent in nodes:
+            for child in nodes:
+                if parent != child:
+                    self.linker.dependency(parent, child)
+        self.assert_cycle(self.linker.find_cycles())
+
+    def test__find_cycles__overlapping_ladder(self):
+        # each rung adds a cycle through every rung before it
+        for i in range(2000):
+            self.linker.dependency('a{}'.format(i), 'a{}'.format(i + 1))
+            self.linker.dependency('b{}'.format(i), 'b{}'.format(i + 1))
+            self.linker.dependency('a{}'.format(i), 'b{}'.format(i + 1))
+            self.linker.dependency('b{}'.format(i), 'a{}'.format(i + 1))
+        self.assertIsNone(self.linker.find_cycles())
+        self.linker.dependency('a2000', 'a0')
+        self.assert_cycle(self.linker.find_cycles())
+
+    def test__find_cycles__long_chain(self):
+        # deeper than the recursion limit
+        for i in range(20000):
+            self.linker.dependency(str(i), str(i + 1))
+        self.assertIsNone(self.linker.find_cycles())
+        self.linker.dependency('20000', '0')
+        cycle = self.linker.find_cycles()
+        self.assert_cycle(cycle)
+        self.assertEqual(len(cycle.split(' --> ')), 20002)
+
+    def _naive_descendant_scores(self, graph, include_in_cost):
+        return {
+            node: -1 * len([
+                d for d in linker.nx.descendants(graph, node)
+                if include_in_cost(d)
+            ])
+            for node in graph.nodes()
+        }
+
+    def test__descendant_scores(self):
+        actual_deps = [
+            ('B', 'A'), ('C', 'A'), ('D', 'B'), ('D', 'C'), ('E', 'D'),
+            ('F', 'C'), ('G', 'F'), ('G', 'E'),
+        ]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+        self.linker.add_node('H')
+
+        graph = self.linker.graph
+        for include_in_cost in (lambda n: True, lambda n: n not in 'CE'):
+            self.assertEqual(
+                linker.descendant_scores(graph, include_in_cost),
+                self._naive_descendant_scores(graph, include_in_cost)
+            )
+
+    def test__critical_path_scores(self):
+        actual_deps = [('B', 'A'), ('C', 'B'), ('D', 'A')]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        graph = self.linker.graph
+        scores = linker.critical_path_scores(graph, lambda n: True)
+        self.assertEqual(scores, {'A': -3, 'B': -2, 'C': -1, 'D': -1})
+
+        # a slow leaf makes its branch the critical path
+        timings = {'D': 10.0}
+        scores = linker.critical_path_scores(graph, lambda n: True, timings)
+        self.assertEqual(scores['A'], -11.0)
+        self.assertLess(scores['D'], scores['B'])
+
+    def test__fanout_scores(self):
+        actual_deps = [('B', 'A'), ('C', 'A'), ('D', 'B')]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        scores = linker.fanout_scores(self.linker.graph, lambda n: n != 'C')
+        self.assertEqual(scores, {'A': -1, 'B': -1, 'C': 0, 'D': 0})
+
+    def test_linker_priority_policy(self):
+        # A has the most descendants, but Z is on a longer critical path
+        actual_deps = [('B', 'A'), ('C', 'A'), ('D', 'A'), ('Y', 'Z')]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        manifest = _mock_manifest('ABCDYZ')
+        queue = self.linker.as_graph_queue(manifest)
+        self.assertEqual(queue.get(block=False).unique_id, 'A')
+
+        queue = self.linker.as_graph_queue(manifest, priority='critical-path',
+                                           timings={'Y': 60.0})
+        self.assertEqual(queue.get(block=False).unique_id, 'Z')
+
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            self.linker.as_graph_queue(manifest, priority='unknown')
+
+    def test__subset_graph(self):
+        # A -> B -> C -> D, A -> E -> D, D -> F
+        actual_deps = [
+            ('B', 'A'), ('C', 'B'), ('D', 'C'), ('E', 'A'), ('D', 'E'),
+            ('F', 'D'),
+        ]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        subset = linker._subset_graph(self.linker.graph, ['A', 'C', 'F'])
+        self.assertEqual(set(subset.nodes()), {'A', 'C', 'F'})
+        # ordering is preserved across removed nodes, and A -> F is implied
+        # by A -> C -> F so it's left out
+        self.assertEqual(set(subset.edges()), {('A', 'C'), ('C', 'F')})
+        # the original graph is untouched
+        self.assertEqual(len(self.linker.graph), 6)
+
+    def test__subset_graph_matches_transitive_closure(self):
+        import random
+        rand = random.Random(1234)
+        graph = linker.nx.DiGraph()
+        graph.add_nodes_from(range(200))
+        for node in range(1, 200):
+            for _ in range(2):
+                graph.add_edge(rand.randrange(node), node)
+        include = rand.sample(range(200), 60)
+
+        subset = linker._subset_graph(graph, include)
+        closure = linker.nx.transitive_closure(graph)
+        for node in include:
+            expected = set(closure.successors(node)) & set(include)
+            got = linker.nx.descendants(subset, node)
+            self.assertEqual(got, expected)
@@ -2,14 +2,20 @@ import unittest
 import mock
 
 import copy
+import json
 import os
+import pickle
+import shutil
+import tempfile
 
+import dbt.exceptions
 import dbt.flags
 from dbt import tracking
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import ParsedNode
 from dbt.contracts.graph.compiled import CompiledNode
-from dbt.utils import timestring
+from dbt.task.runnable import load_manifest
+from dbt.utils import timestring, JSONEncoder
 import freezegun
 
 class ManifestTest(unittest.TestCase):
@@ -271,6 +277,165 @@ class ManifestTest(unittest.TestCase):
         for node in flat_nodes.values():
             self.assertEqual(set(node), expected_keys)
 
+    def test_node_incorporate(self):
+        node = self.nested_nodes['model.root.events']
+        self.assertFalse(hasattr(node, '__dict__'))
+        node.agate_table = mock.sentinel.table
+
+        new = node.incorporate(description='new', config={'tags': ['a']})
+        self.assertIs(type(new), ParsedNode)
+        self.assertEqual(new.description, 'new')
+        self.assertEqual(new.config['tags'], ['a'])
+        self.assertEqual(new.config['materialized'], 'view')
+        self.assertIs(new.agate_table, mock.sentinel.table)
+        # the new node doesn't share any state with the old one
+        new.config['materialized'] = 'table'
+        self.assertEqual(node.config['materialized'], 'view')
+        self.assertEqual(node.description, '')
+        self.assertEqual(node.config['tags'], [])
+        self.assertNotEqual(new, node)
+        self.assertEqual(node.incorporate(), node)
+
+    def test_node_incorporate_validates(self):
+        node = self.nested_nodes['model.root.events']
+        with self.assertRaises(dbt.exceptions.JSONValidationException) as exc:
+            node.incorporate(config={'enabled': 'yes'})
+        self.assertIn("config.enabled.'yes' is not of type 'boolean'",
+                      str(exc.exception))
+        with self.assertRaises(dbt.exceptions.JSONValidationException):
+            node.incorporate(not_a_field=True)
+
+    def test_get_flat_graph(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, macros={}, docs={},
+                            generated_at=timestring(), disabled=[])
+        flat_graph = manifest.get_flat_graph()
+        self.assertEqual(flat_graph, manifest.to_flat_graph())
+        self.assertIs(manifest.get_flat_graph(), flat_graph)
+
+        # replacing a node updates the flat graph in place
+        events = nodes['model.snowplow.events'].incorporate(
+            raw_sql='select 2'
+        )
+        manifest.update_node(events)
+        self.assertIs(manifest.nodes['model.snowplow.events'], events)
+        self.assertIs(manifest.get_flat_graph(), flat_graph)
+        self.assertEqual(
+            flat_graph['nodes']['model.snowplow.events']['raw_sql'],
+            'select 2'
+        )
+
+        # invalidating it rebuilds it
+        manifest.invalidate_flat_graph()
+        rebuilt = manifest.get_flat_graph()
+        self.assertIsNot(rebuilt, flat_graph)
+        self.assertEqual(rebuilt, manifest.to_flat_graph())
+
+        del nodes['model.snowplow.events']
+        self.assertNotIn('model.snowplow.events',
+                         manifest.get_flat_graph()['nodes'])
+
+    def test_get_unique_ids_for_schema_and_table(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, macros={}, docs={},
+                            generated_at=timestring(), disabled=[])
+        self.assertEqual(
+            manifest.get_unique_ids_for_schema_and_table('Analytics',
+                                                         'EVENTS'),
+            ['model.snowplow.events', 'model.root.events']
+        )
+        self.assertEqual(
+            manifest.get_unique_ids_for_schema_and_table('analytics',
+                                                         'missing'),
+            []
+        )
+
+        # renaming a node in place is noticed
+        manifest.update_node(
+            nodes['model.root.events'].incorporate(alias='other')
+        )
+        self.assertEqual(
+            manifest.get_unique_ids_for_schema_and_table('analytics',
+                                                         'events'),
+            ['model.snowplow.events']
+        )
+
+    def test_write_json(self):
+        manifest = Manifest(nodes=copy.copy(self.nested_nodes), macros={},
+                            docs={}, generated_at=timestring(),
+                            disabled=[self.nested_nodes['model.root.sibling']])
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        path = os.path.join(tempdir, 'target', 'manifest.json')
+        manifest.write(path)
+
+        with open(path) as fp:
+            written = fp.read()
+        self.assertEqual(
+            written, json.dumps(manifest.serialize(), cls=JSONEncoder)
+        )
+
+    def test_write_binary(self):
+        manifest = Manifest(nodes=copy.copy(self.nested_nodes), macros={},
+                            docs={}, generated_at=timestring(), disabled=[])
+        manifest.metadata = {'project_id': 'abc', 'user_id': None,
+                             'send_anonymous_usage_stats': False}
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        path = os.path.join(tempdir, 'target', 'manifest.pickle')
+        manifest.write_binary(path)
+
+        loaded = Manifest.read_binary(path)
+        self.assertEqual(loaded.serialize(), manifest.serialize())
+        self.assertEqual(loaded.metadata, manifest.metadata)
+
+        manifest.write_binary(path, fingerprint='abc')
+        Manifest.read_binary(path, fingerprint='abc')
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            Manifest.read_binary(path, fingerprint='def')
+
+        with open(path, 'rb') as fp:
+            data = pickle.load(fp)
+        data['dbt_version'] = '0.0.1'
+        with open(path, 'wb') as fp:
+            pickle.dump(data, fp, pickle.HIGHEST_PROTOCOL)
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            Manifest.read_binary(path)
+
+    @mock.patch('dbt.task.runnable.load_all_projects')
+    @mock.patch('dbt.task.runnable.get_adapter')
+    @mock.patch('dbt.loader._check_manifest')
+    @mock.patch('dbt.loader.GraphLoader.fingerprint')
+    @mock.patch('dbt.loader.GraphLoader.load_all')
+    def test_load_binary_manifest(self, load_all, fingerprint, check,
+                                  get_adapter, load_all_projects):
+        manifest = Manifest(nodes=copy.copy(self.nested_nodes), macros={},
+                            docs={}, generated_at=timestring(), disabled=[])
+        load_all.return_value = manifest
+        fingerprint.return_value = 'abc'
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        config = mock.MagicMock(target_path=tempdir)
+        config.hashed_name.return_value = '098f6bcd4621d373cade4e832627b4f6'
+
+        load_manifest(config, {'binary'})
+        self.assertEqual(load_all.call_count, 1)
+        # the projects are loaded once for the fingerprint and the parse
+        load_all_projects.assert_called_once_with(config)
+        projects = load_all_projects.return_value
+        fingerprint.assert_called_once_with(config, projects)
+        self.assertIs(load_all.call_args[1]['projects'], projects)
+        loaded = load_manifest(config, {'binary', 'json'})
+        self.assertEqual(load_all.call_count, 1)
+        self.assertEqual(loaded.serialize()['nodes'],
+                         manifest.serialize()['nodes'])
+        self.assertTrue(os.path.exists(os.path.join(tempdir,
+                                                    'manifest.json')))
+
+        fingerprint.return_value = 'def'
+        load_manifest(config, {'binary'})
+        self.assertEqual(load_all.call_count, 2)
+
     @mock.patch.object(tracking, 'active_user')
     def test_get_metadata(self, mock_user):
         mock_user.id = 'cfc9500f-dc7f-4c83-9ea7-2c581c1b38cf'
@@ -367,6 +532,65 @@ class ManifestTest(unittest.TestCase):
         resource_fqns = manifest.get_resource_fqns()
         self.assertEqual(resource_fqns, expect)
 
+    def test_find_refable_by_name(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, macros={}, docs={},
+                            generated_at=timestring(), disabled=[])
+        self.assertIs(
+            manifest.find_refable_by_name('events', 'root'),
+            nodes['model.root.events']
+        )
+        self.assertIs(
+            manifest.find_refable_by_name('events', 'snowplow'),
+            nodes['model.snowplow.events']
+        )
+        # without a package, the first match in iteration order wins
+        first = next(n for n in nodes.values() if n.name == 'events')
+        self.assertIs(manifest.find_refable_by_name('events', None), first)
+        self.assertIsNone(manifest.find_refable_by_name('dep', 'snowplow'))
+        self.assertIsNone(manifest.find_refable_by_name('missing', None))
+        self.assertIsNone(
+            manifest.find_source_by_name('events', 'events', None)
+        )
+
+    def test_find_refable_by_name_after_changes(self):
+        nodes = copy.copy(self.nested_nodes)
+        manifest = Manifest(nodes=nodes, macros={}, docs={},
+                            generated_at=timestring(), disabled=[])
+        self.assertIsNone(manifest.find_refable_by_name('new', 'root'))
+
+        new_node = self.nested_nodes['model.root.dep'].incorporate(
+            name='new', alias='new', unique_id='model.root.new',
+            fqn=['root', 'new']
+        )
+        manifest.add_nodes({'model.root.new': new_node})
+        self.assertIs(manifest.find_refable_by_name('new', 'root'), new_node)
+
+        # replacing a node in place is visible immediately
+        replacement = new_node.incorporate()
+        manifest.nodes['model.root.new'] = replacement
+        self.assertIs(
+            manifest.find_refable_by_name('new', None), replacement
+        )
+
+        # and so is adding one without going through add_nodes
+        other = new_node.incorporate(
+            name='other', alias='other', unique_id='model.root.other',
+            fqn=['root', 'other']
+        )
+        manifest.nodes['model.root.other'] = other
+        self.assertIs(manifest.find_refable_by_name('other', 'root'), other)
+
+    def test_find_disabled_by_name(self):
+        disabled = [self.nested_nodes['model.root.dep']]
+        manifest = Manifest(nodes={}, macros={}, docs={},
+                            generated_at=timestring(), disabled=disabled)
+        self.assertIs(manifest.find_disabled_by_name('dep'), disabled[0])
+        self.assertIs(manifest.find_disabled_by_name('dep', 'root'),
+                      disabled[0])
+        self.assertIsNone(manifest.find_disabled_by_name('dep', 'snowplow'))
+        self.assertIsNone(manifest.find_refable_by_name('dep', None))
+
 
 class MixedManifestTest(unittest.TestCase):
     def setUp(self):
@@ -2,11 +2,16 @@ import unittest
 import mock
 
 import os
+import shutil
+import tempfile
 import yaml
 
 import dbt.flags
 import dbt.parser
 from dbt.parser import ModelParser, MacroParser, DataTestParser, SchemaParser, ParserUtils
+from dbt.parser.cache import ParseCache, PARTIAL_PARSE_FILE_NAME, \
+    project_fingerprint, manifest_fingerprint, MANIFEST_FINGERPRINT_PATHS
+from dbt.parser.parallel import ParsePool
 from dbt.parser.source_config import SourceConfig
 from dbt.utils import timestring, deep_merge
 
@@ -2480,3 +2485,157 @@ class ParserTest(BaseParserTest):
             },
             []
         )
+
+
+class ParseCacheTest(BaseParserTest):
+    def setUp(self):
+        super(ParseCacheTest, self).setUp()
+        self.macro_manifest = Manifest(macros={}, nodes={}, docs={},
+                                       generated_at=timestring(), disabled=[])
+        self.tmpdir = tempfile.mkdtemp()
+        self.models_dir = os.path.join(self.tmpdir, 'models')
+        os.makedirs(self.models_dir)
+        self.cache_path = os.path.join(self.tmpdir, 'target',
+                                       PARTIAL_PARSE_FILE_NAME)
+        self.write_model('model_one', 'select * from events')
+        self.write_model('model_two', '{{ config(enabled=False) }} select 1')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+        super(ParseCacheTest, self).tearDown()
+
+    def write_model(self, name, sql):
+        with open(os.path.join(self.models_dir, name + '.sql'), 'w') as fp:
+            fp.write(sql)
+
+    def load_and_parse(self, fingerprint='abc'):
+        cache = ParseCache.load(self.cache_path, fingerprint)
+        parser = ModelParser(self.root_project_config, self.all_projects,
+                             self.macro_manifest, parse_cache=cache)
+        with mock.patch.object(parser, 'parse_sql_nodes',
+                               wraps=parser.parse_sql_nodes) as parse:
+            result = parser.load_and_parse(
+                package_name='root',
+                root_dir=self.tmpdir,
+                relative_dirs=['models'],
+                resource_type=NodeType.Model,
+            )
+        cache.write()
+        return result, parse.call_count
+
+    def test_unchanged_files_are_reused(self):
+        first, first_calls = self.load_and_parse()
+        self.assertEqual(first_calls, 2)
+        self.assertEqual(set(first.parsed), {'model.root.model_one'})
+        self.assertEqual(len(first.disabled), 1)
+
+        second, second_calls = self.load_and_parse()
+        self.assertEqual(second_calls, 0)
+        self.assertEqual(second.parsed, first.parsed)
+        self.assertEqual(second.disabled, first.disabled)
+        # the cache hands out copies
+        self.assertIsNot(second.parsed['model.root.model_one'],
+                         first.parsed['model.root.model_one'])
+
+    def test_changed_file_is_reparsed(self):
+        self.load_and_parse()
+        self.write_model('model_two', 'select 2')
+        result, calls = self.load_and_parse()
+        self.assertEqual(calls, 1)
+        self.assertEqual(set(result.parsed),
+                         {'model.root.model_one', 'model.root.model_two'})
+        self.assertEqual(result.disabled, [])
+
+    def test_fingerprint_change_reparses_everything(self):
+        self.load_and_parse()
+        _, calls = self.load_and_parse(fingerprint='def')
+        self.assertEqual(calls, 2)
+
+    def test_fingerprint(self):
+        macro = mock.MagicMock(raw_sql='{% macro a() %}{% endmacro %}')
+        first = project_fingerprint(self.root_project_config,
+                                    self.all_projects, {'macro.root.a': macro})
+        self.assertEqual(
+            first,
+            project_fingerprint(self.root_project_config, self.all_projects,
+                                {'macro.root.a': macro})
+        )
+        macro.raw_sql = '{% macro a() %}1{% endmacro %}'
+        self.assertNotEqual(
+            first,
+            project_fingerprint(self.root_project_config, self.all_projects,
+                                {'macro.root.a': macro})
+        )
+
+    def test_manifest_fingerprint(self):
+        project = mock.MagicMock(project_root=self.tmpdir)
+        for attr in MANIFEST_FINGERPRINT_PATHS:
+            setattr(project, attr, [])
+        project.source_paths = ['models']
+        project.to_project_config.return_value = {'name': 'root'}
+        projects = {'root': project}
+
+        first = manifest_fingerprint(self.root_project_config, projects)
+        self.assertEqual(
+            first, manifest_fingerprint(self.root_project_config, projects)
+        )
+        self.write_model('model_three', 'select 3')
+        second = manifest_fingerprint(self.root_project_config, projects)
+        self.assertNotEqual(first, second)
+        self.write_model('model_three', 'select 33')
+        self.assertNotEqual(
+            second, manifest_fingerprint(self.root_project_config, projects)
+        )
+
+
+class ParallelParseTest(BaseParserTest):
+    def setUp(self):
+        super(ParallelParseTest, self).setUp()
+        self.macro_manifest = Manifest(macros={}, nodes={}, docs={},
+                                       generated_at=timestring(), disabled=[])
+        self.tmpdir = tempfile.mkdtemp()
+        self.models_dir = os.path.join(self.tmpdir, 'models')
+        os.makedirs(self.models_dir)
+        for idx in range(6):
+            self.write_model('model_{}'.format(idx),
+                             'select * from {{{{ ref("x_{}") }}}}'.format(idx))
+        self.write_model('disabled', '{{ config(enabled=False) }} select 1')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+        super(ParallelParseTest, self).tearDown()
+
+    def write_model(self, name, sql):
+        with open(os.path.join(self.models_dir, name + '.sql'), 'w') as fp:
+            fp.write(sql)
+
+    def load_and_parse(self, parse_pool=None):
+        parser = ModelParser(self.root_project_config, self.all_projects,
+                             self.macro_manifest, parse_pool=parse_pool)
+        return parser.load_and_parse(
+            package_name='root',
+            root_dir=self.tmpdir,
+            relative_dirs=['models'],
+            resource_type=NodeType.Model,
+        )
+
+    def make_pool(self):
+        pool = ParsePool(2, self.root_project_config, self.all_projects,
+                         self.macro_manifest)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_matches_serial_parse(self):
+        serial = self.load_and_parse()
+        parallel = self.load_and_parse(self.make_pool())
+        self.assertEqual(len(parallel.parsed), 6)
+        self.assertEqual(parallel.parsed, serial.parsed)
+        self.assertEqual(parallel.disabled, serial.disabled)
+
+    def test_errors_match_serial_parse(self):
+        self.write_model('model_3', 'select {{ 1 + }}')
+        with self.assertRaises(dbt.exceptions.CompilationException) as serial:
+            self.load_and_parse()
+        with self.assertRaises(dbt.exceptions.CompilationException) as exc:
+            self.load_and_parse(self.make_pool())
+        self.assertEqual(str(exc.exception), str(serial.exception))
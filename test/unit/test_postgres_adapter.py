@@ -1,12 +1,21 @@
 import mock
+import os
+import shutil
+import tempfile
+import threading
 import unittest
 
 import dbt.flags as flags
 
 import dbt.adapters
+import dbt.exceptions
+from dbt.adapters.base.impl import SchemaSearchMap
 from dbt.adapters.postgres import PostgresAdapter
+from dbt.clients import agate_helper
 from dbt.exceptions import ValidationException
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
+from dbt.node_runners import RPCExecuteRunner
+from dbt.task.run import _bounded_max_rows
 from psycopg2 import extensions as psycopg2_extensions
 from psycopg2 import DatabaseError, Error
 import agate
@@ -195,6 +204,146 @@ class TestPostgresAdapter(unittest.TestCase):
             {('dbt', 'foo', 'bar'), ('dbt', 'FOO', 'baz'), ('dbt', 'quux', 'bar')}
         )
 
+    def _cache_schemas(self, schemas):
+        search_map = SchemaSearchMap()
+        for schema in schemas:
+            search_map.add(self.adapter.Relation.create(
+                database='postgres', schema=schema, identifier='x'
+            ))
+        return search_map
+
+    @mock.patch.object(PostgresAdapter, '_link_cached_relations')
+    @mock.patch.object(PostgresAdapter, 'list_relations_without_caching')
+    @mock.patch('dbt.adapters.postgres.connections.psycopg2')
+    def test_set_relations_cache_threaded(self, psycopg2, list_relations,
+                                          link):
+        self.config.threads = 4
+        schemas = ['schema_{}'.format(idx) for idx in range(20)]
+        threads = set()
+
+        def list_one(information_schema, schema):
+            threads.add(threading.current_thread().name)
+            return [self.adapter.Relation.create(
+                database='postgres', schema=schema, identifier='table',
+                type='table'
+            )]
+        list_relations.side_effect = list_one
+
+        with mock.patch.object(self.adapter, '_get_cache_schemas',
+                               return_value=self._cache_schemas(schemas)):
+            with self.adapter.connection_named('master'):
+                self.adapter.set_relations_cache(mock.MagicMock())
+        self.adapter.cleanup_connections()
+
+        self.assertEqual(list_relations.call_count, 20)
+        self.assertNotIn(threading.current_thread().name, threads)
+        self.assertLessEqual(len(threads), 4)
+        self.assertEqual(
+            {r.schema for r in self.adapter.cache.get_relations('postgres',
+                                                                'schema_3')},
+            {'schema_3'}
+        )
+        self.assertEqual(len(self.adapter.cache.relations), 20)
+        self.assertEqual(
+            self.adapter.cache.schemas,
+            {('postgres', s) for s in schemas}
+        )
+
+    @mock.patch.object(PostgresAdapter, '_link_cached_relations')
+    @mock.patch.object(PostgresAdapter, 'list_relations_without_caching')
+    def test_set_relations_cache_from_snapshot(self, list_relations, link):
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        path = os.path.join(tempdir, 'relation_cache.pickle')
+
+        def list_one(information_schema, schema):
+            return [self.adapter.Relation.create(
+                database='postgres', schema=schema, identifier='table',
+                type='table'
+            )]
+        list_relations.side_effect = list_one
+        cache_schemas = self._cache_schemas(['foo', 'bar', 'baz'])
+
+        with mock.patch.object(self.adapter, '_get_cache_schemas',
+                               return_value=cache_schemas):
+            # there is no snapshot yet, so every schema is listed
+            self.adapter.set_relations_cache_from_snapshot(
+                mock.MagicMock(), path, 60, [('postgres', 'foo')]
+            )
+            self.assertEqual(list_relations.call_count, 3)
+            self.adapter.save_relations_cache(path)
+
+            self.adapter.cache.clear()
+            list_relations.reset_mock()
+            self.adapter.set_relations_cache_from_snapshot(
+                mock.MagicMock(), path, 60, [('Postgres', 'FOO')]
+            )
+
+        self.assertEqual(list_relations.call_count, 1)
+        self.assertEqual(list_relations.call_args[0][1], 'foo')
+        self.assertEqual(len(self.adapter.cache.relations), 3)
+        self.assertEqual(
+            self.adapter.cache.schemas,
+            {('postgres', 'foo'), ('postgres', 'bar'), ('postgres', 'baz')}
+        )
+
+    @mock.patch.object(PostgresAdapter, 'list_schemas')
+    def test_list_schemas_in_databases_serial(self, list_schemas):
+        list_schemas.side_effect = lambda db: [db + '_schema']
+        self.assertEqual(
+            self.adapter.list_schemas_in_databases(['a', 'b']),
+            {'a': ['a_schema'], 'b': ['b_schema']}
+        )
+        self.assertEqual(list_schemas.call_count, 2)
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_iter_catalog(self, mock_execute):
+        column_names = ['table_database', 'table_schema', 'table_name']
+
+        def get_catalog(macro_name, kwargs):
+            schema = kwargs['schemas'][0]
+            rows = [('postgres', schema, 'bar'), ('postgres', 'other', 'bar')]
+            return agate.Table(rows=rows, column_names=column_names)
+        mock_execute.side_effect = get_catalog
+
+        mock_manifest = mock.MagicMock()
+        mock_manifest.get_used_schemas.return_value = {('postgres', 'foo'),
+                                                       ('postgres', 'quux')}
+        with mock.patch.object(self.adapter, '_get_cache_schemas',
+                               return_value=self._cache_schemas(
+                                   ['foo', 'quux', 'unused'])):
+            tables = list(self.adapter.iter_catalog(mock_manifest))
+
+        # one query per used schema, each filtered to used schemas
+        self.assertEqual(
+            [c[1]['kwargs']['schemas'] for c in mock_execute.call_args_list],
+            [['foo'], ['quux']]
+        )
+        self.assertEqual(
+            [set(map(tuple, t)) for t in tables],
+            [{('postgres', 'foo', 'bar')}, {('postgres', 'quux', 'bar')}]
+        )
+
+    @mock.patch.object(PostgresAdapter, 'CATALOG_BY_SCHEMA', False)
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_iter_catalog_without_schemas(self, mock_execute):
+        # adapters whose get_catalog doesn't take schemas get one query
+        column_names = ['table_database', 'table_schema', 'table_name']
+        rows = [('postgres', 'foo', 'bar'), ('postgres', 'other', 'bar')]
+        mock_execute.return_value = agate.Table(rows=rows,
+                                                column_names=column_names)
+
+        mock_manifest = mock.MagicMock()
+        mock_manifest.get_used_schemas.return_value = {('postgres', 'foo')}
+        with mock.patch.object(self.adapter, '_get_cache_schemas',
+                               return_value=self._cache_schemas(['foo'])):
+            tables = list(self.adapter.iter_catalog(mock_manifest))
+
+        mock_execute.assert_called_once()
+        self.assertNotIn('schemas', mock_execute.call_args[1]['kwargs'])
+        self.assertEqual([set(map(tuple, t)) for t in tables],
+                         [{('postgres', 'foo', 'bar')}])
+
 
 class TestConnectingPostgresAdapter(unittest.TestCase):
     def setUp(self):
@@ -302,3 +451,100 @@ class TestConnectingPostgresAdapter(unittest.TestCase):
         self.mock_execute.assert_has_calls([
             mock.call('alter table "postgres"."test_schema".table_a rename to table_b', None)
         ])
+
+    def _set_cursor_rows(self, description, rows):
+        self.cursor.description = description
+        rows = iter(rows)
+        self.cursor.fetchmany.side_effect = \
+            lambda size: [row for _, row in zip(range(size), rows)]
+
+    def test_execute_iter_limit(self):
+        self._set_cursor_rows([('id', 23), ('name', 25)],
+                              [(idx, str(idx)) for idx in range(10)])
+        _, result = self.adapter.execute_iter('select 1', limit=3)
+
+        self.assertEqual(result.column_names, ['id', 'name'])
+        self.assertEqual(list(result), [(0, '0'), (1, '1'), (2, '2')])
+        self.assertTrue(result.truncated)
+        # only one more row than the limit was fetched
+        self.cursor.fetchmany.assert_called_once_with(4)
+
+    def test_execute_iter_under_limit(self):
+        self._set_cursor_rows([('id', 23)], [(1,), (2,)])
+        _, result = self.adapter.execute_iter('select 1', limit=3)
+
+        self.assertEqual(list(result), [(1,), (2,)])
+        self.assertFalse(result.truncated)
+
+    def test_rpc_execute_max_rows(self):
+        self._set_cursor_rows([('id', 23)], [(idx,) for idx in range(10)])
+        node = mock.MagicMock(raw_sql='select 1', injected_sql='select 1')
+        runner = RPCExecuteRunner(self.config, self.adapter, node, 1, 1)
+        runner.max_rows = 3
+        with self.adapter.connection_named('rpc'):
+            result = runner.execute(node, mock.MagicMock())
+
+        self.assertEqual(result.table['rows'], [[0], [1], [2]])
+        self.assertTrue(result.table['truncated'])
+        self.assertTrue(result.serialize()['table']['truncated'])
+        self.cursor.fetchmany.assert_called_once_with(4)
+
+    def test_bounded_max_rows(self):
+        self.assertEqual(_bounded_max_rows(None, 100), 100)
+        self.assertEqual(_bounded_max_rows(10, 100), 10)
+        self.assertEqual(_bounded_max_rows(1000, 100), 100)
+        self.assertEqual(_bounded_max_rows(1000, None), 1000)
+        self.assertIsNone(_bounded_max_rows(None, None))
+        for invalid in (-1, 'ten', 1.5, True):
+            with self.assertRaises(dbt.exceptions.RuntimeException):
+                _bounded_max_rows(invalid, 100)
+
+    def test_execute_fetch_known_types(self):
+        # text columns aren't sniffed, unknown types (json here) still are
+        self._set_cursor_rows([('id', 23), ('name', 25), ('data', 114)],
+                              [(1, '10', '1.5'), (2, 'true', '2')])
+        _, table = self.adapter.execute('select 1', fetch=True)
+
+        self.assertEqual(table.column_names, ('id', 'name', 'data'))
+        self.assertIsInstance(table.column_types[0], agate.data_types.Number)
+        self.assertIsInstance(table.column_types[1], agate.data_types.Text)
+        self.assertIsInstance(table.column_types[2], agate.data_types.Number)
+        self.assertEqual([list(row) for row in table],
+                         [[1, '10', 1.5], [2, 'true', 2]])
+
+    def test_execute_no_results(self):
+        self.cursor.description = None
+        _, table = self.adapter.execute('create table x (id int)', fetch=True)
+        self.assertEqual(len(table.rows), 0)
+        self.cursor.fetchmany.assert_not_called()
+
+    def _seed_relation(self):
+        return self.adapter.Relation.create(
+            database='postgres',
+            schema='test_schema',
+            identifier='seed',
+            type='table',
+            quote_policy=self.adapter.config.quoting,
+        )
+
+    def test_bulk_load_csv_rows(self):
+        table = agate_helper.table_from_rows([(1, 'a'), (2, None)],
+                                             ['id', 'name'])
+        copied = []
+        self.cursor.copy_expert.side_effect = \
+            lambda sql, fp, size: copied.append(fp.read())
+
+        sql = self.adapter.bulk_load_csv_rows(self._seed_relation(), table)
+
+        self.assertEqual(
+            sql,
+            'copy "postgres"."test_schema".seed (id, name) from stdin with csv'
+        )
+        self.assertEqual(copied, ['1,"a"\n2,\n'])
+
+    def test_bulk_load_csv_rows_unsupported_type(self):
+        table = agate_helper.table_from_rows([('1 day',)], ['duration'],
+                                             [agate_helper.TIMEDELTA])
+        sql = self.adapter.bulk_load_csv_rows(self._seed_relation(), table)
+        self.assertIsNone(sql)
+        self.cursor.copy_expert.assert_not_called()
@@ -1,3 +1,5 @@
+import threading
+import time
 import unittest
 import mock
 
@@ -6,6 +8,8 @@ import dbt.flags as flags
 import dbt.utils
 
 from dbt.adapters.redshift import RedshiftAdapter
+from dbt.adapters.redshift.connections import CLUSTER_CREDENTIALS
+from dbt.clients import agate_helper
 from dbt.exceptions import ValidationException, FailedToConnectException
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
 
@@ -23,6 +27,7 @@ class TestRedshiftAdapter(unittest.TestCase):
 
     def setUp(self):
         flags.STRICT_MODE = True
+        CLUSTER_CREDENTIALS.clear()
 
         profile_cfg = {
             'outputs': {
@@ -82,6 +87,91 @@ class TestRedshiftAdapter(unittest.TestCase):
         expected_creds = self.config.credentials.incorporate(password='tmp_password')
         self.assertEqual(creds, expected_creds)
 
+    def test_iam_credentials_cached(self):
+        self.config.credentials = self.config.credentials.incorporate(
+            method='iam',
+            cluster_id='my_redshift',
+            iam_duration_seconds=900
+        )
+        fetch = mock.MagicMock(return_value={
+            'DbUser': 'root', 'DbPassword': 'tmp_password'
+        })
+        get_credentials = RedshiftAdapter.ConnectionManager.get_credentials
+        with mock.patch.object(RedshiftAdapter.ConnectionManager,
+                               'fetch_cluster_credentials', new=fetch):
+            with mock.patch('time.time', return_value=1000):
+                creds = get_credentials(self.config.credentials)
+                get_credentials(self.config.credentials)
+            fetch.assert_called_once_with('root', 'redshift', 'my_redshift',
+                                          900)
+            self.assertEqual(creds.password, 'tmp_password')
+
+            # once they've expired, they're fetched again
+            fetch.return_value = {'DbUser': 'root', 'DbPassword': 'new'}
+            with mock.patch('time.time', return_value=1900):
+                creds = get_credentials(self.config.credentials)
+            self.assertEqual(fetch.call_count, 2)
+            self.assertEqual(creds.password, 'new')
+
+    def test_iam_credentials_refresh_ahead(self):
+        fetched = threading.Event()
+
+        def fetch(*args):
+            fetched.set()
+            return {'DbUser': 'root', 'DbPassword': 'new'}
+
+        with mock.patch('time.time', return_value=1000):
+            CLUSTER_CREDENTIALS.get(lambda *a: {'DbPassword': 'old'},
+                                    'root', 'redshift', 'my_redshift', 900)
+        # shortly before they expire, the old credentials are returned while
+        # new ones are fetched in the background
+        with mock.patch('time.time', return_value=1850):
+            creds = CLUSTER_CREDENTIALS.get(fetch, 'root', 'redshift',
+                                            'my_redshift', 900)
+            self.assertEqual(creds['DbPassword'], 'old')
+            self.assertTrue(fetched.wait(5))
+        for _ in range(100):
+            with mock.patch('time.time', return_value=1850):
+                creds = CLUSTER_CREDENTIALS.get(None, 'root', 'redshift',
+                                                'my_redshift', 900)
+            if creds['DbPassword'] == 'new':
+                break
+            time.sleep(0.05)
+        self.assertEqual(creds['DbPassword'], 'new')
+
+    def test_iam_credentials_after_fork(self):
+        with mock.patch('time.time', return_value=1000):
+            CLUSTER_CREDENTIALS.get(lambda *a: {'DbPassword': 'old'},
+                                    'root', 'redshift', 'my_redshift', 900)
+        # as if the process forked while another thread held the lock and
+        # was refreshing the credentials
+        CLUSTER_CREDENTIALS._lock.acquire()
+        for entry in CLUSTER_CREDENTIALS._entries.values():
+            entry.refreshing = True
+
+        fetch = mock.MagicMock(return_value={'DbPassword': 'new'})
+        results = []
+
+        def get():
+            with mock.patch('time.time', return_value=1850):
+                results.append(CLUSTER_CREDENTIALS.get(
+                    fetch, 'root', 'redshift', 'my_redshift', 900
+                ))
+
+        with mock.patch('os.getpid', return_value=-1):
+            thread = threading.Thread(target=get)
+            thread.daemon = True
+            thread.start()
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+        # the copied credentials are used, and refreshed in the child
+        self.assertEqual(results, [{'DbPassword': 'old'}])
+        for _ in range(100):
+            if fetch.called:
+                break
+            time.sleep(0.05)
+        fetch.assert_called_once_with('root', 'redshift', 'my_redshift', 900)
+
     def test_invalid_auth_method(self):
         # we have to set method this way, otherwise it won't validate
         self.config.credentials._contents['method'] = 'badmethod'
@@ -208,3 +298,34 @@ class TestRedshiftAdapter(unittest.TestCase):
             password='password',
             port=5439,
             connect_timeout=10)
+
+    def test_bulk_load_csv_rows(self):
+        table = agate_helper.table_from_rows([(1, 'a'), (2, 'b'), (3, 'c')],
+                                             ['id', 'name'])
+        relation = self.adapter.Relation.create(
+            database='redshift',
+            schema='test_schema',
+            identifier='seed',
+            type='table',
+            quote_policy=self.adapter.config.quoting,
+        )
+        connection = mock_connection('model')
+        cursor = connection.handle.cursor.return_value
+        cursor.mogrify.side_effect = \
+            lambda template, row: "({}, '{}')".format(*row).encode('utf-8')
+
+        prefix = 'insert into "redshift"."test_schema".seed (id, name) values '
+        # room for two rows per statement
+        max_bytes = len(prefix) + 20
+        with mock.patch.object(self.adapter.connections,
+                               'get_thread_connection',
+                               return_value=connection), \
+                mock.patch.object(self.adapter.connections,
+                                  'MAX_INSERT_BYTES', max_bytes):
+            sql = self.adapter.bulk_load_csv_rows(relation, table)
+
+        self.assertEqual(sql, prefix + '...')
+        cursor.execute.assert_has_calls([
+            mock.call((prefix + "(1, 'a'), (2, 'b')").encode('utf-8')),
+            mock.call((prefix + "(3, 'c')").encode('utf-8')),
+        ])
@@ -0,0 +1,126 @@
+from __future__ import unicode_literals
+import os
+import unittest
+from shutil import rmtree
+from tempfile import mkdtemp
+
+import agate
+import mock
+
+import dbt.exceptions
+from dbt.adapters.postgres import PostgresAdapter
+from dbt.clients import agate_helper
+from dbt.clients.seed_table import SeedTable
+
+
+SAMPLE_CSV_DATA = """a,b,c,d,e,f,g
+1,n,test,3.2,20180806T11:33:29.320Z,True,NULL
+2,y,asdf,900,20180806T11:35:29.320Z,False,a string
+3,"quoted, with comma",,12.125,,,"""
+
+
+class TestSeedTable(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = mkdtemp()
+        self.path = os.path.join(self.tempdir, 'seed.csv')
+
+    def tearDown(self):
+        rmtree(self.tempdir)
+
+    def write(self, contents):
+        with open(self.path, 'wb') as fp:
+            fp.write(contents.encode('utf-8'))
+
+    def test_same_as_agate(self):
+        self.write(agate_helper.BOM + SAMPLE_CSV_DATA)
+        expected = agate_helper.from_csv(self.path)
+        table = SeedTable(self.path)
+
+        self.assertEqual(table.column_names, expected.column_names)
+        self.assertEqual(table.column_types, expected.column_types)
+        self.assertEqual(list(table.rows), [tuple(r) for r in expected.rows])
+        self.assertEqual(len(table.rows), 3)
+        self.assertEqual(list(table.columns['a'].values()), [1, 2, 3])
+        self.assertEqual(
+            [PostgresAdapter.convert_type(table, idx)
+             for idx in range(len(table.column_names))],
+            [PostgresAdapter.convert_type(expected, idx)
+             for idx in range(len(expected.column_names))]
+        )
+        self.assertEqual(list(agate_helper.csv_chunks(table)),
+                         list(agate_helper.csv_chunks(expected)))
+
+    def test_sample(self):
+        # the type of b is inferred from the first two rows
+        self.write('a,b\n1,2\n2,3\n3,4.5\n')
+        table = SeedTable(self.path, sample_rows=2)
+        self.assertIsInstance(table.column_types[1], agate.Number)
+        self.assertEqual(len(table.rows), 3)
+        self.assertEqual(table.aggregate(agate.MaxPrecision(1)), 1)
+        self.assertEqual(len(table.sample_table().rows), 2)
+
+    def test_aggregate_from_column_stats(self):
+        self.write(SAMPLE_CSV_DATA + '\n4,\u00e9\u00e9,x,-0.5,,,\n')
+        expected = agate_helper.from_csv(self.path)
+        table = SeedTable(self.path)
+        aggregations = [agate.MaxPrecision('a'), agate.MaxPrecision(3),
+                        agate.MaxLength(1), agate.MaxLength('c'),
+                        agate.HasNulls('c'), agate.HasNulls(0),
+                        agate_helper.MaxByteLength(1)]
+        with mock.patch.object(table, 'iter_rows',
+                               wraps=table.iter_rows) as iter_rows:
+            for aggregation in aggregations:
+                self.assertEqual(table.aggregate(aggregation),
+                                 expected.aggregate(aggregation))
+        # the file is only read once for all the aggregations
+        self.assertEqual(iter_rows.call_count, 1)
+        self.assertEqual(len(table.rows), 4)
+
+    def test_column_values(self):
+        # only the values of the column are cast
+        self.write('a,b\n1,2\n2,3\n3,x\n')
+        table = SeedTable(self.path, sample_rows=2)
+        self.assertEqual(list(table.columns['a'].values()), [1, 2, 3])
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            list(table.columns['b'].values())
+
+    def test_sample_cast_error(self):
+        self.write('a,b\n1,2\n2,3\n3,x\n')
+        table = SeedTable(self.path, sample_rows=2)
+        with self.assertRaises(dbt.exceptions.RuntimeException) as exc:
+            list(table.rows)
+        self.assertIn('row 3', str(exc.exception))
+        self.assertIn('column "b"', str(exc.exception))
+
+    def test_column_overrides(self):
+        self.write('a,b\n1,2019-01-01\n2,\n')
+        table = SeedTable(self.path, column_overrides={'b': 'date'})
+        self.assertIsInstance(table.column_types[0], agate.Number)
+        self.assertIsInstance(table.column_types[1], agate.Text)
+        self.assertEqual(list(table.rows), [(1, '2019-01-01'), (2, None)])
+
+    def test_too_many_values(self):
+        self.write('a,b\n1,2,3\n')
+        with self.assertRaises(ValueError):
+            SeedTable(self.path).read_sample()
+
+        self.write('a,b\n1,2\n1,2,3\n')
+        table = SeedTable(self.path, sample_rows=1)
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            list(table.rows)
+
+    def test_short_rows(self):
+        self.write('a,b\n1\n2,x\n')
+        table = SeedTable(self.path)
+        self.assertEqual(list(table.rows), [(1, None), (2, 'x')])
+
+    def test_checksum(self):
+        self.write('a,b\n1,2\n')
+        checksum = SeedTable(self.path).checksum()
+        self.assertEqual(SeedTable(self.path).checksum(), checksum)
+
+        overridden = SeedTable(self.path, column_overrides={'b': 'text'})
+        self.assertNotEqual(overridden.checksum(), checksum)
+
+        self.write('a,b\n1,3\n')
+        self.assertNotEqual(SeedTable(self.path).checksum(), checksum)
@@ -1,12 +1,14 @@
 from mock import patch
 
 import mock
+import os
 import unittest
 
 import dbt.flags as flags
 
 import dbt.adapters
 from dbt.adapters.snowflake import SnowflakeAdapter
+from dbt.clients import agate_helper
 from dbt.exceptions import ValidationException
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
 from snowflake import connector as snowflake_connector
@@ -241,3 +243,34 @@ class TestSnowflakeAdapter(unittest.TestCase):
                 role=None, schema='public', user='test_user',
                 warehouse='test_warehouse', private_key='test_key')
         ])
+
+    def test_bulk_load_csv_rows(self):
+        table = agate_helper.table_from_rows([(1, 'a')], ['id', 'name'])
+        relation = self.adapter.Relation.create(
+            database='test_database',
+            schema='test_schema',
+            identifier='seed',
+            type='table',
+            quote_policy=self.adapter.config.quoting,
+        )
+        sql = self.adapter.bulk_load_csv_rows(relation, table)
+
+        put_sql, _ = self.mock_execute.call_args_list[-2][0]
+        copy_sql, _ = self.mock_execute.call_args_list[-1][0]
+        self.assertEqual(copy_sql, sql)
+
+        path = put_sql.split("'")[1][len('file://'):]
+        file_name = os.path.basename(path)
+        self.assertTrue(put_sql.endswith(
+            ' @test_database."test_schema".%seed auto_compress = true'
+        ))
+        self.assertEqual(
+            sql,
+            'copy into test_database."test_schema".seed (id, name) '
+            'from @test_database."test_schema".%seed '
+            "files = ('{}.gz') file_format = (type = csv "
+            "field_optionally_enclosed_by = '\"') purge = true"
+            .format(file_name)
+        )
+        # the local file is removed once it's been loaded
+        self.assertFalse(os.path.exists(path))
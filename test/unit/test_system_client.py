@@ -53,6 +53,42 @@ class SystemClient(unittest.TestCase):
         self.assertEqual(self.get_profile_text(), 'NEW_TEXT')
 
 
+class TestWriteFileChunks(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = mkdtemp()
+        self.path = os.path.join(self.tempdir, 'manifest.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def read(self):
+        with open(self.path) as fp:
+            return fp.read()
+
+    def test__replaces_file(self):
+        with open(self.path, 'w') as fp:
+            fp.write('old')
+        os.chmod(self.path, 0o640)
+        dbt.clients.system.write_file_chunks(self.path, ['ne', 'w'])
+        self.assertEqual(self.read(), 'new')
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+        # the temporary file was renamed over the path
+        self.assertEqual(os.listdir(self.tempdir), ['manifest.json'])
+
+    def test__failure_keeps_file(self):
+        with open(self.path, 'w') as fp:
+            fp.write('old')
+
+        def chunks():
+            yield 'new'
+            raise ValueError('failed')
+
+        with self.assertRaises(ValueError):
+            dbt.clients.system.write_file_chunks(self.path, chunks())
+        self.assertEqual(self.read(), 'old')
+        self.assertEqual(os.listdir(self.tempdir), ['manifest.json'])
+
+
 class TestRunCmd(unittest.TestCase):
     """Test `run_cmd`.
 
@@ -14,6 +14,9 @@ class TestDeepMerge(unittest.TestCase):
             {'args': [{}, {'b': 1}, {'a': 1}],
              'expected': {'a': 1, 'b': 1},
              'description': 'three merges'},
+            {'args': [{'a': {'b': [1], 'c': 1}}, {'a': {'b': [2], 'd': 2}}],
+             'expected': {'a': {'b': [2, 1], 'c': 1, 'd': 2}},
+             'description': 'nested dicts and lists'},
         ]
 
         for case in cases:
@@ -23,6 +26,31 @@ class TestDeepMerge(unittest.TestCase):
                 'failed on {} (actual {}, expected {})'.format(
                     case['description'], actual, case['expected']))
 
+    def test__copies_arguments(self):
+        first = {'a': {'b': [1]}}
+        second = {'c': {'d': [2]}}
+        merged = dbt.utils.deep_merge(first, second)
+        merged['a']['b'].append(3)
+        merged['c']['d'].append(3)
+        self.assertEqual(first, {'a': {'b': [1]}})
+        self.assertEqual(second, {'c': {'d': [2]}})
+
+
+class TestCopyJson(unittest.TestCase):
+    def test_copy_json(self):
+        class Other(object):
+            pass
+
+        value = {'a': [1, {'b': 'c'}], 'd': Other(), 'e': (1, [2])}
+        copied = dbt.utils.copy_json(value)
+        self.assertEqual(copied['a'], value['a'])
+        self.assertIsNot(copied['a'], value['a'])
+        self.assertIsNot(copied['a'][1], value['a'][1])
+        self.assertIsInstance(copied['d'], Other)
+        self.assertIsNot(copied['d'], value['d'])
+        self.assertEqual(copied['e'], value['e'])
+        self.assertIsNot(copied['e'][1], value['e'][1])
+
 
 class TestMerge(unittest.TestCase):
 
@@ -139,3 +167,19 @@ class TestDeepMap(unittest.TestCase):
         with self.assertRaises(dbt.exceptions.DbtConfigError):
             dbt.utils.deep_map(lambda x, _: x, {'foo': object()})
 
+
+
+class TestChunkReader(unittest.TestCase):
+    def test_read_sizes(self):
+        chunks = ['abc', '', 'defg', 'h']
+        reader = dbt.utils.ChunkReader(chunks)
+        self.assertEqual(reader.read(2), 'ab')
+        self.assertEqual(reader.read(3), 'cde')
+        self.assertEqual(reader.read(10), 'fgh')
+        self.assertEqual(reader.read(10), '')
+
+    def test_read_all(self):
+        reader = dbt.utils.ChunkReader(iter(['abc', 'def']))
+        self.assertEqual(reader.read(1), 'a')
+        self.assertEqual(reader.read(), 'bcdef')
+        self.assertEqual(reader.read(), '')